@@ -3,7 +3,10 @@
 import streamlit as st
 import time
 from crawlers.naver_crawler import NaverCrawler
+from crawlers.article_cache import ArticleCache
 from services.bookmark_manager import BookmarkManager
+from services.crawl_jobs import CrawlJobManager
+from utils.metrics import get_metrics, METRIC_HELP
 
 # 페이지 기본 설정 (제목, 아이콘 등)
 st.set_page_config(
@@ -12,17 +15,42 @@ st.set_page_config(
     layout="wide"
 )
 
+# --- [공유 자원] 서버 프로세스 전체에서 하나만 만들어 모든 사용자가 같이 씀 ---
+# 세션마다 크롤러를 만들면 커넥션 풀/속도 제한/캐시가 따로 놀아서, 사용자 수만큼 요청이 늘어납니다.
+@st.cache_resource
+def get_crawler() -> NaverCrawler:
+    return NaverCrawler(cache=ArticleCache())
+
+@st.cache_resource
+def get_manager() -> BookmarkManager:
+    return BookmarkManager()
+
+@st.cache_resource
+def get_job_manager() -> CrawlJobManager:
+    return CrawlJobManager(get_crawler())
+
+crawler = get_crawler()
+manager = get_manager()
+jobs = get_job_manager()
+
 # --- [초기화] 세션 상태 관리 (새로고침 해도 데이터 유지) ---
-if 'crawler' not in st.session_state:
-    st.session_state.crawler = NaverCrawler()
-if 'manager' not in st.session_state:
-    st.session_state.manager = BookmarkManager()
 if 'articles' not in st.session_state:
     st.session_state.articles = []
+if 'job_id' not in st.session_state:
+    st.session_state.job_id = None
+
+
+def sort_articles(articles):
+    """네이버 뉴스 + 부제목 있음 -> 네이버 뉴스 + 부제목 없음 -> 그 외 순서"""
+    return sorted(articles, key=lambda x: (
+        0 if (x.url.startswith("https://n.news.naver.com") and x.content) else
+        1 if (x.url.startswith("https://n.news.naver.com") and not x.content) else
+        2
+    ))
 
 # --- 사이드바 메뉴 ---
 st.sidebar.title("🗂️ TiDIED 메뉴")
-menu = st.sidebar.radio("이동할 페이지를 선택하세요:", ["📰 뉴스 수집 (검색)", "💾 북마크 관리"])
+menu = st.sidebar.radio("이동할 페이지를 선택하세요:", ["📰 뉴스 수집 (검색)", "💾 북마크 관리", "📊 진단"])
 
 # =========================================================
 # 1. 뉴스 수집 페이지
@@ -42,36 +70,47 @@ if menu == "📰 뉴스 수집 (검색)":
         search_btn = st.form_submit_button("🚀 뉴스 수집 시작")
 
     # [크롤링 실행 로직]
+    # 수집은 백그라운드 작업(services/crawl_jobs.py)으로 돌고, 화면은 0.5초마다 다시 그려서 진행 상황을 보여줍니다.
+    # 다른 사용자가 같은 검색어/페이지 수로 이미 수집 중이면 그 작업을 같이 봅니다.
     if search_btn and keyword:
-        with st.spinner(f"'{keyword}' 관련 뉴스를 열심히 찾아오고 있습니다..."):
-            # 1. 기사 목록 수집
-            articles = st.session_state.crawler.search(keyword, pages=pages)
-            
-            # 2. 부제목 수집 (진행바 표시)
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            for i, article in enumerate(articles):
-                status_text.text(f"📝 기사 내용 요약 중... ({i+1}/{len(articles)})")
-                content = st.session_state.crawler.get_content(article.url)
-                article.content = content if content else "" # 없으면 빈 문자열
-                progress_bar.progress((i + 1) / len(articles))
-            
-            status_text.empty()
-            progress_bar.empty()
-            
-          
-            # 3. [추가됨] 정렬 로직 (Sorting)       
-            articles.sort(key=lambda x: (
-                0 if (x.url.startswith("https://n.news.naver.com") and x.content) else
-                1 if (x.url.startswith("https://n.news.naver.com") and not x.content) else
-                2
-            ))
-
-            # 세션에 저장 (화면이 리로드돼도 사라지지 않게)
-            st.session_state.articles = articles
-            st.success(f"✅ 총 {len(articles)}개의 기사를 찾았습니다! (중요도 순 정렬 완료)")
-            
+        previous = jobs.get(st.session_state.job_id) if st.session_state.job_id else None
+        if previous is not None:
+            jobs.release(previous)
+        job = jobs.submit(keyword, int(pages))
+        st.session_state.job_id = job.id
+        st.session_state.articles = []
+
+    job = jobs.get(st.session_state.job_id) if st.session_state.job_id else None
+    if job is not None and job.is_running:
+        # '중지'를 누르면 그때까지 찾은 기사만 결과로 남깁니다.
+        if st.button("⏹️ 수집 중지"):
+            jobs.cancel(job)
+            st.session_state.job_id = None
+            st.session_state.articles = sort_articles(job.articles)
+            st.rerun()
+
+        found = list(job.articles)
+        if job.phase == "search":
+            st.info(f"🔎 '{job.keyword}' 관련 뉴스를 찾는 중... ({len(found)}개)")
+        else:
+            st.info(f"📝 기사 내용 요약 중... ({job.content_done}/{len(found)})")
+            st.progress(job.progress())
+        if job.watchers > 1:
+            st.caption(f"👥 같은 검색을 {job.watchers}명이 함께 기다리고 있습니다. (요청은 한 번만 보냄)")
+        st.markdown("\n".join(f"{i+1}. {art.title}" for i, art in enumerate(found)))
+
+        time.sleep(0.5)
+        st.rerun()
+
+    elif job is not None:
+        # 작업이 끝났으면 결과를 이 세션으로 가져오고 작업은 놓아줌 (정렬은 세션별 복사본에)
+        st.session_state.articles = sort_articles(job.articles)
+        st.session_state.job_id = None
+        jobs.release(job)
+        if job.status == job.FAILED:
+            st.error(f"❌ 수집 중 오류가 발생했습니다: {job.error}")
+        else:
+            st.success(f"✅ 총 {len(job.articles)}개의 기사를 찾았습니다! (중요도 순 정렬 완료)")
 
     # [결과 출력 및 저장]
     if st.session_state.articles:
@@ -93,7 +132,7 @@ if menu == "📰 뉴스 수집 (검색)":
                 col1, col2 = st.columns([3, 1])
                 with col1:
                     # 기존 폴더 목록 가져오기
-                    existing_folders = list(st.session_state.manager.load_bookmarks().keys())
+                    existing_folders = list(manager.folder_counts().keys())
                     if not existing_folders:
                         existing_folders = ["스크랩"]
                     
@@ -112,7 +151,7 @@ if menu == "📰 뉴스 수집 (검색)":
             if save_btn:
                 # 선택된 기사 객체들만 추출
                 target_articles = [article_options[key] for key in selected_keys]
-                st.session_state.manager.save_bookmarks(target_articles, folder_name)
+                manager.save_bookmarks(target_articles, folder_name)
                 st.toast(f"✅ '{folder_name}' 폴더에 {len(target_articles)}개 저장 완료!", icon="🎉")
 
         # 기사 목록 카드 형태로 보여주기
@@ -120,6 +159,9 @@ if menu == "📰 뉴스 수집 (검색)":
             with st.container():
                 st.markdown(f"### [{i+1}] {article.title}")
                 st.caption(f"출처: {article.source} | 링크: {article.url}")
+                saved_in = manager.find_url_folders(article.url)
+                if saved_in:
+                    st.caption(f"📌 이미 저장됨: {', '.join(saved_in)}")
                 if article.content:
                     st.info(f"📝 {article.content[:100]}...")
                 st.divider()
@@ -130,21 +172,50 @@ if menu == "📰 뉴스 수집 (검색)":
 elif menu == "💾 북마크 관리":
     st.title("💾 북마크 뷰어")
     
-    # 데이터 로드
-    saved_data = st.session_state.manager.load_bookmarks()
+    # 데이터 로드 (폴더 목록만 먼저, 기사는 선택한 폴더만 - 매니저가 메모리에 캐시해 둠)
+    folder_counts = manager.folder_counts()
     
-    if not saved_data:
+    if not folder_counts:
         st.warning("📂 저장된 북마크가 없습니다. 먼저 뉴스를 수집해 보세요!")
     else:
-        folders = list(saved_data.keys())
+        # [전문 검색] 모든 폴더의 제목/부제목에서 검색
+        query = st.text_input("🔍 저장한 기사 검색", placeholder="예: 반도체")
+        if query:
+            hits = manager.search(query)
+            st.markdown(f"#### 🔍 '{query}' 검색 결과 ({len(hits)}개)")
+            if not hits:
+                st.info("검색 결과가 없습니다.")
+            for hit in hits:
+                st.markdown(f"- **[{hit.folder} #{hit.index + 1}]** [{hit.article.title}]({hit.article.url})")
+            st.divider()
+
+        folders = list(folder_counts.keys())
         selected_folder = st.selectbox("📂 폴더를 선택하세요:", folders)
 
         if selected_folder:
-            articles = saved_data[selected_folder]
-            st.markdown(f"### '{selected_folder}' 폴더 ({len(articles)}개)")
+            # [성능 개선] 기사가 수천 개여도 지금 보는 페이지의 기사만 읽어서 그립니다.
+            col_size, col_page = st.columns([1, 1])
+            with col_size:
+                page_size = st.selectbox("페이지당 기사 수", [20, 50, 100], key="bookmark_page_size")
+            page_count = max(1, -(-folder_counts[selected_folder] // page_size))
+            page_key = f"bookmark_page_{selected_folder}_{page_size}"
+            if st.session_state.get(page_key, 1) > page_count:
+                st.session_state[page_key] = page_count   # 삭제로 페이지가 줄어든 경우
+            with col_page:
+                page_number = st.number_input(
+                    f"페이지 (전체 {page_count})", min_value=1, max_value=page_count, value=1, key=page_key
+                )
+
+            current = manager.load_folder_page(selected_folder, page_number - 1, page_size)
+            articles = current.articles if current else []
+            total = current.total if current else 0
+            offset = current.offset if current else 0
+            st.markdown(
+                f"### '{selected_folder}' 폴더 ({total}개 중 {offset + 1 if articles else 0}~{offset + len(articles)}번)"
+            )
 
-            # 기사 리스트 출력
-            for i, article in enumerate(articles):
+            # 기사 리스트 출력 (번호와 삭제 인덱스는 폴더 전체 기준)
+            for i, article in enumerate(articles, start=offset):
                 with st.expander(f"{i+1}. {article.title}"):
                     st.write(f"**출처**: [{article.source}]({article.url})")
                     if article.content:
@@ -156,9 +227,97 @@ elif menu == "💾 북마크 관리":
                     col_del, col_move = st.columns([1, 3])
                     with col_del:
                         if st.button("🗑️ 삭제", key=f"del_{selected_folder}_{i}"):
-                            st.session_state.manager.delete_article(selected_folder, i)
+                            manager.delete_article(selected_folder, i)
                             st.rerun() # 화면 즉시 새로고침
                     
                     with col_move:
                         # 이동은 UI 복잡도를 낮추기 위해 간단하게 구현
-                        pass
\ No newline at end of file
+                        pass
+
+# =========================================================
+# 3. 진단 페이지 (수집 단계별 시간/횟수)
+# =========================================================
+elif menu == "📊 진단":
+    st.title("📊 수집 진단")
+    st.markdown("이 앱이 실행된 뒤 기록된 요청/파싱/저장 지표입니다. (utils/metrics.py)")
+
+    metrics = get_metrics()
+    snapshot = metrics.snapshot()
+    counters = snapshot["counters"]
+    summaries = snapshot["summaries"]
+
+    def total(name, items=counters, field="value", **labels):
+        return sum(
+            item[field] for item in items
+            if item["name"] == name and all(item["labels"].get(k) == v for k, v in labels.items())
+        )
+
+    # [요약 카드]
+    fetch_count = total("fetch_seconds", summaries, "count")
+    fetch_sum = total("fetch_seconds", summaries, "sum")
+    extraction = {path: total("extraction_total", path=path) for path in ("plan_a", "plan_b", "none")}
+    extracted = sum(extraction.values())
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("HTTP 요청", f"{fetch_count:,}")
+    col2.metric("평균 응답 시간", f"{(fetch_sum / fetch_count * 1000) if fetch_count else 0:.0f} ms")
+    col3.metric("다운로드", f"{total('fetch_bytes', summaries, 'sum') / 1024 / 1024:.2f} MB")
+    col4.metric("부제목 추출 성공률", f"{(100 * (extracted - extraction['none']) / extracted) if extracted else 0:.0f}%")
+
+    if extracted:
+        st.caption(
+            f"추출 경로 - Plan A(클래스): {extraction['plan_a']:.0f} / "
+            f"Plan B(굵은 글씨): {extraction['plan_b']:.0f} / 실패: {extraction['none']:.0f}"
+        )
+
+    # [상세 표]
+    st.subheader("⏱️ 시간/크기 (요약)")
+    if summaries:
+        st.dataframe([
+            {"지표": item["name"], "라벨": ", ".join(f"{k}={v}" for k, v in item["labels"].items()),
+             "횟수": item["count"], "평균": round(item["avg"], 4), "최소": round(item["min"], 4),
+             "최대": round(item["max"], 4), "합계": round(item["sum"], 4)}
+            for item in summaries
+        ], use_container_width=True)
+    else:
+        st.info("아직 기록된 값이 없습니다. 뉴스를 수집해 보세요!")
+
+    st.subheader("🔢 횟수 (카운터)")
+    if counters:
+        st.dataframe([
+            {"지표": item["name"], "라벨": ", ".join(f"{k}={v}" for k, v in item["labels"].items()),
+             "값": item["value"]}
+            for item in counters
+        ], use_container_width=True)
+
+    with st.expander("ℹ️ 지표 설명"):
+        for name, description in METRIC_HELP.items():
+            st.markdown(f"- `{metrics.prefix}_{name}`: {description}")
+
+    # [다른 구성 요소 상태]
+    col_limit, col_cache = st.columns(2)
+    with col_limit:
+        st.subheader("🚦 호스트별 속도 제한")
+        st.json(crawler.rate_limiter.stats())
+    with col_cache:
+        st.subheader("🗄️ 기사 캐시")
+        if crawler.cache:
+            st.json(crawler.cache.stats())
+
+    st.subheader("🔧 제목 클래스 캐시 (자동 복구)")
+    st.json(crawler.selectors.stats())
+
+    st.subheader("🧵 백그라운드 수집 작업")
+    st.json(jobs.stats())
+
+    # [내보내기]
+    st.subheader("📤 내보내기")
+    col_json, col_prom, col_reset = st.columns(3)
+    with col_json:
+        st.download_button("JSON 다운로드", metrics.to_json(), file_name="tidied_metrics.json", mime="application/json")
+    with col_prom:
+        st.download_button("Prometheus 텍스트", metrics.to_prometheus(), file_name="tidied_metrics.prom", mime="text/plain")
+    with col_reset:
+        if st.button("🔄 지표 초기화"):
+            metrics.reset()
+            st.rerun()
@@ -0,0 +1,89 @@
+# benchmarks/bench_article_memory.py
+"""
+[메모리 벤치마크] 기사 N개를 메모리에 들고 있을 때의 비용 비교
+  1. 예전 Article (__dict__ 기반)
+  2. 지금 Article (__slots__ + source 문자열 공유)
+  3. ArticleBatch (열 단위 병렬 배열)
+
+실행: python -m benchmarks.bench_article_memory [기사 수]
+"""
+import sys
+import tracemalloc
+
+from models.article import Article
+from models.article_batch import ArticleBatch
+
+
+class LegacyArticle:
+    """비교용: __slots__를 쓰기 전의 Article과 같은 구조 (속성이 __dict__에 저장됨)"""
+
+    def __init__(self, title, url, source):
+        self._title = title
+        self._url = url
+        self._source = source
+        self._content = None
+
+
+def _sample_rows(count: int):
+    # 실제 크롤링 결과처럼 사이트 이름은 매번 '새 문자열'로 만들어서 넣음 (JSON에서 읽은 값과 같은 상황)
+    for i in range(count):
+        yield (
+            f"삼성전자, 새 반도체 공장 착공…{i}번째 기사 제목",
+            f"https://n.news.naver.com/mnews/article/417/{i:010d}?sid=105",
+            "".join(["Na", "ver"]),
+            f"부제목 {i}: 투자 규모는 수조 원대로 예상",
+        )
+
+
+def _measure(label: str, build, count: int) -> int:
+    rows = list(_sample_rows(count))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    keep = build(rows)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    # 원본 문자열(rows)은 세 방식이 똑같이 공유하므로, '컨테이너 비용'만 비교됨
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print(f"{label:<28} {used / 1024 / 1024:8.2f} MB   ({used / count:6.1f} B/기사)")
+    del keep
+    return used
+
+
+def build_legacy(rows):
+    articles = []
+    for title, url, source, content in rows:
+        article = LegacyArticle(title, url, source)
+        article._content = content
+        articles.append(article)
+    return articles
+
+
+def build_slots(rows):
+    articles = []
+    for title, url, source, content in rows:
+        article = Article(title, url, source)
+        article.content = content
+        articles.append(article)
+    return articles
+
+
+def build_batch(rows):
+    batch = ArticleBatch()
+    for title, url, source, content in rows:
+        batch.titles.append(title)
+        batch.urls.append(url)
+        batch.sources.append(sys.intern(source))
+        batch.contents.append(content)
+    return batch
+
+
+if __name__ == "__main__":
+    COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"기사 {COUNT:,}개 기준 (원본 문자열 제외, 객체/컨테이너 추가 비용)")
+    print("-" * 60)
+    legacy = _measure("Article (예전, __dict__)", build_legacy, COUNT)
+    slots = _measure("Article (__slots__)", build_slots, COUNT)
+    batch = _measure("ArticleBatch (열 단위)", build_batch, COUNT)
+    print("-" * 60)
+    print(f"__slots__ 절감률: {100 * (1 - slots / legacy):.1f}%  /  ArticleBatch 절감률: {100 * (1 - batch / legacy):.1f}%")
@@ -0,0 +1,57 @@
+# benchmarks/bench_bookmark_formats.py
+"""
+[저장 형식 벤치마크] 북마크 N개를 JSON / 바이너리(.tdbk)로 저장하고 읽는 시간 비교
+  - 저장: 전체 데이터를 파일로 쓰기
+  - 전체 읽기: 모든 기사를 Article로 복원 (모든 필드 해석)
+  - 제목만 읽기: 폴더 목록 화면처럼 제목만 필요할 때
+
+실행: python -m benchmarks.bench_bookmark_formats [기사 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from services.bookmark_manager import BookmarkManager
+from services.bookmark_storage import BinaryBookmarkStorage, JsonBookmarkStorage
+
+
+def _sample_data(count: int, folders: int = 10) -> dict[str, list[dict]]:
+    data = {f"폴더{f}": [] for f in range(folders)}
+    for i in range(count):
+        data[f"폴더{i % folders}"].append({
+            "기사 제목": f"삼성전자, 새 반도체 공장 착공…{i}번째 기사 제목",
+            "부제목": f"부제목 {i}: 투자 규모는 수조 원대로 예상되며 국내 협력사 수혜가 기대된다",
+            "출처(링크)": f"https://n.news.naver.com/mnews/article/417/{i:010d}?sid=105",
+            "사이트": "Naver",
+        })
+    return data
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _bench(label: str, storage_cls, path: str, data: dict) -> None:
+    save_ms = _timed(lambda: storage_cls(path)._write_all(data))
+    size = os.path.getsize(path)
+
+    # 매번 새 저장소 객체를 만들어 '파일을 처음 여는' 상황을 측정
+    load_ms = _timed(lambda: BookmarkManager(storage=storage_cls(path)).load_bookmarks())
+    folder = next(iter(data))
+    titles_ms = _timed(lambda: storage_cls(path).load_titles(folder))
+
+    print(f"{label:<14} {size / 1024 / 1024:7.2f} MB  저장 {save_ms:8.1f} ms  "
+          f"전체 읽기 {load_ms:8.1f} ms  제목만 {titles_ms:7.1f} ms")
+
+
+if __name__ == "__main__":
+    COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    data = _sample_data(COUNT)
+    print(f"북마크 {COUNT:,}개 기준")
+    print("-" * 88)
+    with tempfile.TemporaryDirectory() as tmp:
+        _bench("JSON", JsonBookmarkStorage, os.path.join(tmp, "bookmarks.json"), data)
+        _bench("바이너리", BinaryBookmarkStorage, os.path.join(tmp, "bookmarks.tdbk"), data)
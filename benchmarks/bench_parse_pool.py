@@ -0,0 +1,91 @@
+# benchmarks/bench_parse_pool.py
+"""
+[파싱 프로세스 풀 벤치마크] 배치 수집 경로에서 파싱 워커 수에 따른 처리량 비교
+네트워크 대신 저장해 둔 HTML(benchmarks/fixtures/)을 쓰고, 응답 지연은 sleep으로 흉내 냅니다.
+
+  - 요청 스레드(--fetch-workers개)가 '다운로드(지연)' 후 바로 파싱하는 구조는 배치 모드와 같음
+  - 파싱 워커 0 = 지금까지처럼 요청 스레드에서 파싱 (GIL 때문에 CPU 한 개만 사용)
+  - 파싱 워커 N = ParsePool(N)의 프로세스에서 파싱 (결과 튜플/문자열만 돌려받음)
+
+실행: python -m benchmarks.bench_parse_pool [--pages 200] [--latency 0.02] [--workers 0,1,2,4]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from crawlers.naver_crawler import NaverCrawler
+from crawlers.parse_pool import ParsePool
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SEARCH_FIXTURES = ["search_fender.html", "search_news_tit.html"]
+ARTICLE_FIXTURES = ["article_mobile_summary.html", "article_pc_bold.html",
+                    "article_sub_title.html", "article_no_subtitle.html"]
+
+
+def _load_pages(count: int) -> list[tuple[str, bytes]]:
+    """검색 페이지 1 : 기사 페이지 10 비율로 섞은 작업 목록 (배치 수집과 비슷한 비율)"""
+    fixtures = {}
+    for name in SEARCH_FIXTURES + ARTICLE_FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+            fixtures[name] = f.read()
+    pages = []
+    for i in range(count):
+        if i % 11 == 0:
+            name = SEARCH_FIXTURES[(i // 11) % len(SEARCH_FIXTURES)]
+            pages.append(("search", fixtures[name]))
+        else:
+            name = ARTICLE_FIXTURES[i % len(ARTICLE_FIXTURES)]
+            pages.append(("article", fixtures[name]))
+    return pages
+
+
+def _run(pages: list[tuple[str, bytes]], parse_workers: int, fetch_workers: int, latency: float) -> tuple[float, list]:
+    """(걸린 시간 초, 결과 목록)을 반환합니다. 프로세스 시작 비용은 측정에서 뺍니다."""
+    with ParsePool(parse_workers) as pool:
+        # 워커 프로세스를 미리 띄워 둠 (첫 요청에서 import 하는 시간 제외)
+        for _ in range(parse_workers):
+            pool.parse_article(b"", "utf-8")
+
+        def task(page: tuple[str, bytes]):
+            kind, body = page
+            time.sleep(latency)    # 다운로드 대기 (GIL을 놓음)
+            if kind == "search":
+                return pool.parse_search(body.decode("utf-8"), NaverCrawler.NEWS_TITLE_CLASS, set())[:2]
+            return pool.parse_article(body, "utf-8")
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            results = list(executor.map(task, pages))
+        return time.perf_counter() - started, results
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({0, 1, 2, 4, cpus})
+    parser = argparse.ArgumentParser(description="파싱 워커 수에 따른 배치 수집 처리량 비교")
+    parser.add_argument("--pages", type=int, default=200, help="처리할 페이지 수 (기본 200)")
+    parser.add_argument("--latency", type=float, default=0.02, help="페이지당 흉내 낼 응답 지연 초 (기본 0.02)")
+    parser.add_argument("--fetch-workers", type=int, default=16, help="요청 스레드 수 (기본 16)")
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)),
+                        help="비교할 파싱 워커 수 목록 (쉼표로 구분, 0 = 요청 스레드에서 파싱)")
+    args = parser.parse_args()
+
+    pages = _load_pages(args.pages)
+    worker_counts = [int(w) for w in args.workers.split(",")]
+    print(f"페이지 {len(pages)}개, 응답 지연 {args.latency * 1000:.0f}ms, 요청 스레드 {args.fetch_workers}개, CPU {cpus}개\n")
+    print(f"{'파싱 워커':>8} | {'시간':>8} | {'페이지/초':>9} | {'배율':>5} | 결과")
+    print("-" * 52)
+
+    baseline_time, baseline_results = None, None
+    for workers in worker_counts:
+        elapsed, results = _run(pages, workers, args.fetch_workers, args.latency)
+        if baseline_time is None:
+            baseline_time, baseline_results = elapsed, results
+        same = "OK" if results == baseline_results else "DIFF"
+        label = "스레드" if workers == 0 else str(workers)
+        print(f"{label:>8} | {elapsed:7.2f}s | {len(pages) / elapsed:9.1f} | {baseline_time / elapsed:4.2f}x | {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# benchmarks/bench_parsers.py
+"""
+[파서 벤치마크] 네트워크 없이, 저장해 둔 HTML(benchmarks/fixtures/)로 파싱 비용을 측정합니다.
+  - 검색 결과 페이지: parse_search_results (NEWS_TITLE_CLASS 구조 / news_tit 구조 / 결과 없음)
+    + 추출 단계만 따로: 같은 soup에서 기존 추출(extract:legacy)과 한 번 훑기 추출기(extract:single) 비교
+  - 기사 페이지: extract_subtitle Plan A/Plan B (모바일 요약, PC 굵은 글씨, sub_title, 부제목 없음)
+
+페이지마다 파싱 시간(중앙값), 메모리 할당량(tracemalloc), 정답(expected.json)과 일치하는지를
+파서 종류(html.parser / lxml / html5lib, 기사 페이지는 빠른 추출 모드 포함)별로 보여줍니다.
+결과는 benchmarks/results/<이름>.json으로 저장되므로, 버전끼리 비교해서 느려진 곳을 찾을 수 있습니다.
+
+실행:
+  python -m benchmarks.bench_parsers                           # 측정 + results/<커밋>.json 저장
+  python -m benchmarks.bench_parsers --compare benchmarks/results/baseline.json
+  python -m benchmarks.bench_parsers --record 삼성전자          # 실제 네이버 페이지를 새 fixture로 저장
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import bs4
+
+from crawlers.naver_parser import (
+    SEARCH_URL, build_search_params, parse_search_results, extract_subtitle, extract_subtitle_fast,
+    extract_search_results_legacy
+)
+from crawlers.search_extractor import get_extractor
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BASE_DIR, "fixtures")
+RESULT_DIR = os.path.join(BASE_DIR, "results")
+EXPECTED_PATH = os.path.join(FIXTURE_DIR, "expected.json")
+
+# 이 비율 이상 느려지면 비교 결과에 '느려짐'으로 표시
+REGRESSION_THRESHOLD = 0.10
+
+
+def available_parsers() -> list[str]:
+    """설치된 BeautifulSoup 파서만 골라 줍니다. (html5lib은 선택 설치)"""
+    parsers = ["html.parser"]
+    for name in ("lxml", "html5lib"):
+        if importlib.util.find_spec(name) is not None:
+            parsers.append(name)
+    return parsers
+
+
+def _measure(fn, repeat: int) -> tuple[float, int, int, object]:
+    """(중앙값 ms, 할당 최대치 bytes, 할당 블록 수, 결과)를 반환합니다."""
+    result = fn()    # 첫 실행(워밍업) 결과로 정답 확인
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    fn()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return statistics.median(times), peak, blocks, result
+
+
+def _read(name: str) -> bytes:
+    with open(os.path.join(FIXTURE_DIR, name), "rb") as f:
+        return f.read()
+
+
+def run(repeat: int) -> list[dict]:
+    with open(EXPECTED_PATH, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+    parsers = available_parsers()
+    rows = []
+
+    for name, answer in expected["search"].items():
+        html = _read(name).decode("utf-8")
+        for parser in parsers:
+            def fn(html=html, parser=parser, title_class=answer["title_class"]):
+                return parse_search_results(html, title_class, set(), parser)
+            ms, peak, blocks, (detected, articles) = _measure(fn, repeat)
+            ok = detected == answer["detected"] and [[a.title, a.url] for a in articles] == answer["articles"]
+            rows.append({"page": name, "parser": parser, "ms": ms, "peak_bytes": peak,
+                         "blocks": blocks, "size": len(html.encode("utf-8")), "ok": ok})
+
+        # 파싱(soup 만들기)은 빼고 추출 단계만 측정 - 두 추출기는 같은 soup를 받음
+        soup = bs4.BeautifulSoup(html, "html.parser")
+        extractors = [
+            ("extract:legacy", lambda soup=soup, c=answer["title_class"]: extract_search_results_legacy(soup, c, set())),
+            ("extract:single", lambda soup=soup, c=answer["title_class"]: get_extractor(c).extract(soup, set())),
+        ]
+        for label, fn in extractors:
+            ms, peak, blocks, (detected, articles, _) = _measure(fn, repeat)
+            ok = detected == answer["detected"] and [[a.title, a.url] for a in articles] == answer["articles"]
+            rows.append({"page": name, "parser": label, "ms": ms, "peak_bytes": peak,
+                         "blocks": blocks, "size": len(html.encode("utf-8")), "ok": ok})
+
+    for name, answer in expected["article"].items():
+        body = _read(name)
+        html = body.decode("utf-8")
+        cases = [(parser, lambda html=html, parser=parser: extract_subtitle(html, parser)) for parser in parsers]
+        cases.append(("fast", lambda body=body: extract_subtitle_fast(body)))
+        for parser, fn in cases:
+            ms, peak, blocks, subtitle = _measure(fn, repeat)
+            rows.append({"page": name, "parser": parser, "ms": ms, "peak_bytes": peak,
+                         "blocks": blocks, "size": len(body), "ok": subtitle == answer})
+    return rows
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "local"
+
+
+def save(rows: list[dict], label: str) -> str:
+    os.makedirs(RESULT_DIR, exist_ok=True)
+    path = os.path.join(RESULT_DIR, f"{label}.json")
+    report = {
+        "label": label,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "bs4": bs4.__version__,
+        "rows": rows,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=4)
+    return path
+
+
+def print_table(rows: list[dict], previous: dict | None = None) -> None:
+    baseline = {(r["page"], r["parser"]): r for r in previous["rows"]} if previous else {}
+    header = f"{'페이지':<28} {'파서':<14} {'시간(ms)':>9} {'최대할당(KB)':>12} {'블록':>8} {'정답':>4}"
+    if previous:
+        header += f"  {'이전 대비':>9}"
+    print(header)
+    print("-" * 100)
+    for r in rows:
+        line = (f"{r['page']:<28} {r['parser']:<14} {r['ms']:9.2f} {r['peak_bytes'] / 1024:12.1f} "
+                f"{r['blocks']:8d} {'OK' if r['ok'] else 'FAIL':>4}")
+        old = baseline.get((r["page"], r["parser"]))
+        if old:
+            change = r["ms"] / old["ms"] - 1 if old["ms"] else 0.0
+            mark = "  ⚠️ 느려짐" if change > REGRESSION_THRESHOLD else ""
+            line += f"  {change * 100:+8.1f}%{mark}"
+        print(line)
+
+
+def record(keyword: str) -> None:
+    """
+    실제 네이버 검색 결과 1페이지와 첫 기사 페이지를 fixture로 저장하고,
+    '지금 파서의 결과'를 정답(expected.json)에 스냅샷으로 기록합니다. (정답은 직접 한 번 확인할 것)
+    """
+    from crawlers.naver_crawler import NaverCrawler
+
+    crawler = NaverCrawler()
+    stamp = time.strftime("%Y%m%d")
+    with open(EXPECTED_PATH, "r", encoding="utf-8") as f:
+        expected = json.load(f)
+
+    response = crawler._get(SEARCH_URL, params=build_search_params(keyword, 0), timeout=10)
+    response.raise_for_status()
+    search_name = f"recorded_search_{stamp}.html"
+    with open(os.path.join(FIXTURE_DIR, search_name), "wb") as f:
+        f.write(response.content)
+    html = response.content.decode("utf-8", errors="replace")
+    detected, articles = parse_search_results(html, NaverCrawler.NEWS_TITLE_CLASS, set())
+    expected["search"][search_name] = {
+        "title_class": NaverCrawler.NEWS_TITLE_CLASS, "detected": detected,
+        "articles": [[a.title, a.url] for a in articles],
+    }
+    print(f"💾 {search_name}: 제목 태그 {detected}개, 기사 {len(articles)}개")
+
+    if articles:
+        response = crawler._get(articles[0].url, timeout=10)
+        response.raise_for_status()
+        article_name = f"recorded_article_{stamp}.html"
+        with open(os.path.join(FIXTURE_DIR, article_name), "wb") as f:
+            f.write(response.content)
+        expected["article"][article_name] = extract_subtitle_fast(response.content)
+        print(f"💾 {article_name}: 부제목 = {expected['article'][article_name]!r}")
+
+    with open(EXPECTED_PATH, "w", encoding="utf-8") as f:
+        json.dump(expected, f, ensure_ascii=False, indent=4)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="저장된 HTML로 네이버 파서 성능 측정")
+    arg_parser.add_argument("--repeat", type=int, default=20, help="페이지마다 반복 실행 횟수")
+    arg_parser.add_argument("--label", default=None, help="결과 파일 이름 (기본: 현재 git 커밋)")
+    arg_parser.add_argument("--compare", default=None, help="비교할 이전 결과 파일(.json)")
+    arg_parser.add_argument("--no-save", action="store_true", help="결과 파일을 저장하지 않음")
+    arg_parser.add_argument("--record", metavar="KEYWORD", default=None, help="실제 페이지를 새 fixture로 저장")
+    args = arg_parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        sys.exit(0)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+
+    print(f"파서: {', '.join(available_parsers())}  /  반복 {args.repeat}회 중앙값")
+    results = run(args.repeat)
+    print_table(results, previous)
+
+    if not args.no_save:
+        print(f"\n📁 결과 저장: {save(results, args.label or _git_revision())}")
+
+    # 정답이 틀린 페이지가 있으면 실패 코드로 끝냄 (CI 등에서 확인용)
+    sys.exit(0 if all(r["ok"] for r in results) else 1)
@@ -0,0 +1,84 @@
+# benchmarks/check_journal_recovery.py
+"""
+[저널 복구 점검] JournalBookmarkStorage.compact 도중 프로그램이 죽는 상황을 단계별로 흉내 내고,
+다시 열었을 때 죽기 전과 같은 북마크가 나오는지 확인합니다.
+
+  - 시나리오: 기사 a, b 저장 -> 0번(a) 삭제 -> 합치기 도중 종료 -> 다시 열기 -> ['b']가 나와야 함
+  - 종료 시점: 표시 줄만 쓴 직후 / 저널 이름 변경 직후 / 스냅샷 바꿔치기 직후 / 정상 완료
+  - 복구 후 한 번 더 저장하고 합쳐서, 남은 .compacting 파일이 다음 합치기에서도 올바르게 처리되는지 확인
+
+실행: python -m benchmarks.check_journal_recovery
+"""
+import os
+import sys
+import tempfile
+
+from services.bookmark_storage import JournalBookmarkStorage
+
+
+def _titles(storage: JournalBookmarkStorage, folder: str = "폴더") -> list[str]:
+    return [item["기사 제목"] for item in storage.load_all().get(folder, [])]
+
+
+def _prepare(path: str) -> JournalBookmarkStorage:
+    storage = JournalBookmarkStorage(path)
+    storage.append("폴더", [{"기사 제목": "a"}])
+    storage.append("폴더", [{"기사 제목": "b"}])
+    storage.delete("폴더", 0)
+    return storage
+
+
+def _crash_after_marker(storage: JournalBookmarkStorage) -> None:
+    storage._write_op({"op": "compact", "base": storage._snapshot_digest()})
+
+
+def _crash_after_rename(storage: JournalBookmarkStorage) -> None:
+    storage._begin_compaction()
+
+
+def _crash_after_swap(storage: JournalBookmarkStorage) -> None:
+    state = storage._ensure_state()
+    storage._begin_compaction()
+    storage._write_snapshot(state)
+
+
+def _no_crash(storage: JournalBookmarkStorage) -> None:
+    storage.compact()
+
+
+SCENARIOS = [
+    ("표시 줄만 쓴 직후", _crash_after_marker),
+    ("저널 이름 변경 직후", _crash_after_rename),
+    ("스냅샷 바꿔치기 직후", _crash_after_swap),
+    ("정상 완료", _no_crash),
+]
+
+
+def main() -> int:
+    failures = 0
+    print(f"{'종료 시점':<14} {'다시 열기':<12} {'복구 후 합치기':<16} 결과")
+    print("-" * 56)
+    for label, crash in SCENARIOS:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "bookmarks.json")
+            storage = _prepare(path)
+            expected = _titles(storage)
+            crash(storage)
+            if storage._journal_file is not None:
+                storage._journal_file.close()
+
+            # 새 객체 = 프로그램을 다시 켠 상황
+            reopened = JournalBookmarkStorage(path)
+            after_restart = _titles(reopened)
+            reopened.append("폴더", [{"기사 제목": "c"}])
+            reopened.compact()
+            after_compact = _titles(JournalBookmarkStorage(path))
+
+            ok = after_restart == expected and after_compact == expected + ["c"]
+            failures += not ok
+            print(f"{label:<14} {str(after_restart):<12} {str(after_compact):<16} {'OK' if ok else 'FAIL'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
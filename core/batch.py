@@ -0,0 +1,233 @@
+# core/batch.py
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from typing import TextIO
+
+from crawlers.naver_crawler import NaverCrawler
+from crawlers.article_cache import ArticleCache
+from crawlers.crawl_scheduler import CrawlScheduler
+from crawlers.http_session import get_shared_session
+from crawlers.incremental_crawler import IncrementalCrawler
+from crawlers.parse_pool import ParsePool
+from models.article import Article
+from services.bookmark_manager import BookmarkManager
+
+# -------------------------------------------------------------------------
+# [배치 모드] input() 없이 한 번에 실행되는 명령줄 수집기
+# 메뉴(TIDIED.run)는 사람이 키보드로 조작해야 해서 cron이나 스크립트에서 쓸 수 없었습니다.
+# 키워드 목록을 받아 수집한 기사를 한 줄에 하나씩 JSON(JSONL)으로 내보냅니다.
+#
+#   python main.py 삼성전자 반도체 --pages 3 --output data/result.jsonl
+#   python main.py --keywords-file keywords.txt --save-folder 자동수집
+#   cat keywords.txt | python main.py -f - | jq .
+#   python main.py 삼성전자 --watch 600 --save-folder 자동수집     (10분마다 새 기사만)
+#
+# JSONL 결과는 stdout(또는 --output 파일)으로만 나가고,
+# 진행 상황/요약 같은 안내 문구는 모두 stderr로 보냅니다. (파이프로 연결해도 결과가 섞이지 않음)
+# -------------------------------------------------------------------------
+
+EXIT_OK = 0            # 모든 키워드에서 기사를 수집함 (증분/감시 모드는 새 기사가 없어도 0)
+EXIT_EMPTY = 1         # 수집된 기사가 하나도 없음
+EXIT_USAGE = 2         # 잘못된 인자 / 키워드 없음 (argparse 오류 코드와 같음)
+EXIT_PARTIAL = 3       # 일부 키워드는 결과가 없음
+EXIT_INTERRUPTED = 130 # Ctrl+C로 중단
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python main.py",
+        description="TiDIED 배치 수집: 키워드별 네이버 뉴스를 JSONL로 내보냅니다. (인자 없이 실행하면 메뉴 모드)",
+    )
+    parser.add_argument("keywords", nargs="*", help="검색어 (여러 개 가능)")
+    parser.add_argument("-f", "--keywords-file", help="검색어 파일 (한 줄에 하나, #은 주석, '-'는 stdin)")
+    parser.add_argument("-p", "--pages", type=int, default=2, help="키워드마다 수집할 검색 결과 페이지 수 (기본 2)")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="동시에 보낼 요청(스레드) 수 (기본 8)")
+    parser.add_argument("--parse-workers", type=int, default=0,
+                        help="HTML 파싱을 맡을 프로세스 수 (기본 0 = 요청 스레드에서 파싱, CPU 코어가 많을 때 사용)")
+    parser.add_argument("-o", "--output", default="-", help="결과 JSONL 파일 경로 (기본 '-' = stdout)")
+    parser.add_argument("--no-content", action="store_true", help="부제목을 가져오지 않고 제목/링크만 내보냄")
+    parser.add_argument("--no-cache", action="store_true", help="기사 디스크 캐시를 사용하지 않음")
+    parser.add_argument("--save-folder", help="수집한 기사를 이 북마크 폴더에도 저장")
+    parser.add_argument("--bookmarks", default="data/bookmarks.json", help="북마크 저장 경로 (기본 data/bookmarks.json)")
+    parser.add_argument("--backend", choices=["json", "journal", "sqlite", "binary", "sharded"],
+                        help="북마크 저장소 종류 (기본: 경로 확장자로 결정)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="지난번 실행 이후 새로 나온 기사만 내보냄 (--pages는 최대 페이지 수)")
+    parser.add_argument("--watch", type=float, metavar="SECONDS",
+                        help="SECONDS초마다 반복해서 새 기사만 내보냄 (--incremental 포함, Ctrl+C로 종료)")
+    parser.add_argument("--cycles", type=int, help="--watch 반복 횟수 (기본: 무한)")
+    parser.add_argument("--seen-dir", default="data/seen", help="키워드별 '본 기사' 기록 폴더 (기본 data/seen)")
+    return parser
+
+
+def read_keywords(args: argparse.Namespace) -> list[str]:
+    """인자와 파일에서 검색어를 모읍니다. (빈 줄/주석 제외, 순서 유지, 중복 제거)"""
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        if args.keywords_file == "-":
+            lines = sys.stdin.read().splitlines()
+        else:
+            with open(args.keywords_file, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        keywords.extend(line.split("#", 1)[0] for line in lines)
+    return list(dict.fromkeys(k.strip() for k in keywords if k.strip()))
+
+
+def to_record(keyword: str, article: Article) -> dict:
+    """JSONL 한 줄 = 저장 파일과 같은 한글 Key 딕셔너리 + 검색어"""
+    return {"검색어": keyword, **article.to_dict()}
+
+
+class BatchRunner:
+    """
+    키워드 목록을 차례로 수집해서 JSONL로 내보내는 실행기입니다.
+    결과는 키워드 하나가 끝날 때마다 바로 써서(flush), 긴 작업 도중에도 앞부분을 쓸 수 있습니다.
+    """
+
+    def __init__(self, crawler: NaverCrawler, out: TextIO, log: TextIO = sys.stderr,
+                 workers: int = 8, fetch_content: bool = True, manager: BookmarkManager | None = None,
+                 save_folder: str | None = None):
+        self.crawler = crawler
+        self.out = out
+        self.log = log
+        self.workers = workers
+        self.fetch_content = fetch_content
+        self.manager = manager
+        self.save_folder = save_folder
+
+        self.articles = 0
+        self.with_content = 0
+        self.empty_keywords: list[str] = []
+
+    def collect(self, keyword: str, pages: int) -> list[Article]:
+        articles = self.crawler.search(keyword, pages=pages)
+        if self.fetch_content and articles:
+            contents = self.crawler.get_contents([a.url for a in articles], max_workers=self.workers)
+            for article, content in zip(articles, contents):
+                article.content = content if content else ""
+        return articles
+
+    def emit(self, keyword: str, articles: list[Article]) -> None:
+        for article in articles:
+            self.out.write(json.dumps(to_record(keyword, article), ensure_ascii=False) + "\n")
+        self.out.flush()
+
+        self.articles += len(articles)
+        self.with_content += sum(1 for a in articles if a.content)
+        if not articles:
+            self.empty_keywords.append(keyword)
+        if self.manager is not None and articles:
+            self.manager.save_bookmarks(articles, self.save_folder)
+
+    def run(self, keywords: list[str], pages: int) -> None:
+        # 크롤러/매니저의 print 안내 문구가 JSONL(stdout)에 섞이지 않도록 stderr로 돌림
+        with contextlib.redirect_stdout(self.log):
+            if len(keywords) == 1:
+                self.emit(keywords[0], self.collect(keywords[0], pages))
+                return
+            # 키워드가 여러 개면 스케줄러로 한꺼번에 수집 (겹치는 기사는 한 번만 요청)
+            # 끝나는 키워드부터 바로 내보내므로 출력 순서는 입력 순서와 다를 수 있음
+            scheduler = CrawlScheduler(self.crawler, max_workers=self.workers)
+            scheduler.run(keywords, pages=pages, fetch_content=self.fetch_content, on_keyword_done=self.emit)
+
+    def run_incremental(self, keywords: list[str], pages: int, seen_dir: str,
+                        interval: float | None = None, cycles: int | None = None) -> None:
+        """새 기사만 내보냅니다. interval이 없으면 한 번, 있으면 interval초마다 반복합니다."""
+        watcher = IncrementalCrawler(self.crawler, seen_dir=seen_dir, max_workers=self.workers,
+                                     fetch_content=self.fetch_content)
+
+        def emit_delta(keyword: str, delta: list[Article]) -> None:
+            # 새 기사가 없는 건 정상이므로 '결과 없는 검색어'로 세지 않음
+            if delta:
+                self.emit(keyword, delta)
+
+        with contextlib.redirect_stdout(self.log):
+            watcher.watch(keywords, max_pages=pages, interval=interval or 0,
+                          cycles=1 if interval is None else cycles, on_delta=emit_delta)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        keywords = read_keywords(args)
+    except OSError as e:
+        print(f"❌ [Error] 검색어 파일을 읽을 수 없습니다: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    if not keywords:
+        parser.print_usage(sys.stderr)
+        print("❌ 검색어가 없습니다. 인자 또는 --keywords-file로 넘겨주세요.", file=sys.stderr)
+        return EXIT_USAGE
+    if args.pages < 1 or args.workers < 1:
+        print("❌ --pages와 --workers는 1 이상이어야 합니다.", file=sys.stderr)
+        return EXIT_USAGE
+    if args.parse_workers < 0:
+        print("❌ --parse-workers는 0 이상이어야 합니다.", file=sys.stderr)
+        return EXIT_USAGE
+    if (args.watch is not None and args.watch < 0) or (args.cycles is not None and args.cycles < 1):
+        print("❌ --watch는 0 이상, --cycles는 1 이상이어야 합니다.", file=sys.stderr)
+        return EXIT_USAGE
+    incremental = args.incremental or args.watch is not None
+
+    # 출력 파일을 먼저 열어 봄 (경로가 잘못됐으면 프로세스 풀/캐시/북마크를 만들기 전에 끝냄)
+    try:
+        out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    except OSError as e:
+        print(f"❌ [Error] 출력 파일을 열 수 없습니다: {e}", file=sys.stderr)
+        return EXIT_USAGE
+
+    parse_pool = ParsePool(args.parse_workers) if args.parse_workers else None
+    # 요청 스레드 수(-w)만큼 연결을 붙잡고 있을 수 있도록 커넥션 풀을 맞춤
+    crawler = NaverCrawler(session=get_shared_session(pool_size=args.workers),
+                           cache=None if args.no_cache else ArticleCache(), parse_pool=parse_pool)
+    manager = BookmarkManager(args.bookmarks, backend=args.backend) if args.save_folder else None
+
+    runner = BatchRunner(crawler, out, workers=args.workers, fetch_content=not args.no_content,
+                         manager=manager, save_folder=args.save_folder)
+
+    started = time.perf_counter()
+    interrupted = False
+    try:
+        if incremental:
+            runner.run_incremental(keywords, args.pages, args.seen_dir, interval=args.watch, cycles=args.cycles)
+        else:
+            runner.run(keywords, args.pages)
+    except KeyboardInterrupt:
+        interrupted = True
+    except BrokenPipeError:
+        # `| head`처럼 읽는 쪽이 먼저 끝난 경우: 남은 출력은 버리고 조용히 종료
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        interrupted = True
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        if parse_pool is not None:
+            parse_pool.shutdown()
+
+    elapsed = time.perf_counter() - started
+    rate = runner.articles / elapsed if elapsed > 0 else 0.0
+    print(
+        f"{'⏹️ [배치 중단]' if interrupted else '✅ [배치 완료]'} "
+        f"키워드 {len(keywords)}개 / 기사 {runner.articles}개 (부제목 {runner.with_content}개) / "
+        f"{elapsed:.1f}초 / {rate:.2f} 기사/초",
+        file=sys.stderr,
+    )
+    if runner.empty_keywords:
+        print(f"⚠️ 결과가 없는 검색어: {', '.join(runner.empty_keywords)}", file=sys.stderr)
+
+    if interrupted:
+        return EXIT_INTERRUPTED
+    if incremental:
+        return EXIT_OK
+    if runner.articles == 0:
+        return EXIT_EMPTY
+    if runner.empty_keywords:
+        return EXIT_PARTIAL
+    return EXIT_OK
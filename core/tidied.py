@@ -2,6 +2,7 @@
 
 import sys
 from crawlers.naver_crawler import NaverCrawler
+from crawlers.article_cache import ArticleCache
 from services.bookmark_manager import BookmarkManager
 from utils.naver_class_finder import find_naver_class
 
@@ -16,11 +17,14 @@ class TIDIED:
     main.py는 단순히 이 클래스를 호출만 하도록 구조를 개선했습니다.
     """
 
+    # 북마크 폴더를 볼 때 한 화면에 보여줄 기사 수
+    PAGE_SIZE = 20
+
     def __init__(self):
         # [Composition(합성)]
         # Tidied 객체는 내부적으로 Crawler와 Manager 객체를 '부품'으로 소유합니다.
         # 필요할 때마다 이 부품들을 조립해서 기능을 수행합니다.
-        self.crawler = NaverCrawler()
+        self.crawler = NaverCrawler(cache=ArticleCache())
         self.manager = BookmarkManager()
 
     def run(self):
@@ -36,6 +40,8 @@ class TIDIED:
                 self._process_crawling()
             elif choice == "2":
                 self._process_bookmark_management()
+            elif choice == "3":
+                self._process_bookmark_search()
             elif choice == "9":
                 self._run_diagnosis()
             elif choice == "0":
@@ -50,6 +56,7 @@ class TIDIED:
         print("=========================================")
         print("1. 📰 네이버 뉴스 크롤링 시작")
         print("2. 💾 북마크 확인 및 관리 (폴더/삭제/이동)")
+        print("3. 🔍 저장한 북마크 검색")
         print("9. 🛠️ [관리자] 네이버 클래스명 진단 도구")
         print("0. 🚪 종료")
         print("=========================================")
@@ -71,7 +78,16 @@ class TIDIED:
 
         print(f"\n🚀 '{keyword}' 키워드로 {pages}페이지 크롤링을 시작합니다...\n")
         
-        articles = self.crawler.search(keyword, pages=pages)
+        # [점진적 출력] 기사를 찾는 즉시 제목을 먼저 보여줍니다.
+        # 기다리기 지루하면 Ctrl+C로 수집을 멈추고, 지금까지 찾은 기사만으로 진행할 수 있습니다.
+        print("(Ctrl+C: 수집 중단 후 지금까지 찾은 기사로 진행)")
+        articles = []
+        try:
+            for article in self.crawler.iter_search(keyword, pages=pages):
+                articles.append(article)
+                print(f"     + {article.title}")
+        except KeyboardInterrupt:
+            print(f"\n⏹️ 수집을 중단했습니다. ({len(articles)}개까지 수집됨)")
 
         if not articles:
             print("\n❌ 검색 결과가 없습니다.")
@@ -80,11 +96,14 @@ class TIDIED:
         # -----------------------------------------------------
         # a. 부제목 수집 및 진행 상황 표시
         # -----------------------------------------------------
+        # [성능 개선] 기사를 하나씩 요청하지 않고 병렬로 수집 (결과 순서는 그대로 유지됨)
         print("📝 기사 내용을 요약하고 있습니다...", end="", flush=True)
-        for article in articles:
-            content = self.crawler.get_content(article.url)
+        contents = self.crawler.get_contents(
+            [article.url for article in articles],
+            on_progress=lambda done, total: print(".", end="", flush=True) # 진행바 느낌
+        )
+        for article, content in zip(articles, contents):
             article.content = content if content else ""
-            print(".", end="", flush=True) # 진행바 느낌
         print(" 완료!\n")
 
         # -----------------------------------------------------
@@ -108,6 +127,9 @@ class TIDIED:
         for i, article in enumerate(articles):
             print(f"{i+1:02d}. [{article.source}] {article.title}")
             print(f"    🔗 {article.url}")
+            saved_in = self.manager.find_url_folders(article.url)
+            if saved_in:
+                print(f"    📌 이미 저장됨: {', '.join(saved_in)}")
             
             if article.content:
                 print(f"    📝 부제목: {article.content[:60]}...")
@@ -161,15 +183,16 @@ class TIDIED:
     # ------------------------------------------------------------------
     def _process_bookmark_management(self):
         while True:
-            saved_data = self.manager.load_bookmarks()
-            if not saved_data:
+            # [성능 개선] 폴더 목록에는 기사 내용이 필요 없으므로 '폴더별 기사 수'만 가져옵니다.
+            folder_counts = self.manager.folder_counts()
+            if not folder_counts:
                 print("\n📂 저장된 북마크가 없습니다.")
                 return
 
             print("\n================ [내 폴더 목록] ================")
-            folders = list(saved_data.keys())
+            folders = list(folder_counts.keys())
             for i, folder in enumerate(folders):
-                count = len(saved_data[folder])
+                count = folder_counts[folder]
                 print(f"{i+1}. 📁 {folder} ({count}개)")
             print("0. 메인 메뉴로 돌아가기")
             print("================================================")
@@ -192,20 +215,22 @@ class TIDIED:
     def _show_folder_detail(self, folder_name):
         """
         특정 폴더의 기사 목록을 보여주고 삭제/이동 기능을 제공
+        [성능 개선] 기사가 수천 개인 폴더도 한 페이지(PAGE_SIZE개)만 읽어서 보여줍니다.
         """
+        page = 0
         while True:
-            saved_data = self.manager.load_bookmarks()
-            if folder_name not in saved_data:
+            current = self.manager.load_folder_page(folder_name, page, self.PAGE_SIZE)
+            if current is None:
                 print("📂 폴더가 비어있거나 삭제되었습니다.")
                 break
                 
-            articles = saved_data[folder_name]
-            if not articles:
+            if not current.articles:
                 print("📂 폴더가 비어있습니다.")
                 break
 
-            print(f"\n--- 📂 '{folder_name}' 폴더 내부 ---")
-            for i, article in enumerate(articles):
+            page = current.page
+            print(f"\n--- 📂 '{folder_name}' 폴더 내부 ({current.page + 1}/{current.page_count} 페이지, 총 {current.total}개) ---")
+            for i, article in enumerate(current.articles, start=current.offset):
                 print(f"\n{i+1}. {article.title}")
                 # [복구됨] 부제목 출력
                 if article.content:
@@ -213,19 +238,27 @@ class TIDIED:
                 # [복구됨] 링크 출력
                 print(f"   └─ 출처(링크): {article.url}")
 
-            print("\n[기능] 번호 선택: 기사 관리 / 0: 뒤로 가기")
+            print("\n[기능] 번호 선택: 기사 관리 / n: 다음 페이지 / p: 이전 페이지 / 0: 뒤로 가기")
             
+            command = input(">>> 선택: ").strip().lower()
+            if command == "n":
+                page += 1
+                continue
+            if command == "p":
+                page -= 1
+                continue
             try:
-                idx = int(input(">>> 선택: "))
+                idx = int(command)
             except ValueError:
                 continue
 
             if idx == 0:
                 break
             
+            # 번호는 폴더 전체 기준이므로, 지금 페이지에 보이는 기사만 고를 수 있음
             real_idx = idx - 1
-            if 0 <= real_idx < len(articles):
-                target_article = articles[real_idx]
+            if current.offset <= real_idx < current.offset + len(current.articles):
+                target_article = current.articles[real_idx - current.offset]
                 print(f"\n선택된 기사: [{target_article.title}]")
                 print("1. 🗑️ 삭제하기")
                 print("2. 🚚 다른 폴더로 이동하기")
@@ -250,6 +283,27 @@ class TIDIED:
             else:
                 print("❌ 잘못된 번호입니다.")
 
+    def _process_bookmark_search(self):
+        """
+        [전문 검색] 폴더를 하나씩 열어보지 않고, 검색어로 저장된 기사를 바로 찾습니다.
+        """
+        while True:
+            query = input("\n🔍 검색어를 입력하세요 (엔터: 뒤로 가기): ").strip()
+            if not query:
+                break
+
+            hits = self.manager.search(query)
+            if not hits:
+                print("❌ 검색 결과가 없습니다.")
+                continue
+
+            print(f"\n--- 🔍 '{query}' 검색 결과 ({len(hits)}개) ---")
+            for i, hit in enumerate(hits):
+                print(f"\n{i+1}. [📁 {hit.folder} #{hit.index + 1}] {hit.article.title}")
+                if hit.article.content:
+                    print(f"   └─ {hit.article.content[:100]}...")
+                print(f"   └─ 출처(링크): {hit.article.url}")
+
     # ------------------------------------------------------------------
     # 3. 유틸리티 & 도우미 메서드
     # ------------------------------------------------------------------
@@ -259,8 +313,7 @@ class TIDIED:
         저장할 때마다 폴더 이름을 일일이 치는 게 귀찮아서,
         기존 폴더 목록을 번호로 보여주고 선택하게 하는 '비서 기능'을 추가했습니다.
         """
-        saved_data = self.manager.load_bookmarks()
-        folders = list(saved_data.keys())
+        folders = list(self.manager.folder_counts().keys())
 
         if not folders:
             print("\n📂 기존 폴더가 없습니다. 새 폴더를 생성합니다.")
@@ -300,4 +353,13 @@ class TIDIED:
     def _run_diagnosis(self):
         print("\n [관리자 모드] 네이버 뉴스 클래스 이름 변경 탐지")
         keyword = input("검색 테스트에 사용할 키워드 (기본: 삼성전자): ")
-        find_naver_class(keyword)
\ No newline at end of file
+        find_naver_class(keyword, session=self.crawler.session)
+
+        # [자동 복구] 크롤러가 실제로 쓰고 있는 값 (검색 중에 바뀌면 자동으로 갱신됨)
+        stats = self.crawler.selectors.stats()
+        entry = stats["entries"].get(self.crawler.TITLE_SELECTOR_KEY)
+        if entry:
+            print(f"📌 선택자 캐시: '{entry['value']}' ({entry['source']}, {entry['age_seconds']}초 전)")
+        else:
+            print(f"📌 선택자 캐시: 비어 있음 (기본값 '{self.crawler.NEWS_TITLE_CLASS}' 사용)")
+        print(f"   적중 {stats['hits']}회 / 실패 {stats['misses']}회 / 자동 탐지 {stats['detections']}회")
\ No newline at end of file
@@ -0,0 +1,187 @@
+# crawlers/article_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+
+from utils.url_utils import normalize_url
+
+# -------------------------------------------------------------------------
+# [성능 개선] 기사 페이지 디스크 캐시
+# 같은 키워드를 여러 번 검색하면 똑같은 n.news.naver.com 기사를 매번 다시 받아왔습니다.
+# 부제목은 거의 바뀌지 않으므로, 한 번 뽑아낸 부제목을 디스크(SQLite)에 저장해 두고 재사용합니다.
+#
+# - TTL(유효 시간) 안이면 네트워크 요청 없이 '뽑아둔 부제목'을 바로 반환 (파싱도 생략)
+# - TTL이 지났으면 ETag/Last-Modified로 조건부 요청 -> 304면 그대로 재사용
+# - 전체 용량이 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+# - 원본 HTML은 압축(zlib)하여 부제목과 따로 저장합니다.
+# -------------------------------------------------------------------------
+
+DEFAULT_CACHE_PATH = "data/article_cache.sqlite3"
+DEFAULT_TTL = 60 * 60 * 24          # 하루
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024  # 100MB
+
+
+@dataclass
+class CacheEntry:
+    """캐시에 저장된 기사 하나의 정보입니다."""
+    url: str
+    subtitle: str | None
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return (time.time() - self.fetched_at) < ttl
+
+
+class ArticleCache:
+    """
+    URL(정규화된 값)을 Key로 하는 기사 캐시입니다.
+    get_contents()가 여러 스레드에서 동시에 접근하므로 내부적으로 Lock을 사용합니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL,
+                 max_bytes: int = DEFAULT_MAX_BYTES, store_body: bool = True):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.store_body = store_body
+
+        # 통계 (hit: TTL 안에서 재사용 / revalidated: 304로 재사용 / miss: 새로 다운로드)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                key           TEXT PRIMARY KEY,
+                url           TEXT NOT NULL,
+                subtitle      TEXT,
+                body          BLOB,
+                etag          TEXT,
+                last_modified TEXT,
+                size          INTEGER NOT NULL,
+                fetched_at    REAL NOT NULL,
+                accessed_at   REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_accessed ON articles(accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def lookup(self, url: str) -> CacheEntry | None:
+        """캐시 항목을 찾아 반환합니다. (LRU를 위해 마지막 사용 시각도 갱신)"""
+        key = normalize_url(url)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, subtitle, etag, last_modified, fetched_at FROM articles WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE articles SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+        return CacheEntry(*row)
+
+    def get_body(self, url: str) -> bytes | None:
+        """저장해 둔 원본 HTML(압축 해제된 바이트)을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM articles WHERE key = ?", (normalize_url(url),)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return zlib.decompress(row[0])
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+    def store(self, url: str, subtitle: str | None, body: bytes | None = None,
+              etag: str | None = None, last_modified: str | None = None) -> None:
+        key = normalize_url(url)
+        packed = zlib.compress(body) if (body and self.store_body) else None
+        size = len(packed or b"") + len((subtitle or "").encode("utf-8")) + len(key)
+        now = time.time()
+
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM articles WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO articles "
+                "(key, url, subtitle, body, etag, last_modified, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, subtitle, packed, etag, last_modified, size, now, now)
+            )
+            self._total_bytes += size - (old[0] if old else 0)
+            self._evict_locked()
+            self._conn.commit()
+
+    def refresh(self, url: str) -> None:
+        """304(Not Modified) 응답을 받았을 때 유효 시간을 다시 시작합니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, normalize_url(url))
+            )
+            self._conn.commit()
+
+    def _evict_locked(self) -> None:
+        """[LRU] 용량을 넘었으면 가장 오래 사용하지 않은 항목부터 지웁니다. (Lock 안에서 호출)"""
+        while self._total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM articles ORDER BY accessed_at LIMIT 64"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                self._conn.execute("DELETE FROM articles WHERE key = ?", (key,))
+                self._total_bytes -= size
+                self.evictions += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+    def count(self, kind: str) -> None:
+        """통계 카운터(hits / revalidated / misses)를 1 올립니다. (여러 스레드에서 호출됨)"""
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    def stats(self) -> dict:
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        return {
+            "entries": count,
+            "bytes": self._total_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM articles")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
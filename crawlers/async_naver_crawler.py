@@ -0,0 +1,166 @@
+# crawlers/async_naver_crawler.py
+
+import asyncio
+import time
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from crawlers.naver_crawler import NaverCrawler
+from crawlers.rate_limiter import AdaptiveRateLimiter
+from crawlers.naver_parser import SEARCH_URL, build_search_params, parse_search_page, extract_subtitle, extract_subtitle_fast
+from models.article import Article
+
+class AsyncNaverCrawler(NaverCrawler):
+    """
+    [비동기(asyncio) 크롤러]
+    스레드를 요청마다 하나씩 만들지 않고, 하나의 이벤트 루프 위에서
+    수백 개의 요청을 동시에 처리하기 위한 크롤러입니다.
+
+    [설계 의도]
+    - NaverCrawler를 상속받기 때문에 기존 동기 메서드(search/get_content)도 그대로 쓸 수 있습니다.
+    - 파싱/필터링 규칙은 naver_parser 모듈을 공유하므로 search()와 결과가 완전히 같습니다.
+    - 동시에 진행되는 요청 수는 Semaphore(max_concurrency)로 제한합니다.
+
+    사용 예)
+        async with AsyncNaverCrawler() as crawler:
+            articles = await crawler.search_async("삼성전자", pages=3)
+    """
+
+    def __init__(self, max_concurrency: int = 100, rate_limiter: AdaptiveRateLimiter | None = None):
+        super().__init__(rate_limiter=rate_limiter)
+        self.max_concurrency = max_concurrency
+        # 세션과 세마포어는 이벤트 루프에 묶이므로, 실제로 처음 사용할 때 만듭니다.
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self):
+        self._ensure_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def aclose(self) -> None:
+        """열려 있는 HTTP 세션을 닫습니다."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+
+    async def _fetch_text(self, url: str, params: dict | None = None, timeout: float | None = None,
+                          raw: bool = False):
+        """
+        [내부 함수] 세마포어로 동시 요청 수를 제한하면서 HTML 문자열을 받아옵니다.
+        raw=True이면 (원본 바이트, 헤더에 명시된 charset)을 반환합니다. (빠른 추출 모드용)
+        """
+        session = self._ensure_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout) if timeout else None
+        async with self._semaphore:
+            # 동기 크롤러와 같은 속도 제한기를 사용하되, 기다릴 때는 이벤트 루프를 막지 않습니다.
+            wait = self.rate_limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            host = urlsplit(url).hostname or ""
+            started = time.perf_counter()
+            try:
+                async with session.get(url, params=params, timeout=client_timeout) as response:
+                    latency = time.perf_counter() - started
+                    self.rate_limiter.record(url, response.status, latency)
+                    self.metrics.observe("fetch_seconds", latency, host=host)
+                    self.metrics.inc("http_responses_total", host=host, status=response.status)
+                    response.raise_for_status()
+                    # 본문은 한 번 읽어 두면 text()가 다시 받지 않고 그대로 해석함
+                    body = await response.read()
+                    self.metrics.observe("fetch_bytes", len(body), kind="search" if url == SEARCH_URL else "article")
+                    if raw:
+                        return body, response.charset
+                    return await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                self.rate_limiter.record(url, None, time.perf_counter() - started)
+                self.metrics.inc("http_responses_total", host=host, status="error")
+                raise
+
+    async def search_async(self, keyword: str, pages: int = 2) -> list[Article]:
+        """
+        search()의 비동기 버전입니다.
+        모든 검색 페이지를 '동시에' 요청한 뒤, 결과는 페이지 순서대로 해석합니다.
+        (중복 제거와 '검색 결과 없음'에서 멈추는 규칙을 search()와 똑같이 유지하기 위함)
+        """
+        print(f"\n[AsyncNaverCrawler] '{keyword}' 검색 시작 (언론사 홈 필터링 추가됨)...")
+
+        tasks = [
+            self._fetch_text(SEARCH_URL, params=build_search_params(keyword, page), timeout=10)
+            for page in range(pages)
+        ]
+        # return_exceptions=True: 한 페이지가 실패해도 나머지 페이지는 계속 처리
+        pages_html = await asyncio.gather(*tasks, return_exceptions=True)
+
+        articles: list[Article] = []
+        visited_urls = set()
+
+        for page, html in enumerate(pages_html):
+            if isinstance(html, BaseException):
+                print(f"  -> [오류] {html}")
+                continue
+
+            try:
+                # [자동 복구] search()와 같은 선택자 캐시를 공유 (한쪽에서 찾은 클래스를 다른 쪽도 사용)
+                cached_class = self.selectors.get(self.TITLE_SELECTOR_KEY)
+                title_class = cached_class or self.NEWS_TITLE_CLASS
+                detected, page_articles, used_class = parse_search_page(
+                    html, title_class, visited_urls, keyword
+                )
+                self.remember_title_class(title_class, used_class, cached_class)
+            except Exception as e:
+                print(f"  -> [오류] {e}")
+                continue
+
+            if not detected:
+                print(f"  -> {page + 1}페이지: 검색 결과 없음")
+                break
+
+            articles.extend(page_articles)
+            print(f"  -> {page + 1}페이지 완료: {detected}개 감지 -> {len(articles)}개 유효 수집")
+
+        return articles
+
+    async def get_content_async(self, url: str) -> str | None:
+        """get_content()의 비동기 버전입니다. 부제목이 없으면 "", 실패하면 None을 반환합니다."""
+        try:
+            if self.fast_extract:
+                body, encoding = await self._fetch_text(url, timeout=10, raw=True)
+                return extract_subtitle_fast(body, encoding) or ""
+            html = await self._fetch_text(url, timeout=10)
+            return extract_subtitle(html) or ""
+        except Exception:
+            return None
+
+    async def get_contents_async(self, urls: list[str],
+                                 on_progress: Optional[Callable[[int, int], None]] = None) -> list[str | None]:
+        """
+        get_contents()의 비동기 버전입니다.
+        동시 요청 수는 스레드 수가 아니라 세마포어(max_concurrency)로 제한되며,
+        결과는 입력 순서대로 반환합니다.
+        """
+        total = len(urls)
+        results: list[str | None] = [None] * total
+        done = 0
+
+        async def worker(i: int, url: str):
+            nonlocal done
+            results[i] = await self.get_content_async(url)
+            done += 1
+            if on_progress:
+                on_progress(done, total)
+
+        await asyncio.gather(*(worker(i, url) for i, url in enumerate(urls)))
+        return results
@@ -1,6 +1,8 @@
 # crawlers/base_crawler.py
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, Optional
 from models.article import Article      # [WEEK03 모듈과 패키지] 상대 경로 import
 
 class NewsCrawler(ABC):
@@ -24,10 +26,51 @@ class NewsCrawler(ABC):
         """
         pass
 
+    def iter_search(self, keyword: str, pages: int = 2) -> Iterator[Article]:
+        """
+        검색 결과를 하나씩 내보내는 제너레이터입니다.
+        기본 구현은 search() 결과를 그대로 흘려보내며, 자식 클래스에서 더 빠르게 재정의할 수 있습니다.
+        """
+        yield from self.search(keyword, pages)
+
     @abstractmethod
     def get_content(self, url: str) -> str:
         """
         [추상 메서드] 자식 클래스에서 반드시 구현해야 하는 본문 수집 기능입니다.
         URL을 받아 기사 내용을 문자열로 반환해야 합니다.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def get_contents(self, urls: list[str], max_workers: int = 8,
+                     on_progress: Optional[Callable[[int, int], None]] = None) -> list[str | None]:
+        """
+        [성능 개선] 여러 기사의 본문(부제목)을 동시에 수집합니다.
+        기사 하나씩 순서대로 get_content()를 부르면 네트워크 대기 시간이 그대로 쌓이기 때문에,
+        스레드 풀(ThreadPoolExecutor)로 최대 max_workers개까지 병렬로 요청합니다.
+
+        - 반환값은 입력한 urls와 '같은 순서'의 리스트입니다. (완료 순서와 무관)
+        - on_progress(완료 개수, 전체 개수) 콜백은 결과가 하나 도착할 때마다 호출되므로
+          CLI 점(.) 진행바나 Streamlit 진행바를 그대로 갱신할 수 있습니다.
+        """
+        total = len(urls)
+        results: list[str | None] = [None] * total
+        if total == 0:
+            return results
+
+        workers = max(1, min(max_workers, total))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Future -> 원래 위치(index)를 기억해 두어야 순서를 복원할 수 있음
+            futures = {executor.submit(self.get_content, url): i for i, url in enumerate(urls)}
+
+            done = 0
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    # get_content 내부에서 예외를 삼키지만, 혹시 몰라 한 번 더 방어
+                    results[futures[future]] = None
+                done += 1
+                if on_progress:
+                    on_progress(done, total)
+
+        return results
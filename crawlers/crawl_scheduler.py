@@ -0,0 +1,152 @@
+# crawlers/crawl_scheduler.py
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Optional
+
+from crawlers.naver_crawler import NaverCrawler
+from models.article import Article
+from utils.url_utils import canonical_url
+
+# -------------------------------------------------------------------------
+# [성능 개선] 여러 키워드 동시 수집 스케줄러
+# 키워드 N개를 수집하면 search()를 N번 '차례로' 부르고, 부제목도 키워드마다 따로 받았습니다.
+# 회사 이름/종목 코드처럼 키워드끼리 겹치는 기사가 많아서, 같은 기사를 여러 번 받는 일이 흔했습니다.
+#
+# 이 스케줄러는
+#   1. 모든 키워드의 검색 페이지 요청을 하나의 스레드 풀(전체 동시 요청 수 제한)에 섞어서 넣고,
+#   2. 정규 URL(canonical_url)이 같은 기사는 Article 객체 하나를 키워드끼리 공유하며,
+#   3. 새 기사가 나오는 즉시 부제목 요청을 같은 풀에 넣되, 기사 하나당 딱 한 번만 요청합니다.
+# 호스트별 요청 속도는 크롤러가 쓰는 공용 속도 제한기(rate_limiter)가 전체적으로 맞춰 줍니다.
+# -------------------------------------------------------------------------
+
+class CrawlScheduler:
+    """
+    사용 예)
+        scheduler = CrawlScheduler(NaverCrawler(), max_workers=8)
+        results = scheduler.run(["삼성전자", "005930", "반도체"], pages=3)
+        results["삼성전자"][0] is results["005930"][2]   # 같은 기사면 같은 객체
+    """
+
+    def __init__(self, crawler: NaverCrawler, max_workers: int = 8):
+        self.crawler = crawler
+        self.max_workers = max(1, max_workers)
+        self.stats: dict[str, int] = {}
+
+    def run(self, keywords: list[str], pages: int = 2, fetch_content: bool = True,
+            on_keyword_done: Optional[Callable[[str, list[Article]], None]] = None,
+            on_progress: Optional[Callable[[int, int], None]] = None) -> dict[str, list[Article]]:
+        """
+        키워드별 기사 리스트({키워드: [Article, ...]})를 반환합니다. (키워드 안의 순서는 검색 결과 순서)
+
+        - on_keyword_done(키워드, 기사 리스트): 한 키워드의 페이지와 부제목이 모두 끝나는 즉시 호출
+        - on_progress(끝난 요청 수, 지금까지 만든 요청 수): 요청이 하나 끝날 때마다 호출
+        콜백은 모두 run()을 부른 스레드에서 호출되므로 화면 갱신 코드를 그대로 넣어도 됩니다.
+        """
+        keywords = list(dict.fromkeys(keywords))
+        results: dict[str, list[Article]] = {k: [] for k in keywords}
+        result_keys: dict[str, set[str]] = {k: set() for k in keywords}   # 키워드 안 중복 방지
+        visited: dict[str, set] = {k: set() for k in keywords}             # 페이지 사이 중복 방지 (search와 같음)
+        waiting: dict[str, set[str]] = {k: set() for k in keywords}        # 부제목을 기다리는 기사들
+        paging = set(keywords)                                            # 아직 페이지를 넘기는 중인 키워드
+        finished: set[str] = set()
+
+        shared: dict[str, Article] = {}    # 정규 URL -> 공유 Article
+        pending: set[str] = set()          # 부제목 요청이 진행 중인 정규 URL
+        stats = {"keywords": len(keywords), "pages": 0, "page_errors": 0,
+                 "articles": 0, "unique_articles": 0, "shared_hits": 0, "content_fetches": 0}
+        self.stats = stats
+
+        futures: dict[Future, tuple] = {}
+        submitted = completed = 0
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crawl")
+
+        def submit(kind: str, fn, *args, info: tuple) -> None:
+            nonlocal submitted
+            futures[executor.submit(fn, *args)] = (kind, *info)
+            submitted += 1
+
+        def submit_page(keyword: str, page: int) -> None:
+            submit("page", self.crawler.fetch_search_page, keyword, page, visited[keyword], info=(keyword, page))
+
+        def handle_page(keyword: str, page: int, future: Future) -> None:
+            try:
+                detected, page_articles = future.result()
+            except Exception as e:
+                # search()와 같이 실패한 페이지는 건너뛰고 다음 페이지로
+                print(f"  -> [오류] '{keyword}' {page + 1}페이지: {e}")
+                stats["page_errors"] += 1
+                detected, page_articles = None, []
+            stats["pages"] += 1
+
+            if detected == 0:
+                paging.discard(keyword)
+                return
+
+            for article in page_articles:
+                key = canonical_url(article.url)
+                if key in result_keys[keyword]:
+                    continue
+                existing = shared.get(key)
+                if existing is None:
+                    shared[key] = existing = article
+                    stats["unique_articles"] += 1
+                    if fetch_content:
+                        pending.add(key)
+                        stats["content_fetches"] += 1
+                        submit("content", self.crawler.get_content, article.url, info=(key,))
+                else:
+                    stats["shared_hits"] += 1
+                result_keys[keyword].add(key)
+                results[keyword].append(existing)
+                stats["articles"] += 1
+                if key in pending:
+                    waiting[keyword].add(key)
+
+            if page + 1 < pages:
+                submit_page(keyword, page + 1)
+            else:
+                paging.discard(keyword)
+
+        def handle_content(key: str, future: Future) -> None:
+            try:
+                content = future.result()
+            except Exception:
+                content = None
+            shared[key].content = content if content else ""
+            pending.discard(key)
+            for keys in waiting.values():
+                keys.discard(key)
+
+        print(f"\n[CrawlScheduler] 키워드 {len(keywords)}개 동시 수집 시작 (동시 요청 최대 {self.max_workers}개)...")
+        try:
+            for keyword in keywords:
+                submit_page(keyword, 0)
+
+            while futures:
+                done, _ = wait(list(futures), return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, *info = futures.pop(future)
+                    if kind == "page":
+                        handle_page(*info, future)
+                    else:
+                        handle_content(*info, future)
+                    completed += 1
+                    if on_progress:
+                        on_progress(completed, submitted)
+
+                # 페이지도 다 넘겼고 기다리는 부제목도 없으면 그 키워드는 완료
+                for keyword in keywords:
+                    if keyword not in finished and keyword not in paging and not waiting[keyword]:
+                        finished.add(keyword)
+                        if on_keyword_done:
+                            on_keyword_done(keyword, results[keyword])
+        finally:
+            # Ctrl+C 등으로 중간에 멈추면 아직 시작하지 않은 요청은 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        saved = stats["articles"] - stats["unique_articles"]
+        print(
+            f"[CrawlScheduler] 완료: 페이지 {stats['pages']}개 / 기사 {stats['articles']}개 "
+            f"(고유 {stats['unique_articles']}개, 키워드 간 중복 {saved}개는 한 번만 요청)"
+        )
+        return results
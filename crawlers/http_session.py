@@ -0,0 +1,128 @@
+# crawlers/http_session.py
+
+import random
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# -------------------------------------------------------------------------
+# [성능 개선] 커넥션 풀(Connection Pool)을 가진 공용 HTTP 세션
+# requests.get()을 그냥 부르면 요청할 때마다 TCP+TLS 연결을 새로 맺습니다.
+# Session을 재사용하면 Keep-Alive로 연결을 돌려쓸 수 있어서 기사 하나당 지연 시간이 크게 줄어듭니다.
+# 또한 5xx 응답이나 연결 끊김 같은 '일시적인' 오류는 지수 백오프 + 지터로 다시 시도합니다.
+#
+# [재시도는 세션 밖에서]
+# 처음에는 urllib3의 Retry로 세션 안에서 재시도했는데, 그러면 재시도 요청이 속도 제한기(rate_limiter.py)를
+# 거치지 않고 나가서 토큰도 쓰지 않고, 제한기는 마지막 응답과 합쳐진 지연 시간만 보게 됩니다.
+# 그래서 공용 세션은 재시도하지 않고, 크롤러의 _get이 시도할 때마다 토큰을 받으며
+# RETRY_STATUS_CODES / 연결 오류일 때 backoff_delay()만큼 쉬고 다시 요청합니다.
+# -------------------------------------------------------------------------
+
+DEFAULT_POOL_SIZE = 20          # 호스트당 유지할 최대 연결 수
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.5    # 0.5s, 1s, 2s ... 로 대기 시간이 늘어남
+DEFAULT_BACKOFF_JITTER = 0.3    # 여러 요청이 동시에 재시도하며 몰리지 않도록 무작위 지연 추가
+
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+
+def _accept_encoding() -> str:
+    """
+    brotli(br)는 urllib3가 디코딩할 수 있을 때(brotli 패키지 설치 시)만 요청합니다.
+    설치되어 있지 않은데 br을 요청하면 압축된 바이트를 그대로 받게 되기 때문입니다.
+    """
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None,
+                  backoff_factor: float = DEFAULT_BACKOFF_FACTOR) -> float:
+    """
+    attempt번째(1부터) 재시도 전에 기다릴 시간(초)입니다.
+    서버가 Retry-After(초)를 알려줬으면 그 값을, 아니면 지수 백오프(0.5s, 1s, 2s ...) + 지터를 사용합니다.
+    """
+    if retry_after and retry_after.strip().isdigit():
+        return float(retry_after.strip())
+    return backoff_factor * (2 ** (attempt - 1)) + random.uniform(0, DEFAULT_BACKOFF_JITTER)
+
+
+def _build_retry(max_retries: int, backoff_factor: float) -> Retry:
+    options = dict(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        backoff_factor=backoff_factor,
+        respect_retry_after_header=True,
+        raise_on_status=False,  # 재시도를 다 써도 예외 대신 마지막 응답을 돌려줌
+    )
+    try:
+        return Retry(backoff_jitter=DEFAULT_BACKOFF_JITTER, **options)
+    except TypeError:
+        # urllib3 1.x 에는 backoff_jitter 옵션이 없음
+        return Retry(**options)
+
+
+def _mount_adapter(session: requests.Session, pool_size: int, max_retries: int, backoff_factor: float) -> None:
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=_build_retry(max_retries, backoff_factor) if max_retries else 0,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def create_session(pool_size: int = DEFAULT_POOL_SIZE,
+                   max_retries: int = 0,
+                   backoff_factor: float = DEFAULT_BACKOFF_FACTOR) -> requests.Session:
+    """
+    커넥션 풀 크기와 재시도 정책이 설정된 새 Session을 만듭니다.
+    max_retries를 주면 urllib3가 세션 안에서 재시도합니다. (속도 제한기를 거치지 않으므로 크롤러에는 쓰지 않음)
+    """
+    session = requests.Session()
+    _mount_adapter(session, pool_size, max_retries, backoff_factor)
+    session.headers.update({
+        "Accept-Encoding": _accept_encoding(),
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+_shared_session: requests.Session | None = None
+_shared_pool_size = 0
+_shared_lock = threading.Lock()
+
+
+def get_shared_session(pool_size: int | None = None) -> requests.Session:
+    """
+    [싱글톤] 프로세스 안에서 하나의 세션(=하나의 커넥션 풀)을 공유합니다.
+    CLI(TIDIED)와 Streamlit 앱의 크롤러가 모두 이 세션을 사용합니다.
+
+    pool_size: 호스트당 연결 수가 최소 이만큼은 되어야 할 때 넘깁니다. (동시에 요청하는 스레드 수)
+    풀보다 스레드가 많으면 urllib3가 남는 연결을 버려서("Connection pool is full") 매번 연결을 새로 맺게 됩니다.
+    풀은 커지기만 하고 줄어들지 않으며, 커질 때 지금 들고 있던 연결은 새 풀로 옮겨지지 않습니다.
+    """
+    global _shared_session, _shared_pool_size
+    if _shared_session is not None and (pool_size is None or pool_size <= _shared_pool_size):
+        return _shared_session
+    with _shared_lock:
+        wanted = max(DEFAULT_POOL_SIZE, pool_size or 0)
+        if _shared_session is None:
+            _shared_session = create_session(pool_size=wanted)
+            _shared_pool_size = wanted
+        elif wanted > _shared_pool_size:
+            _mount_adapter(_shared_session, wanted, 0, DEFAULT_BACKOFF_FACTOR)
+            _shared_pool_size = wanted
+    return _shared_session
@@ -0,0 +1,120 @@
+# crawlers/incremental_crawler.py
+
+import time
+from typing import Callable, Optional
+
+from crawlers.naver_crawler import NaverCrawler
+from crawlers.naver_parser import SORT_LATEST
+from crawlers.seen_store import SeenStore, seen_path
+from models.article import Article
+from utils.url_utils import canonical_url
+
+# -------------------------------------------------------------------------
+# [증분 수집] 새로 올라온 기사만 수집하는 감시(watch) 모드
+# 같은 키워드를 반복해서 돌릴 때마다 모든 페이지와 모든 부제목을 처음부터 다시 받았습니다.
+# 증분 수집은 검색 결과를 '최신순'(sort=1)으로 요청합니다. (기본 검색은 관련도순이라 페이지 순서가 날짜와 무관)
+# 최신순이면 이미 본 기사만 있는 페이지가 나왔을 때 그 뒤 페이지도 이미 본 기사입니다.
+#
+# 한 번의 수집(cycle)은
+#   1. 페이지를 넘기다가 '새 기사가 하나도 없는 페이지'를 만나면 바로 멈추고,
+#   2. 새 기사(delta)만 부제목을 받은 뒤,
+#   3. 내보내고(on_delta, 북마크 저장),
+#   4. 키워드별 '본 기사' 저장소(seen_store.py)에 기록합니다.
+# 내보낸 다음에 기록하므로, 도중에 멈춰도 다음 번에 그 기사를 다시 받습니다.
+# 부제목 요청이 실패한 기사는 이번 결과에서 빼고 기록하지 않으므로, 다음 번에 다시 시도합니다.
+# -------------------------------------------------------------------------
+
+class IncrementalCrawler:
+    """
+    사용 예)
+        watcher = IncrementalCrawler(NaverCrawler(), seen_dir="data/seen")
+        new_articles = watcher.cycle("삼성전자", max_pages=5)        # 한 번만
+        watcher.watch(["삼성전자", "반도체"], interval=600)            # 10분마다 계속
+    """
+
+    def __init__(self, crawler: NaverCrawler, seen_dir: str = "data/seen", max_workers: int = 8,
+                 fetch_content: bool = True, manager=None, save_folder: str | None = None):
+        self.crawler = crawler
+        self.seen_dir = seen_dir
+        self.max_workers = max_workers
+        self.fetch_content = fetch_content
+        # 매니저를 넘기면 새 기사를 save_folder 북마크 폴더에 자동으로 추가
+        self.manager = manager
+        self.save_folder = save_folder
+        self._stores: dict[str, SeenStore] = {}
+
+    def store(self, keyword: str) -> SeenStore:
+        if keyword not in self._stores:
+            self._stores[keyword] = SeenStore(seen_path(self.seen_dir, keyword))
+        return self._stores[keyword]
+
+    def cycle(self, keyword: str, max_pages: int = 5,
+              on_delta: Optional[Callable[[str, list[Article]], None]] = None) -> list[Article]:
+        """
+        한 번 수집해서 지난번 이후 새로 나온 기사만 반환합니다. (처음이면 max_pages 전체가 새 기사)
+        on_delta(키워드, 새 기사 리스트)는 '본 기사'로 기록하기 전에 호출됩니다. (새 기사가 없어도 호출)
+        """
+        store = self.store(keyword)
+        delta: list[Article] = []
+        delta_keys: set[str] = set()
+
+        # 최신순이어야 '이미 본 기사만 있는 페이지에서 멈추기'가 맞음 (관련도순이면 뒤 페이지에 새 기사가 있을 수 있음)
+        pages = self.crawler.iter_search_pages(keyword, max_pages, sort=SORT_LATEST)
+        for page_articles in pages:
+            new = []
+            for article in page_articles:
+                key = canonical_url(article.url)
+                if key not in delta_keys and article.url not in store:
+                    delta_keys.add(key)
+                    new.append(article)
+            delta.extend(new)
+            if page_articles and not new:
+                # 이미 본 기사만 있는 페이지 -> 뒤쪽 페이지는 요청하지 않음
+                print("  -> 이미 본 기사만 있는 페이지라서 여기서 멈춥니다.")
+                pages.close()
+                break
+
+        failed = 0
+        if self.fetch_content and delta:
+            contents = self.crawler.get_contents([a.url for a in delta], max_workers=self.max_workers)
+            fetched = []
+            for article, content in zip(delta, contents):
+                # None = 요청 실패 (받았는데 부제목이 없는 기사는 "")
+                if content is None:
+                    failed += 1
+                    continue
+                article.content = content
+                fetched.append(article)
+            delta = fetched
+
+        # 내보내기/저장이 끝난 '뒤에' 기록해야, 그 사이에 멈춰도 새 기사를 잃어버리지 않음
+        if self.manager is not None and delta:
+            self.manager.save_bookmarks(delta, self.save_folder)
+        if on_delta:
+            on_delta(keyword, delta)
+        store.add_many(a.url for a in delta)
+        store.save()
+
+        retry = f", 부제목 요청 실패 {failed}개는 다음에 다시 시도" if failed else ""
+        print(f"[IncrementalCrawler] '{keyword}': 새 기사 {len(delta)}개{retry} (지금까지 본 기사 {len(store)}개)")
+        return delta
+
+    def watch(self, keywords: list[str], max_pages: int = 5, interval: float = 600,
+              cycles: int | None = None,
+              on_delta: Optional[Callable[[str, list[Article]], None]] = None) -> None:
+        """
+        interval초마다 모든 키워드를 cycle() 합니다. (cycles를 주면 그 횟수만큼만, 아니면 Ctrl+C까지)
+        on_delta(키워드, 새 기사 리스트)는 키워드 하나가 끝날 때마다, 그 기사들을 기록하기 전에 호출됩니다.
+        """
+        done = 0
+        while cycles is None or done < cycles:
+            started = time.monotonic()
+            for keyword in keywords:
+                self.cycle(keyword, max_pages, on_delta=on_delta)
+            done += 1
+            if cycles is not None and done >= cycles:
+                break
+            # 수집에 걸린 시간을 빼고 남은 만큼만 쉼 (주기가 밀리지 않도록)
+            wait = max(0.0, interval - (time.monotonic() - started))
+            print(f"[IncrementalCrawler] {done}회차 완료. {wait:.0f}초 뒤에 다시 확인합니다...")
+            time.sleep(wait)
@@ -1,13 +1,24 @@
 # crawlers/naver_crawler.py
 
 import requests
-from bs4 import BeautifulSoup
 import time 
+from typing import Iterator
 import os
+from urllib.parse import urlsplit
 
 # [WEEK03 모듈] 직접 만든 모듈 불러오기
 from crawlers.base_crawler import NewsCrawler 
+from crawlers.http_session import DEFAULT_MAX_RETRIES, RETRY_STATUS_CODES, backoff_delay, get_shared_session
+from crawlers.article_cache import ArticleCache
+from crawlers.rate_limiter import AdaptiveRateLimiter, get_shared_rate_limiter
+from crawlers.parse_pool import ParsePool
+from crawlers.naver_parser import (
+    SEARCH_URL, SORT_RELEVANCE, build_search_params, parse_search_page, extract_subtitle,
+    extract_subtitle_fast, extract_summary_fast, find_summary_end, charset_from_content_type
+)
 from models.article import Article
+from utils.metrics import get_metrics
+from utils.selector_cache import SelectorCache, get_shared_selector_cache
 
 class NaverCrawler(NewsCrawler):
     """
@@ -19,97 +30,149 @@ class NaverCrawler(NewsCrawler):
     # 처음엔 고정된 이름인 줄 알았으나, 크롤링이 갑자기 안 되는 문제를 겪고 나서
     # 이를 상수로 빼서 관리하도록 구조를 변경했습니다.
     # 변경 시 utils/naver_class_finder.py 도구로 찾아내어 여기에 업데이트해야 합니다.
+    # -> [자동 복구] 이제는 제목을 못 찾으면 받은 페이지에서 바로 탐지해서 선택자 캐시에 저장합니다.
+    #    이 상수는 캐시가 비었거나 오래됐을 때 처음 시도하는 기본값입니다.
     # -------------------------------------------------------------------------
     NEWS_TITLE_CLASS = "fender-ui_228e3bd1"
+    TITLE_SELECTOR_KEY = "news_title"
+    # 연결 오류/5xx 응답일 때 다시 시도할 횟수 (_get 참고)
+    MAX_RETRIES = DEFAULT_MAX_RETRIES
 
-    def __init__(self):
+    def __init__(self, session: requests.Session | None = None,
+                 rate_limiter: AdaptiveRateLimiter | None = None,
+                 cache: ArticleCache | None = None, fast_extract: bool = True,
+                 parse_pool: ParsePool | None = None, selector_cache: SelectorCache | None = None):
         super().__init__()
+        # [성능 개선] 요청마다 연결을 새로 맺지 않도록 커넥션 풀을 가진 세션을 사용합니다.
+        # 따로 넘겨주지 않으면 프로세스 전체가 공유하는 세션을 씁니다.
+        self.session = session if session is not None else get_shared_session()
+        # [성능 개선] 고정된 time.sleep(1) 대신 호스트별 적응형 속도 제한기를 거쳐서 요청합니다.
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_shared_rate_limiter()
+        # [성능 개선] 기사 페이지 디스크 캐시 (None이면 캐시 없이 매번 다운로드)
+        self.cache = cache
+        # [성능 개선] 빠른 추출 모드: 원본 바이트 + lxml + 필요한 태그만 파싱 + 부제목을 찾으면 다운로드 중단
+        self.fast_extract = fast_extract
+        # [성능 개선] 파싱을 다른 프로세스에서 하는 풀 (None이면 요청한 스레드에서 바로 파싱)
+        self.parse_pool = parse_pool
+        # [자동 복구] 지금 유효한 제목 클래스를 기억하는 캐시 (다른 크롤러와 공유)
+        self.selectors = selector_cache if selector_cache is not None else get_shared_selector_cache()
+        # [계측] 요청 시간/바이트/캐시 결과 등을 기록할 곳 (utils/metrics.py)
+        self.metrics = get_metrics()
+
+    def _get(self, url: str, extra_headers: dict | None = None, **kwargs) -> requests.Response:
+        """
+        [내부 함수] 모든 HTTP 요청이 지나가는 통로입니다.
+        요청 전에 속도 제한기에서 토큰을 받고, 응답 상태/지연 시간을 다시 알려줍니다.
+        연결 오류나 5xx 응답은 여기서 최대 MAX_RETRIES번 다시 시도하는데,
+        재시도도 한 번의 요청이므로 매번 토큰을 받고 결과를 알려줍니다. (공용 세션은 스스로 재시도하지 않음)
+        """
+        headers = {**self.headers, **extra_headers} if extra_headers else self.headers
+        host = urlsplit(url).hostname or ""
+        for attempt in range(self.MAX_RETRIES + 1):
+            self.rate_limiter.acquire(url)
+            started = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, **kwargs)
+            except requests.RequestException as e:
+                self.rate_limiter.record(url, None, time.perf_counter() - started)
+                self.metrics.inc("http_responses_total", host=host, status="error")
+                transient = isinstance(e, (requests.ConnectionError, requests.Timeout))
+                if not transient or attempt == self.MAX_RETRIES:
+                    raise
+                time.sleep(backoff_delay(attempt + 1))
+                continue
+
+            latency = time.perf_counter() - started
+            self.rate_limiter.record(url, response.status_code, latency)
+            self.metrics.observe("fetch_seconds", latency, host=host)
+            self.metrics.inc("http_responses_total", host=host, status=response.status_code)
+            if response.status_code in RETRY_STATUS_CODES and attempt < self.MAX_RETRIES:
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                time.sleep(backoff_delay(attempt + 1, retry_after))
+                continue
+            return response
 
     # [WEEK05 오버라이딩] 부모의 메서드를 재정의
     def search(self, keyword: str, pages: int = 2) -> list[Article]:
+        """
+        모든 페이지의 결과를 한 번에 리스트로 돌려줍니다. (iter_search를 모아주는 얇은 포장)
+        """
+        return list(self.iter_search(keyword, pages))
+
+    def iter_search(self, keyword: str, pages: int = 2) -> Iterator[Article]:
+        """
+        [제너레이터] 필터를 통과한 기사를 찾는 즉시 하나씩 내보냅니다(yield).
+        마지막 페이지까지 기다리지 않아도 첫 결과를 바로 화면에 보여줄 수 있고,
+        중간에 반복을 멈추면(break) 남은 페이지는 요청하지 않습니다.
+        """
+        for page_articles in self.iter_search_pages(keyword, pages):
+            yield from page_articles
+
+    def iter_search_pages(self, keyword: str, pages: int = 2,
+                          sort: str = SORT_RELEVANCE) -> Iterator[list[Article]]:
+        """
+        [제너레이터] 검색 결과를 '페이지 단위'로 내보냅니다. (필터를 통과한 기사 리스트를 페이지마다 하나씩)
+        iter_search는 이 리스트를 기사 하나씩 풀어서 내보내며, 반복을 멈추면 다음 페이지는 요청하지 않습니다.
+        sort는 정렬 순서입니다. (기본 관련도순, naver_parser.SORT_LATEST = 최신순)
+        """
         print(f"\n[NaverCrawler] '{keyword}' 검색 시작 (언론사 홈 필터링 추가됨)...")
         
-        articles: list[Article] = []
+        collected = 0
         visited_urls = set()
         
         for page in range(pages):
-            start_num = (page * 10) + 1
-            params = {
-                "where": "news", "query": keyword, "sm": "tab_pge",
-                "sort": "0", "start": start_num
-            }
-            
             # [예외 처리] 네트워크 통신은 언제든 실패할 수 있으므로 try-except 필수!!!
             try:
-                response = requests.get(
-                    "https://search.naver.com/search.naver",
-                    params=params, headers=self.headers, timeout=10
-                )
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                # 1순위: 우리가 찾아낸 동적 클래스 / 2순위: 혹시 몰라 남겨둔 표준 클래스
-                title_tags = soup.select(f"a.{self.NEWS_TITLE_CLASS}")
-                if not title_tags:
-                    title_tags = soup.select("a.news_tit")
-                
-                if not title_tags:
-                    print(f"  -> {page + 1}페이지: 검색 결과 없음")
-                    break
-
-                for title_tag in title_tags:
-                    title = ""
-                    target_link = ""
-                
-                    extracted_title = title_tag.get('title')
-                    if extracted_title:
-                        title = str(extracted_title)
-                    else:
-                        title = title_tag.get_text(strip=True)
-                    target_link = str(title_tag['href'])
-                    
-                    # [하이브리드 전략] 링크를 정확히 찾기 위해 부모 태그까지 거슬러 올라가 탐색
-                    container = title_tag.find_parent("div")
-                    if not container:
-                        container = title_tag.find_parent("li")
-                    
-                    if container:
-                        info_links = container.select("a") 
-                        for link in info_links:
-                            link_href = str(link.get('href', ''))
-                            if "n.news.naver.com" in link_href:
-                                target_link = link_href 
-                                break
-                    
-
-                    # ---------------- [데이터 필터링] ----------------
-                    ## 1. http로 시작 안 하면 버림
-                    if not target_link.startswith("http"):
-                        continue
-                    
-                    ## 2. [추가된 필터] 언론사 구독 페이지(press)는 기사가 아니므로 제외!
-                    if "https://media.naver.com/press/" in target_link:
-                        continue
-
-                    ## 3. 이미 수집한 링크면 버림
-                    if target_link in visited_urls:
-                        continue
-                        
-                    ## 4. 제목이 "네이버뉴스"면 버림
-                    if title == "네이버뉴스":
-                        continue
-
-                    ## 최종 저장
-                    article = Article(title=title, url=target_link, source="Naver")
-                    articles.append(article)
-                    visited_urls.add(target_link)
-
-                print(f"  -> {page + 1}페이지 완료: {len(title_tags)}개 감지 -> {len(articles)}개 유효 수집")
-                time.sleep(1)
-
+                detected, page_articles = self.fetch_search_page(keyword, page, visited_urls, sort)
             except Exception as e:
                 print(f"  -> [오류] {e}")
+                continue
+
+            if not detected:
+                print(f"  -> {page + 1}페이지: 검색 결과 없음")
+                break
+
+            collected += len(page_articles)
+            print(f"  -> {page + 1}페이지 완료: {detected}개 감지 -> {collected}개 유효 수집")
+            yield page_articles
+
+    def fetch_search_page(self, keyword: str, page: int, visited_urls: set,
+                          sort: str = SORT_RELEVANCE) -> tuple[int, list[Article]]:
+        """
+        검색 결과 한 페이지(page는 0부터)를 받아서 (감지된 제목 태그 수, 새 기사 리스트)를 반환합니다.
+        네트워크 오류는 예외로 그대로 전달합니다. (여러 키워드를 함께 돌리는 스케줄러도 이 함수를 사용)
+        """
+        response = self._get(SEARCH_URL, params=build_search_params(keyword, page, sort), timeout=10)
+        self.metrics.observe("fetch_bytes", len(response.content), kind="search")
+        cached_class = self.selectors.get(self.TITLE_SELECTOR_KEY)
+        title_class = cached_class or self.NEWS_TITLE_CLASS
+        if self.parse_pool is not None:
+            detected, rows, used_class = self.parse_pool.parse_search(
+                response.text, title_class, visited_urls, keyword
+            )
+            articles = [Article(title=title, url=url, source=source) for title, url, source in rows]
+        else:
+            # [리팩토링] 파싱/필터링 규칙은 naver_parser 모듈에서 공통으로 관리
+            detected, articles, used_class = parse_search_page(response.text, title_class, visited_urls, keyword)
+        self.remember_title_class(title_class, used_class, cached_class)
+        return detected, articles
 
-        return articles
+    def remember_title_class(self, tried: str, used: str | None, cached: str | None) -> None:
+        """
+        파싱 결과를 선택자 캐시에 반영합니다. (tried: 시도한 클래스, cached: 캐시에서 꺼낸 값)
+        - 시도한 클래스가 맞았으면 '확인됨'으로 저장 (이미 유효한 값이면 그대로)
+        - 새 클래스를 탐지했으면 저장해서 다음 요청부터 사용
+        - 아무것도 못 찾았으면 실패만 기록 (진짜로 결과가 없는 페이지일 수도 있으므로 캐시는 유지)
+        """
+        if used == tried:
+            if cached != tried:
+                self.selectors.put(self.TITLE_SELECTOR_KEY, tried)
+        elif used is None:
+            self.selectors.record_detection(self.TITLE_SELECTOR_KEY, None)
+        elif used != "news_tit":
+            print(f"  -> 🔧 [자동 복구] 제목 클래스가 바뀌었습니다: '{tried}' -> '{used}' (다음 요청부터 사용)")
+            self.selectors.record_detection(self.TITLE_SELECTOR_KEY, used)
     
 
 
@@ -119,49 +182,91 @@ class NaverCrawler(NewsCrawler):
         단순히 태그 하나만 찾으면 될 줄 알았으나, 기사마다/환경마다(PC vs 모바일) 
         HTML 구조가 달라서 부제목을 못 가져오는 경우가 많았습니다.
         이를 해결하기 위해 Plan A -> B 로 이어지는 2단계 전략을 수립했습니다!!
+        (Plan A/B의 자세한 내용은 crawlers/naver_parser.py의 extract_subtitle 참고)
+
+        반환값: 부제목 / 받았지만 부제목이 없으면 "" / 요청이 실패하면 None
+        (증분 수집은 None인 기사만 '다음에 다시 받을 기사'로 남겨 둡니다)
         """
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status() 
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # -----------------------------------------------------------------
-            # [Plan A] 알려진 클래스 이름으로 찾기
-            # 시행착오: 처음엔 'media_end_head_headline'도 포함했으나, 
-            # 이것이 '기사 제목'을 가리키는 바람에 부제목 자리에 제목이 중복 저장되는 
-            # 버그가 발생하여 삭제했습니다.
-            # -----------------------------------------------------------------
-            candidates = ["media_end_summary", "sub_title", "sh_sub_head"]
-
-            for class_name in candidates:
-                element = soup.find(class_=class_name)
-                if element and element.get_text(strip=True):
-                    return element.get_text(strip=True)
-
-            # -----------------------------------------------------------------
-            # [Plan B] 클래스가 없을 때: 본문 내의 굵은 글씨 찾기
-            # 시행착오 1: 모바일과 PC 버전의 본문 ID가 다름 (#dic_area vs #articleBodyContents)
-            # 시행착오 2: find(["<strong", "<b>"]) 처럼 꺽쇠를 넣는 문법 실수로 인해
-            # 한동안 태그를 못 찾아서 고생함. -> find(["strong", "b"]) 로 수정하여 해결.
-            # -----------------------------------------------------------------
-            article_body = soup.select_one("#dic_area")
-            
-            # 본문 영역을 못 찾으면 다른 ID(articleBodyContents)일 수도 있음 (PC 버전 대응)
-            if not article_body:
-                article_body = soup.select_one("#articleBodyContents")
-
-            if article_body:
-                # 1. 굵은 글씨 태그가 있는지 확인 (태그 이름만 넣기!)
-                first_bold = article_body.find(["strong", "b"])
-                
-                if first_bold and first_bold.get_text(strip=True):
-                    text = first_bold.get_text(strip=True)
-                    # 너무 길지 않으면(200자 미만) 부제목으로 인정
-                    if len(text) < 200:
-                        return text
+            # [캐시] 유효 시간 안이면 네트워크도, 파싱도 하지 않고 저장해 둔 부제목을 반환
+            entry = self.cache.lookup(url) if self.cache else None
+            if entry and entry.is_fresh(self.cache.ttl):
+                self.cache.count("hits")
+                self.metrics.inc("article_cache_total", result="hit")
+                return entry.subtitle or ""
 
-            return None
+            # 유효 시간이 지났다면 '바뀌었을 때만 보내줘'라는 조건부 요청을 보냄
+            conditional = {}
+            if entry:
+                if entry.etag:
+                    conditional["If-None-Match"] = entry.etag
+                if entry.last_modified:
+                    conditional["If-Modified-Since"] = entry.last_modified
+
+            response = self._get(url, extra_headers=conditional, timeout=10, stream=self.fast_extract)
+
+            if entry and response.status_code == 304:
+                response.close()
+                self.cache.refresh(url)
+                self.cache.count("revalidated")
+                self.metrics.inc("article_cache_total", result="revalidated")
+                return entry.subtitle or ""
+
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                # 스트리밍 응답은 본문을 다 읽거나 닫기 전까지 연결을 붙잡고 있으므로, 에러면 바로 풀에 돌려놓음
+                response.close()
+                raise
+
+            if self.fast_extract:
+                subtitle, body = self._read_subtitle_streaming(response)
+            else:
+                body = response.content
+                self.metrics.observe("fetch_bytes", len(body), kind="article")
+                subtitle = extract_subtitle(response.text)
+
+            if self.cache:
+                self.cache.count("misses")
+                self.metrics.inc("article_cache_total", result="miss")
+                self.cache.store(
+                    url, subtitle, body=body,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            return subtitle or ""
 
         except Exception as e:
-            return None
\ No newline at end of file
+            return None
+
+    def _read_subtitle_streaming(self, response: requests.Response) -> tuple[str | None, bytes | None]:
+        """
+        [빠른 추출 모드] 응답 본문을 조금씩(chunk) 받으면서 부제목을 찾습니다.
+        1순위 후보(media_end_summary)가 완전히 도착했고 글자가 있으면 나머지는 받지 않고 연결을 닫습니다.
+        반환값: (부제목, 전체 본문 바이트) - 중간에 멈췄다면 본문은 None (캐시에 반쪽짜리 HTML을 넣지 않기 위함)
+        """
+        # response.text처럼 인코딩을 '추측'하지 않고, 헤더에 명시된 charset만 사용
+        encoding = charset_from_content_type(response.headers.get("Content-Type"))
+        buffer = bytearray()
+        summary_checked = False
+
+        try:
+            for chunk in response.iter_content(chunk_size=16 * 1024):
+                buffer += chunk
+                if summary_checked:
+                    continue
+                end = find_summary_end(buffer)
+                if end != -1:
+                    summary_checked = True
+                    text = extract_summary_fast(bytes(buffer[:end]), encoding)
+                    if text:
+                        return text, None
+        finally:
+            response.close()
+            # 조기 종료했다면 실제로 받은 만큼만 기록 (받지 않고 아낀 바이트가 그만큼 줄어듦)
+            self.metrics.observe("fetch_bytes", len(buffer), kind="article")
+
+        body = bytes(buffer)
+        if self.parse_pool is not None:
+            return self.parse_pool.parse_article(body, encoding), body
+        return extract_subtitle_fast(body, encoding), body
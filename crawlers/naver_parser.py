@@ -0,0 +1,275 @@
+# crawlers/naver_parser.py
+
+import re
+import time
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from models.article import Article
+from utils.metrics import get_metrics
+from utils.naver_class_finder import detect_title_class
+from crawlers.search_extractor import AUTO_DETECT_MIN_COUNT, FALLBACK_TITLE_CLASS, accept_link, get_extractor
+
+# [성능 개선] lxml(C 구현)이 설치되어 있으면 빠른 추출 모드에서 사용하고, 없으면 기본 파서로 대체합니다.
+try:
+    import lxml  # noqa: F401
+    FAST_PARSER = "lxml"
+except ImportError:
+    FAST_PARSER = "html.parser"
+
+# -------------------------------------------------------------------------
+# [리팩토링] 파싱 규칙 분리
+# 동기 크롤러(NaverCrawler)와 비동기 크롤러(AsyncNaverCrawler)가
+# '똑같은 규칙'으로 결과를 만들어야 하므로, HTML을 해석하는 부분만 이 모듈로 떼어냈습니다.
+# 네트워크 요청은 각 크롤러가 담당하고, 여기서는 문자열(HTML)만 다룹니다.
+# -------------------------------------------------------------------------
+
+SEARCH_URL = "https://search.naver.com/search.naver"
+
+# 부제목 후보 클래스 (get_content의 Plan A)
+SUBTITLE_CLASSES = ["media_end_summary", "sub_title", "sh_sub_head"]
+
+
+# 검색 결과 정렬 (네이버 sort 파라미터)
+SORT_RELEVANCE = "0"   # 관련도순 (기본)
+SORT_LATEST = "1"      # 최신순 (증분 수집처럼 '앞 페이지 = 새 기사'여야 할 때)
+
+
+def build_search_params(keyword: str, page: int, sort: str = SORT_RELEVANCE) -> dict:
+    """
+    page(0부터 시작)번째 검색 결과 페이지의 요청 파라미터를 만듭니다.
+    """
+    return {
+        "where": "news", "query": keyword, "sm": "tab_pge",
+        "sort": sort, "start": (page * 10) + 1
+    }
+
+
+def parse_search_results(html: str, title_class: str, visited_urls: set,
+                         parser: str = "html.parser") -> tuple[int, list[Article]]:
+    """
+    검색 결과 페이지 하나를 해석하여 (감지된 제목 태그 수, 새로 수집된 Article 리스트)를 반환합니다.
+    visited_urls는 여러 페이지에 걸친 중복 제거를 위해 호출한 쪽과 공유하며, 이 함수가 갱신합니다.
+    감지된 태그 수가 0이면 '검색 결과 없음'을 뜻합니다.
+    parser는 BeautifulSoup 파서 이름입니다. (벤치마크에서 lxml/html5lib과 비교할 때 사용)
+    """
+    detected, articles, _ = parse_search_page(html, title_class, visited_urls, parser=parser)
+    return detected, articles
+
+
+def parse_search_page(html: str, title_class: str, visited_urls: set, keyword: str | None = None,
+                      parser: str = "html.parser") -> tuple[int, list[Article], str | None]:
+    """
+    parse_search_results와 같지만, 실제로 제목을 찾은 클래스 이름을 함께 반환합니다.
+    keyword를 주면 title_class와 news_tit가 모두 실패했을 때 '같은 soup'에서 클래스를 자동 탐지합니다.
+    (네이버가 클래스 이름을 바꿔도 추가 요청 없이 그 페이지부터 바로 복구)
+    반환값: (감지된 제목 태그 수, Article 리스트, 사용한 클래스 - 못 찾았으면 None)
+    """
+    started = time.perf_counter()
+    metrics = get_metrics()
+    soup = BeautifulSoup(html, parser)
+
+    # [성능 개선] <a> 태그를 한 번만 훑는 추출기 (crawlers/search_extractor.py)
+    detected, articles, used_class = get_extractor(title_class).extract(soup, visited_urls, keyword, metrics)
+
+    metrics.inc("articles_collected_total", len(articles))
+    metrics.observe("parse_seconds", time.perf_counter() - started, stage="search")
+    return detected, articles, used_class
+
+
+def extract_search_results_legacy(soup: BeautifulSoup, title_class: str, visited_urls: set,
+                                  keyword: str | None = None) -> tuple[int, list[Article], str | None]:
+    """
+    한 번 훑기 추출기 이전의 추출 방식입니다. (제목마다 부모 컨테이너 전체를 다시 select)
+    결과가 같은지, 얼마나 빨라졌는지 벤치마크(benchmarks/bench_parsers.py)에서 비교할 때만 사용합니다.
+    """
+    metrics = get_metrics()
+
+    # 1순위: 우리가 찾아낸 동적 클래스 / 2순위: 혹시 몰라 남겨둔 표준 클래스 / 3순위: 자동 탐지
+    used_class = title_class
+    title_tags = soup.select(f"a.{title_class}")
+    if not title_tags:
+        used_class = FALLBACK_TITLE_CLASS
+        title_tags = soup.select(f"a.{FALLBACK_TITLE_CLASS}")
+    if not title_tags:
+        used_class = None
+        found = detect_title_class(soup, keyword, AUTO_DETECT_MIN_COUNT) if keyword else None
+        if found:
+            used_class = found[0]
+            title_tags = soup.find_all("a", class_=used_class)
+
+    articles: list[Article] = []
+    for title_tag in title_tags:
+        extracted_title = title_tag.get('title')
+        if extracted_title:
+            title = str(extracted_title)
+        else:
+            title = title_tag.get_text(strip=True)
+        target_link = str(title_tag['href'])
+
+        # [하이브리드 전략] 링크를 정확히 찾기 위해 부모 태그까지 거슬러 올라가 탐색
+        container = title_tag.find_parent("div")
+        if not container:
+            container = title_tag.find_parent("li")
+
+        if container:
+            info_links = container.select("a")
+            for link in info_links:
+                link_href = str(link.get('href', ''))
+                if "n.news.naver.com" in link_href:
+                    target_link = link_href
+                    break
+
+        # [데이터 필터링] 규칙은 한 번 훑기 추출기와 공유
+        if accept_link(title, target_link, visited_urls, metrics):
+            articles.append(Article(title=title, url=target_link, source="Naver"))
+            visited_urls.add(target_link)
+
+    return len(title_tags), articles, used_class
+
+
+def _plan_a(soup: BeautifulSoup) -> str | None:
+    # -----------------------------------------------------------------
+    # [Plan A] 알려진 클래스 이름으로 찾기
+    # 시행착오: 처음엔 'media_end_head_headline'도 포함했으나,
+    # 이것이 '기사 제목'을 가리키는 바람에 부제목 자리에 제목이 중복 저장되는
+    # 버그가 발생하여 삭제했습니다.
+    # -----------------------------------------------------------------
+    for class_name in SUBTITLE_CLASSES:
+        element = soup.find(class_=class_name)
+        if element and element.get_text(strip=True):
+            return element.get_text(strip=True)
+    return None
+
+
+def _plan_b(soup: BeautifulSoup) -> str | None:
+    # -----------------------------------------------------------------
+    # [Plan B] 클래스가 없을 때: 본문 내의 굵은 글씨 찾기
+    # 시행착오 1: 모바일과 PC 버전의 본문 ID가 다름 (#dic_area vs #articleBodyContents)
+    # 시행착오 2: find(["<strong", "<b>"]) 처럼 꺽쇠를 넣는 문법 실수로 인해
+    # 한동안 태그를 못 찾아서 고생함. -> find(["strong", "b"]) 로 수정하여 해결.
+    # -----------------------------------------------------------------
+    article_body = soup.select_one("#dic_area")
+
+    # 본문 영역을 못 찾으면 다른 ID(articleBodyContents)일 수도 있음 (PC 버전 대응)
+    if not article_body:
+        article_body = soup.select_one("#articleBodyContents")
+
+    if article_body:
+        # 1. 굵은 글씨 태그가 있는지 확인 (태그 이름만 넣기!)
+        first_bold = article_body.find(["strong", "b"])
+
+        if first_bold and first_bold.get_text(strip=True):
+            text = first_bold.get_text(strip=True)
+            # 너무 길지 않으면(200자 미만) 부제목으로 인정
+            if len(text) < 200:
+                return text
+
+    return None
+
+
+def _record_extraction(path: str, started: float) -> None:
+    """[계측] 부제목을 어느 경로(plan_a / plan_b / none)로 찾았는지와 파싱 시간을 기록합니다."""
+    metrics = get_metrics()
+    metrics.inc("extraction_total", path=path)
+    metrics.observe("parse_seconds", time.perf_counter() - started, stage="article")
+
+
+def extract_subtitle(html: str, parser: str = "html.parser") -> str | None:
+    """
+    기사 페이지 HTML에서 부제목을 뽑아냅니다. (Plan A -> Plan B)
+    """
+    started = time.perf_counter()
+    soup = BeautifulSoup(html, parser)
+    text = _plan_a(soup)
+    if text:
+        _record_extraction("plan_a", started)
+        return text
+    text = _plan_b(soup)
+    _record_extraction("plan_b" if text else "none", started)
+    return text
+
+
+# -------------------------------------------------------------------------
+# [성능 개선] 빠른 추출 모드
+# 기존 방식은 페이지 전체를 문자열로 바꾸고(response.text의 인코딩 추측 포함),
+# 전체 DOM 트리를 만든 뒤에 태그 몇 개만 찾았습니다.
+# 빠른 모드는 원본 바이트를 그대로 lxml에 넘기고, SoupStrainer로
+# 'Plan A 후보 클래스' / 'Plan B 본문 영역'에 해당하는 태그만 트리로 만듭니다.
+# -------------------------------------------------------------------------
+_PLAN_A_STRAINER = SoupStrainer(class_=SUBTITLE_CLASSES)
+_PLAN_B_STRAINER = SoupStrainer(id=["dic_area", "articleBodyContents"])
+
+# 1순위 후보(media_end_summary)를 class 속성에서 찾기 위한 바이트 패턴
+_SUMMARY_PATTERN = re.compile(rb"""<([a-zA-Z][a-zA-Z0-9]*)[^>]*\bclass\s*=\s*["'][^"']*\bmedia_end_summary\b""")
+_CHARSET_PATTERN = re.compile(r"charset=[\"']?([\w-]+)", re.IGNORECASE)
+
+
+def charset_from_content_type(content_type: str | None) -> str | None:
+    """
+    Content-Type 헤더에 charset이 '명시된' 경우에만 그 값을 반환합니다.
+    (명시되지 않았으면 None -> 파서가 <meta charset>을 보고 판단)
+    """
+    if not content_type:
+        return None
+    match = _CHARSET_PATTERN.search(content_type)
+    return match.group(1) if match else None
+
+
+def find_summary_end(buf: bytes) -> int:
+    """
+    [조기 종료 판단] 지금까지 받은 바이트(buf) 안에서 1순위 부제목 태그(media_end_summary)가
+    '닫는 태그까지' 완전히 도착했다면 그 끝 위치를, 아니면 -1을 반환합니다.
+    1순위 후보이므로 이 태그에 글자가 있으면 뒷부분을 더 받을 필요가 없습니다.
+    안쪽에 같은 이름의 태그가 들어 있을 수 있으므로(<div> 안의 <div>), 여는/닫는 태그 수를 세어서
+    '짝이 맞는' 닫는 태그를 찾습니다. (첫 번째 </div>에서 자르면 부제목 뒷부분이 잘림)
+    """
+    match = _SUMMARY_PATTERN.search(buf)
+    if not match:
+        return -1
+    open_end = buf.find(b">", match.end())
+    if open_end == -1:
+        return -1
+
+    same_tag = re.compile(rb"<(/?)" + re.escape(bytes(match.group(1))) + rb"\b[^>]*>", re.IGNORECASE)
+    depth = 1
+    for tag in same_tag.finditer(buf, open_end + 1):
+        if tag.group(1):
+            depth -= 1
+            if depth == 0:
+                return tag.end()
+        elif not tag.group(0).endswith(b"/>"):
+            depth += 1
+    return -1
+
+
+def extract_summary_fast(body: bytes, encoding: str | None = None) -> str | None:
+    """
+    1순위 후보(media_end_summary)만 빠르게 확인합니다. (조기 종료용)
+    찾지 못하면 호출한 쪽이 전체 본문으로 extract_subtitle_fast를 다시 부르므로, 성공했을 때만 기록합니다.
+    """
+    started = time.perf_counter()
+    soup = BeautifulSoup(body, FAST_PARSER, parse_only=_PLAN_A_STRAINER, from_encoding=encoding)
+    element = soup.find(class_=SUBTITLE_CLASSES[0])
+    if element and element.get_text(strip=True):
+        _record_extraction("plan_a", started)
+        return element.get_text(strip=True)
+    return None
+
+
+def extract_subtitle_fast(body: bytes, encoding: str | None = None) -> str | None:
+    """
+    extract_subtitle()과 같은 Plan A -> Plan B 규칙을 '원본 바이트'에 대해 빠르게 적용합니다.
+    Plan A가 성공하면 Plan B용 파싱은 아예 하지 않습니다.
+    """
+    started = time.perf_counter()
+    soup_a = BeautifulSoup(body, FAST_PARSER, parse_only=_PLAN_A_STRAINER, from_encoding=encoding)
+    text = _plan_a(soup_a)
+    if text:
+        _record_extraction("plan_a", started)
+        return text
+
+    soup_b = BeautifulSoup(body, FAST_PARSER, parse_only=_PLAN_B_STRAINER, from_encoding=encoding)
+    text = _plan_b(soup_b)
+    _record_extraction("plan_b" if text else "none", started)
+    return text
@@ -0,0 +1,108 @@
+# crawlers/parse_pool.py
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from crawlers.naver_parser import parse_search_page, extract_subtitle_fast
+from utils.metrics import MetricsRegistry, get_metrics, swap_metrics
+
+# -------------------------------------------------------------------------
+# [성능 개선] 파싱 전용 프로세스 풀
+# 요청은 스레드로 동시에 보내도, BeautifulSoup 파싱은 순수 파이썬이라 GIL을 잡고 있어서
+# 페이지가 빨리 도착할수록 파싱이 CPU 한 개에서 줄을 서게 됩니다.
+#
+# 파싱 모드에서는
+#   - 다운로드는 지금처럼 요청 스레드가 하고 (I/O 동시성 유지),
+#   - 받은 원본(HTML 문자열/바이트)만 프로세스 풀로 넘겨서 기존 파싱 함수를 그대로 실행하고,
+#   - soup 객체가 아니라 작은 튜플(제목, 링크, 출처)/부제목 문자열만 돌려받습니다.
+# 요청 스레드는 결과를 기다리는 동안 GIL을 놓으므로, 여러 페이지가 여러 코어에서 동시에 파싱됩니다.
+#
+# 워커에서 기록한 지표(파싱 시간, 필터링 횟수 등)는 결과와 함께 돌려받아 메인 프로세스 지표에 합칩니다.
+#
+# [시행착오 - fork 교착]
+# 리눅스 기본값(fork)으로 워커를 만들면, 워커는 첫 작업이 들어올 때 '요청 스레드가 도는 중에' 복제됩니다.
+# 그때 다른 스레드가 지표/속도 제한기 Lock을 잡고 있었다면 워커는 잠긴 Lock을 물려받아 영원히 멈춥니다.
+# 그래서 스레드가 없는 깨끗한 프로세스에서 워커를 만드는 forkserver(없으면 spawn)를 사용합니다.
+# -------------------------------------------------------------------------
+
+
+def _start_method() -> str:
+    return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _collect_metrics(fn, *args):
+    """
+    워커 프로세스에서 fn을 실행하고 (결과, 이번 작업에서 기록된 지표)를 반환합니다.
+    작업마다 새 레지스트리를 공용 자리에 놓고 기록하므로, 이전 작업의 값이 섞이지 않습니다.
+    """
+    registry = MetricsRegistry()
+    previous = swap_metrics(registry)
+    try:
+        result = fn(*args)
+    finally:
+        swap_metrics(previous)
+    return result, registry.snapshot()
+
+
+# 프로세스 풀로 넘기려면 pickle이 가능한 '모듈 최상위 함수'여야 합니다.
+def parse_search_rows(html: str, title_class: str, visited_urls: set,
+                      keyword: str | None = None) -> tuple[int, list[tuple[str, str, str]], str | None]:
+    """
+    검색 결과 페이지 -> (감지된 제목 태그 수, [(제목, 링크, 출처), ...], 사용한 클래스)
+    visited_urls는 복사본이 넘어오므로, 호출한 쪽이 돌려받은 링크로 직접 갱신해야 합니다.
+    """
+    detected, articles, used_class = parse_search_page(html, title_class, visited_urls, keyword)
+    return detected, [(a.title, a.url, a.source) for a in articles], used_class
+
+
+def parse_article_subtitle(body: bytes, encoding: str | None) -> str | None:
+    """기사 페이지 원본 바이트 -> 부제목 (extract_subtitle_fast와 같은 Plan A -> B 규칙)"""
+    return extract_subtitle_fast(body, encoding)
+
+
+class ParsePool:
+    """
+    사용 예)
+        pool = ParsePool(workers=4)
+        crawler = NaverCrawler(parse_pool=pool)
+        ...
+        pool.shutdown()
+
+    workers=0이면 프로세스를 만들지 않고 호출한 스레드에서 바로 파싱합니다. (기존 동작과 같음)
+    """
+
+    def __init__(self, workers: int | None = None):
+        self.workers = (os.cpu_count() or 1) if workers is None else max(0, workers)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context(_start_method())
+        ) if self.workers else None
+        self.metrics = get_metrics()
+
+    def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        result, snapshot = self._executor.submit(_collect_metrics, fn, *args).result()
+        self.metrics.merge(snapshot)
+        return result
+
+    def parse_search(self, html: str, title_class: str, visited_urls: set,
+                     keyword: str | None = None) -> tuple[int, list[tuple[str, str, str]], str | None]:
+        """parse_search_page와 같은 규칙. 새 링크는 visited_urls에 추가해 줍니다."""
+        detected, rows, used_class = self._run(parse_search_rows, html, title_class, set(visited_urls), keyword)
+        visited_urls.update(url for _, url, _ in rows)
+        return detected, rows, used_class
+
+    def parse_article(self, body: bytes, encoding: str | None = None) -> str | None:
+        return self._run(parse_article_subtitle, body, encoding)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
@@ -0,0 +1,171 @@
+# crawlers/rate_limiter.py
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+# -------------------------------------------------------------------------
+# [성능 개선] 고정된 time.sleep(1) 대신 '토큰 버킷 + AIMD' 속도 제한기
+#
+# [시행착오]
+# 예전엔 검색 페이지마다 무조건 1초씩 쉬었습니다. 그런데 기사 페이지는 아예 쉬지 않아서
+# 빠르게 긁으면 차단(429/403)당할 위험이 있었고, 반대로 검색은 필요 이상으로 느렸습니다.
+#
+# [동작 방식]
+# - 토큰 버킷: 호스트마다 초당 rate개의 토큰이 채워지고, 요청 1번에 토큰 1개를 씁니다.
+# - AIMD(Additive Increase / Multiplicative Decrease):
+#   응답이 건강하면 rate를 조금씩(+) 올리고,
+#   429/403 응답이나 지연 시간 급증이 보이면 rate를 크게(x) 깎습니다.
+#   → 상대 서버가 실제로 견디는 속도를 스스로 따라가게 됩니다.
+# -------------------------------------------------------------------------
+
+# 503(Service Unavailable)도 '과부하' 신호이므로 속도를 깎음 (크롤러가 재시도할 때마다 여기로 알려줌)
+THROTTLE_STATUS_CODES = (403, 429, 503)
+
+
+class TokenBucket:
+    """
+    초당 rate개씩 토큰이 채워지고, 최대 capacity개까지 쌓이는 버킷입니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """
+        토큰 1개를 '예약'하고, 그 토큰이 준비될 때까지 기다려야 하는 시간(초)을 반환합니다.
+        토큰이 모자라면 빚(음수)으로 예약해 두기 때문에, 동시에 여러 요청이 와도 순서대로 간격이 벌어집니다.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+class _HostState:
+    """호스트 하나의 버킷과 AIMD 상태를 묶어둔 내부 클래스입니다."""
+
+    def __init__(self, rate: float, burst: float):
+        self.bucket = TokenBucket(rate, burst)
+        self.avg_latency: float | None = None   # 지수 이동 평균(EWMA) 응답 시간
+        self.last_decrease = 0.0
+        self.throttled = 0                      # 속도를 줄인 횟수 (통계용)
+
+
+class AdaptiveRateLimiter:
+    """
+    [호스트별 적응형 속도 제한기]
+    모든 크롤러 요청은 요청 전에 acquire()(또는 reserve())를,
+    응답 후에 record()를 호출해야 합니다.
+    """
+
+    def __init__(self, initial_rate: float = 2.0, min_rate: float = 0.5, max_rate: float = 20.0,
+                 increase_step: float = 0.5, decrease_factor: float = 0.5,
+                 burst: float = 5.0, latency_spike_factor: float = 3.0,
+                 min_spike_latency: float = 2.0, cooldown: float = 1.0):
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step        # 건강할 때 더할 값 (Additive Increase)
+        self.decrease_factor = decrease_factor    # 문제 생기면 곱할 값 (Multiplicative Decrease)
+        self.burst = burst
+        self.latency_spike_factor = latency_spike_factor
+        self.min_spike_latency = min_spike_latency
+        self.cooldown = cooldown                  # 동시에 도착한 실패 응답들로 여러 번 깎이지 않도록
+        self._hosts: dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        return urlsplit(url).netloc.lower()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self.initial_rate, self.burst)
+            self._hosts[host] = state
+        return state
+
+    def reserve(self, url: str) -> float:
+        """
+        url의 호스트에서 토큰 1개를 예약하고 기다려야 할 시간(초)을 반환합니다.
+        (asyncio 코드에서는 이 값으로 await asyncio.sleep()을 하면 됩니다)
+        """
+        with self._lock:
+            return self._state(self._host_of(url)).bucket.reserve()
+
+    def acquire(self, url: str) -> None:
+        """[동기용] 토큰이 준비될 때까지 현재 스레드를 재웁니다."""
+        wait = self.reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+
+    def record(self, url: str, status: int | None, latency: float) -> None:
+        """
+        응답 결과를 반영하여 속도를 조절합니다.
+        status가 None이면 연결 실패(타임아웃 등)로 간주합니다.
+        """
+        with self._lock:
+            state = self._state(self._host_of(url))
+            bucket = state.bucket
+            now = time.monotonic()
+
+            spike = (
+                state.avg_latency is not None
+                and latency > self.min_spike_latency
+                and latency > state.avg_latency * self.latency_spike_factor
+            )
+
+            if status is None or status in THROTTLE_STATUS_CODES or spike:
+                # [Multiplicative Decrease] 한 번 깎은 뒤 cooldown 동안은 다시 깎지 않음
+                if now - state.last_decrease >= self.cooldown:
+                    bucket._refill(now)
+                    bucket.rate = max(self.min_rate, bucket.rate * self.decrease_factor)
+                    bucket.tokens = min(bucket.tokens, 0.0)
+                    state.last_decrease = now
+                    state.throttled += 1
+            elif status < 400:
+                # [Additive Increase]
+                bucket._refill(now)
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase_step)
+
+            # 지연 시간 평균 갱신 (급증 판정의 기준이 됨)
+            if status is not None:
+                if state.avg_latency is None:
+                    state.avg_latency = latency
+                else:
+                    state.avg_latency = 0.8 * state.avg_latency + 0.2 * latency
+
+    def stats(self) -> dict:
+        """호스트별 현재 속도(초당 요청 수)와 감속 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                host: {"rate": round(state.bucket.rate, 2), "throttled": state.throttled}
+                for host, state in self._hosts.items()
+            }
+
+
+_shared_limiter: AdaptiveRateLimiter | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter() -> AdaptiveRateLimiter:
+    """
+    [싱글톤] 같은 호스트에 대한 속도 제한은 프로세스 전체에서 공유되어야 의미가 있습니다.
+    """
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _shared_lock:
+            if _shared_limiter is None:
+                _shared_limiter = AdaptiveRateLimiter()
+    return _shared_limiter
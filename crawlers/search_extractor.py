@@ -0,0 +1,158 @@
+# crawlers/search_extractor.py
+
+from functools import lru_cache
+
+from bs4 import BeautifulSoup, Tag
+
+from models.article import Article
+from utils.metrics import MetricsRegistry, get_metrics
+from utils.naver_class_finder import detect_title_class
+
+# -------------------------------------------------------------------------
+# [성능 개선] 검색 결과 한 번 훑기(single-pass) 추출기
+# 기존 방식은 제목 태그마다
+#   find_parent("div") -> container.select("a")로 '컨테이너 전체'를 다시 훑었습니다.
+# 결과가 촘촘한 페이지에서는 컨테이너가 서로 겹쳐서 같은 부분을 몇 번씩 다시 보게 되고(거의 제곱),
+# 1순위 클래스가 없으면 soup.select를 한 번 더 돌렸습니다.
+#
+# 이 추출기는 문서의 <a> 태그를 '한 번만' 훑으면서
+#   - 1순위(title_class)/2순위(news_tit) 제목 후보를 함께 모으고,
+#   - 네이버 뉴스 링크를 만나면 조상 태그들에 '내 안의 첫 네이버 링크'로 적어 둡니다. (이미 적힌 곳에서 멈춤)
+# 그래서 제목마다 컨테이너를 찾은 뒤 적어 둔 값을 꺼내기만 하면 됩니다.
+# 결과(순서, 링크, 필터링)는 기존 방식과 완전히 같습니다.
+# -------------------------------------------------------------------------
+
+FALLBACK_TITLE_CLASS = "news_tit"
+NAVER_NEWS_HOST = "n.news.naver.com"
+PRESS_PAGE_PREFIX = "https://media.naver.com/press/"
+
+# 자동 탐지 결과를 믿으려면 제목 후보가 이 개수 이상이어야 함 (관련 링크 한두 개에 속지 않도록)
+AUTO_DETECT_MIN_COUNT = 3
+
+
+def accept_link(title: str, target_link: str, visited_urls: set, metrics: MetricsRegistry) -> bool:
+    """
+    [데이터 필터링] 검색 결과 한 건을 수집할지 결정합니다. (버리는 이유는 지표로 기록)
+    기존 추출 방식과 한 번 훑기 추출기가 같은 규칙을 쓰도록 한 곳에 모았습니다.
+    """
+    ## 1. http로 시작 안 하면 버림
+    if not target_link.startswith("http"):
+        metrics.inc("filter_dropped_total", reason="not_http")
+        return False
+
+    ## 2. [추가된 필터] 언론사 구독 페이지(press)는 기사가 아니므로 제외!
+    if PRESS_PAGE_PREFIX in target_link:
+        metrics.inc("filter_dropped_total", reason="press_page")
+        return False
+
+    ## 3. 이미 수집한 링크면 버림
+    if target_link in visited_urls:
+        metrics.inc("filter_dropped_total", reason="duplicate")
+        return False
+
+    ## 4. 제목이 "네이버뉴스"면 버림
+    if title == "네이버뉴스":
+        metrics.inc("filter_dropped_total", reason="naver_news_title")
+        return False
+    return True
+
+
+def _nearest_container(tag: Tag) -> Tag | None:
+    """find_parent("div") -> 없으면 find_parent("li")와 같은 규칙 (가장 가까운 div, 없으면 가장 가까운 li)"""
+    li = None
+    node = tag.parent
+    while node is not None:
+        if node.name == "div":
+            return node
+        if li is None and node.name == "li":
+            li = node
+        node = node.parent
+    return li
+
+
+class SearchResultExtractor:
+    """
+    제목 클래스 하나에 대한 추출기입니다. 클래스 이름별로 한 번만 만들어 두고 재사용합니다. (get_extractor)
+
+    사용 예)
+        extractor = get_extractor("fender-ui_228e3bd1")
+        detected, articles, used_class = extractor.extract(soup, visited_urls, keyword="삼성전자")
+    """
+
+    __slots__ = ("title_class", "fallback_class")
+
+    def __init__(self, title_class: str, fallback_class: str = FALLBACK_TITLE_CLASS):
+        self.title_class = title_class
+        self.fallback_class = fallback_class
+
+    def _scan(self, soup: BeautifulSoup) -> tuple[list[Tag], list[Tag], dict[int, str]]:
+        """<a> 태그를 한 번 훑어서 (1순위 제목들, 2순위 제목들, {조상 태그 id: 그 안의 첫 네이버 링크})를 만듭니다."""
+        primary: list[Tag] = []
+        fallback: list[Tag] = []
+        first_naver: dict[int, str] = {}
+        title_class, fallback_class = self.title_class, self.fallback_class
+
+        for anchor in soup.find_all("a"):
+            classes = anchor.get("class")
+            if classes:
+                if title_class in classes:
+                    primary.append(anchor)
+                if fallback_class in classes:
+                    fallback.append(anchor)
+
+            href = str(anchor.get("href", ""))
+            if NAVER_NEWS_HOST in href:
+                # 문서 순서대로 훑으므로, 먼저 적힌 값이 곧 그 조상 안의 '첫' 네이버 링크
+                # 이미 적힌 조상을 만나면 그 위도 모두 적혀 있으므로 멈춤 (태그마다 최대 한 번씩만 적음)
+                node = anchor.parent
+                while node is not None and id(node) not in first_naver:
+                    first_naver[id(node)] = href
+                    node = node.parent
+        return primary, fallback, first_naver
+
+    def rows(self, soup: BeautifulSoup, keyword: str | None = None) -> tuple[list[tuple[str, str, str | None]], str | None]:
+        """
+        필터링 전 ([(제목, 제목 태그 링크, 컨테이너 안 첫 네이버 링크 또는 None), ...], 사용한 클래스)를 반환합니다.
+        1순위 -> news_tit -> (keyword가 있으면) 자동 탐지 순서로 시도합니다.
+        """
+        primary, fallback, first_naver = self._scan(soup)
+
+        used_class = self.title_class
+        title_tags = primary
+        if not title_tags:
+            used_class, title_tags = self.fallback_class, fallback
+        if not title_tags:
+            used_class = None
+            found = detect_title_class(soup, keyword, AUTO_DETECT_MIN_COUNT) if keyword else None
+            if found:
+                used_class = found[0]
+                title_tags = soup.find_all("a", class_=used_class)
+
+        rows = []
+        for title_tag in title_tags:
+            extracted_title = title_tag.get("title")
+            title = str(extracted_title) if extracted_title else title_tag.get_text(strip=True)
+            container = _nearest_container(title_tag)
+            naver_link = first_naver.get(id(container)) if container is not None else None
+            rows.append((title, str(title_tag["href"]), naver_link))
+        return rows, used_class
+
+    def extract(self, soup: BeautifulSoup, visited_urls: set, keyword: str | None = None,
+                metrics: MetricsRegistry | None = None) -> tuple[int, list[Article], str | None]:
+        """(감지된 제목 태그 수, 필터를 통과한 Article 리스트, 사용한 클래스)를 반환하고 visited_urls를 갱신합니다."""
+        metrics = metrics or get_metrics()
+        rows, used_class = self.rows(soup, keyword)
+
+        articles: list[Article] = []
+        for title, href, naver_link in rows:
+            target_link = naver_link or href
+            if accept_link(title, target_link, visited_urls, metrics):
+                articles.append(Article(title=title, url=target_link, source="Naver"))
+                visited_urls.add(target_link)
+        return len(rows), articles, used_class
+
+
+@lru_cache(maxsize=16)
+def get_extractor(title_class: str) -> SearchResultExtractor:
+    """제목 클래스별 추출기를 한 번만 만들어 공유합니다. (클래스가 바뀌면 새 추출기)"""
+    return SearchResultExtractor(title_class)
@@ -0,0 +1,177 @@
+# crawlers/seen_store.py
+
+import hashlib
+import math
+import os
+import struct
+import threading
+
+from utils.url_utils import canonical_url
+
+# -------------------------------------------------------------------------
+# [증분 수집] 키워드별 '이미 본 기사' 저장소 (Bloom filter)
+# 같은 키워드를 하루에도 여러 번 돌리므로, 지난번에 본 기사 URL을 기억해 두면
+# 새로 올라온 기사만 골라서 부제목을 받을 수 있습니다.
+#
+# URL을 전부 set/JSON으로 저장하면 수백만 개에서 수백 MB가 되므로 Bloom filter를 씁니다.
+#   - URL 100만 개, 오탐률 0.1% 기준 약 1.8MB (URL 길이와 상관없이 고정)
+#   - "본 적 없음"은 항상 정확하고, "본 적 있음"은 아주 낮은 확률(error_rate)로 틀릴 수 있음
+#     -> 새 기사를 드물게 놓칠 수는 있어도, 같은 기사를 두 번 내보내는 일은 없음
+#   - 가득 차면 두 배 크기의 층(layer)을 하나 더 붙여서 오탐률을 유지 (Scalable Bloom filter)
+#
+# 파일 구조 (리틀 엔디언):
+#   b"TDSN" + u16 버전 + u16 층 수
+#   층마다: u32 capacity + u32 count + u16 해시 수(k) + f64 error_rate + u64 비트 배열 크기(바이트) + 비트 배열
+# -------------------------------------------------------------------------
+
+MAGIC = b"TDSN"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_LAYER = struct.Struct("<IIHdQ")
+
+
+class BloomFilter:
+    """비트 배열 하나짜리 Bloom filter (capacity개까지 error_rate 오탐률 유지)"""
+
+    __slots__ = ("capacity", "error_rate", "count", "num_hashes", "num_bits", "bits")
+
+    def __init__(self, capacity: int, error_rate: float, count: int = 0, bits: bytearray | None = None,
+                 num_hashes: int | None = None):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = count
+        # 최적 크기: m = -n·ln(p) / (ln 2)², k = (m/n)·ln 2
+        num_bytes = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2) / 8)
+        self.bits = bits if bits is not None else bytearray(num_bytes)
+        self.num_bits = len(self.bits) * 8
+        self.num_hashes = num_hashes or max(1, round(self.num_bits / capacity * math.log(2)))
+
+    def _positions(self, digest: bytes):
+        # 해시 두 개로 k개의 위치를 만듦 (Kirsch-Mitzenmacher double hashing)
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def contains(self, digest: bytes) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+    def add(self, digest: bytes) -> None:
+        bits = self.bits
+        for pos in self._positions(digest):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class SeenStore:
+    """
+    키워드 하나의 '본 기사' 집합입니다. URL은 canonical_url()로 정규화해서 비교합니다.
+
+    사용 예)
+        store = SeenStore("data/seen/삼성전자.bloom")
+        new = [a for a in articles if a.url not in store]
+        store.add_many(a.url for a in new)
+        store.save()
+    """
+
+    def __init__(self, path: str, capacity: int = 20_000, error_rate: float = 0.001):
+        self.path = path
+        self.initial_capacity = capacity
+        self.error_rate = error_rate
+        self.layers: list[BloomFilter] = []
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    # --- 파일 입출력 ---
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+            magic, version, num_layers = _HEADER.unpack_from(data, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"알 수 없는 형식 ({magic!r}, v{version})")
+            offset = _HEADER.size
+            layers = []
+            for _ in range(num_layers):
+                capacity, count, num_hashes, error_rate, size = _LAYER.unpack_from(data, offset)
+                offset += _LAYER.size
+                bits = bytearray(data[offset:offset + size])
+                if len(bits) != size:
+                    raise ValueError("파일이 잘렸습니다")
+                offset += size
+                layers.append(BloomFilter(capacity, error_rate, count, bits, num_hashes))
+            self.layers = layers
+        except (OSError, ValueError, struct.error) as e:
+            # 깨진 파일이면 처음부터 다시 (최악의 경우 한 번 전체를 다시 수집할 뿐)
+            print(f"⚠️ [Warning] 본 기사 기록을 읽지 못해 새로 시작합니다 ({self.path}): {e}")
+            self.layers = []
+
+    def save(self) -> None:
+        """바뀐 내용이 있을 때만 임시 파일에 쓰고 교체합니다. (중간에 꺼져도 이전 파일 유지)"""
+        with self._lock:
+            if not self.dirty:
+                return
+            folder = os.path.dirname(self.path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(_HEADER.pack(MAGIC, VERSION, len(self.layers)))
+                for layer in self.layers:
+                    f.write(_LAYER.pack(layer.capacity, layer.count, layer.num_hashes, layer.error_rate, len(layer.bits)))
+                    f.write(layer.bits)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    # --- 조회/추가 ---
+    @staticmethod
+    def _digest(url: str) -> bytes:
+        return hashlib.blake2b(canonical_url(url).encode("utf-8"), digest_size=16).digest()
+
+    def __contains__(self, url: str) -> bool:
+        digest = self._digest(url)
+        return any(layer.contains(digest) for layer in self.layers)
+
+    def add(self, url: str) -> bool:
+        """처음 보는 URL이면 추가하고 True를 반환합니다."""
+        digest = self._digest(url)
+        with self._lock:
+            if any(layer.contains(digest) for layer in self.layers):
+                return False
+            if not self.layers or self.layers[-1].is_full:
+                # 층마다 오탐률을 절반씩 줄여서 전체 오탐률이 error_rate 근처에 머물게 함
+                capacity = self.initial_capacity * (2 ** len(self.layers))
+                error_rate = self.error_rate * (0.5 ** (len(self.layers) + 1))
+                self.layers.append(BloomFilter(capacity, error_rate))
+            self.layers[-1].add(digest)
+            self.dirty = True
+            return True
+
+    def add_many(self, urls) -> int:
+        return sum(1 for url in urls if self.add(url))
+
+    def __len__(self) -> int:
+        """add()가 True였던 횟수 (오탐으로 걸러진 URL은 빠지므로 실제 URL 수보다 아주 조금 적을 수 있음)"""
+        return sum(layer.count for layer in self.layers)
+
+    def stats(self) -> dict:
+        return {
+            "path": self.path,
+            "urls": len(self),
+            "layers": len(self.layers),
+            "size_kb": round(sum(len(layer.bits) for layer in self.layers) / 1024, 1),
+        }
+
+
+def seen_path(seen_dir: str, keyword: str) -> str:
+    """키워드 -> 저장 파일 경로 (파일 이름에 못 쓰는 글자가 있어도 되도록 해시 사용)"""
+    digest = hashlib.sha1(keyword.strip().encode("utf-8")).hexdigest()[:16]
+    return os.path.join(seen_dir, f"{digest}.bloom")
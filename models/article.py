@@ -1,5 +1,6 @@
 # models/article.py
 
+import sys
 from typing import Optional
 
 class Article:
@@ -7,14 +8,21 @@ class Article:
     [WEEK05 클래스와 객체] 
     뉴스 기사 데이터를 구조화하여 관리하기 위한 클래스입니다!
     기사 제목, 링크, 언론사, 본문 요약 내용을 하나의 객체로 묶어서 다룹니다.
+
+    [메모리 최적화]
+    __slots__를 쓰면 객체마다 __dict__(딕셔너리)를 만들지 않아서 기사 한 개가 차지하는 메모리가 크게 줄어듭니다.
+    (북마크 전체나 여러 키워드 크롤링 결과처럼 수만 개를 한꺼번에 들고 있을 때 효과가 큼)
     """
 
+    __slots__ = ("_title", "_url", "_source", "_content")
+
     def __init__(self, title: str, url: str, source: str):
         # [WEEK08 캡슐화 & 정보 은닉]
         # 변수명 앞에 언더바(_)를 붙여 외부에서 함부로 수정하지 못하도록 보호합니다.
         self._title = title         
         self._url = url
-        self._source = source             
+        # 'Naver'처럼 모든 기사에 반복되는 값은 sys.intern으로 문자열 하나를 공유합니다.
+        self._source = sys.intern(source) if isinstance(source, str) else source
         self._content: Optional[str] = None # 초기값은 비어있음 (None)
 
     # -------------- [WEEK08] 캡슐화: Getter 메서드 --------------
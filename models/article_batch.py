@@ -0,0 +1,123 @@
+# models/article_batch.py
+
+import sys
+from typing import Callable, Iterable, Iterator
+
+from models.article import Article
+
+# 한 행(row) = (제목, 링크, 사이트, 부제목)
+Row = tuple[str, str, str, str | None]
+
+
+class ArticleBatch:
+    """
+    [메모리 최적화] 열(Column) 단위 기사 묶음
+    Article 객체 수만 개를 리스트로 들고 있는 대신, 제목/링크/사이트/부제목을
+    각각 하나의 리스트(병렬 배열)에 담습니다. 객체 머리(header) 비용이 없고,
+    정렬·필터·to_dict 같은 작업을 묶음 전체에 한 번에 적용할 수 있습니다.
+
+    필요할 때만 batch[i] 또는 for 문으로 Article 객체를 만들어 줍니다.
+    """
+
+    __slots__ = ("titles", "urls", "sources", "contents")
+
+    def __init__(self, titles: list[str] | None = None, urls: list[str] | None = None,
+                 sources: list[str] | None = None, contents: list[str | None] | None = None):
+        self.titles = titles if titles is not None else []
+        self.urls = urls if urls is not None else []
+        self.sources = sources if sources is not None else []
+        self.contents = contents if contents is not None else [None] * len(self.titles)
+
+        if not (len(self.titles) == len(self.urls) == len(self.sources) == len(self.contents)):
+            raise ValueError("모든 열(column)의 길이가 같아야 합니다.")
+
+    # ------------------------------------------------------------------
+    # 만들기 / 변환
+    # ------------------------------------------------------------------
+    @classmethod
+    def from_articles(cls, articles: Iterable[Article]) -> "ArticleBatch":
+        batch = cls()
+        for article in articles:
+            batch.append(article)
+        return batch
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "ArticleBatch":
+        """저장 파일의 한글 Key 딕셔너리(Article.to_dict() 형식)에서 바로 만듭니다."""
+        batch = cls()
+        for item in records:
+            batch.titles.append(item.get("기사 제목", "제목 없음"))
+            batch.urls.append(item.get("출처(링크)", ""))
+            batch.sources.append(sys.intern(item.get("사이트", "Unknown")))
+            batch.contents.append(item.get("부제목", "") or None)
+        return batch
+
+    def append(self, article: Article) -> None:
+        self.titles.append(article.title)
+        self.urls.append(article.url)
+        self.sources.append(sys.intern(article.source))
+        self.contents.append(article.content)
+
+    def to_articles(self) -> list[Article]:
+        return list(self)
+
+    def to_dicts(self) -> list[dict]:
+        """Article.to_dict()와 같은 형식의 리스트를 한 번에 만듭니다."""
+        return [
+            {"기사 제목": title, "부제목": content if content else "", "출처(링크)": url, "사이트": source}
+            for title, url, source, content in zip(self.titles, self.urls, self.sources, self.contents)
+        ]
+
+    # ------------------------------------------------------------------
+    # 접근
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def row(self, index: int) -> Row:
+        return self.titles[index], self.urls[index], self.sources[index], self.contents[index]
+
+    def rows(self) -> Iterator[Row]:
+        return zip(self.titles, self.urls, self.sources, self.contents)
+
+    def __getitem__(self, index: int) -> Article:
+        title, url, source, content = self.row(index)
+        article = Article(title=title, url=url, source=source)
+        article.content = content
+        return article
+
+    def __iter__(self) -> Iterator[Article]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __repr__(self) -> str:
+        return f"ArticleBatch({len(self)}개)"
+
+    # ------------------------------------------------------------------
+    # 묶음 연산 (원본은 그대로 두고 새 ArticleBatch를 반환)
+    # ------------------------------------------------------------------
+    def take(self, indices: Iterable[int]) -> "ArticleBatch":
+        """indices 순서대로 행을 골라 새 묶음을 만듭니다."""
+        indices = list(indices)
+        return ArticleBatch(
+            [self.titles[i] for i in indices],
+            [self.urls[i] for i in indices],
+            [self.sources[i] for i in indices],
+            [self.contents[i] for i in indices],
+        )
+
+    def filter(self, predicate: Callable[[Row], bool]) -> "ArticleBatch":
+        """predicate(행)이 참인 행만 남깁니다. 예: batch.filter(lambda r: r[3])  # 부제목 있는 기사"""
+        return self.take(i for i, row in enumerate(self.rows()) if predicate(row))
+
+    def sort(self, key: Callable[[Row], object], reverse: bool = False) -> "ArticleBatch":
+        """key(행) 값으로 정렬합니다. (행 번호만 정렬한 뒤 열을 한 번에 재배치)"""
+        rows = list(self.rows())
+        order = sorted(range(len(rows)), key=lambda i: key(rows[i]), reverse=reverse)
+        return self.take(order)
+
+    def sort_by(self, column: str, reverse: bool = False) -> "ArticleBatch":
+        """열 이름(titles / urls / sources / contents)으로 정렬합니다."""
+        values = getattr(self, column)
+        order = sorted(range(len(values)), key=lambda i: (values[i] is None, values[i] or ""), reverse=reverse)
+        return self.take(order)
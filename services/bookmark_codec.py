@@ -0,0 +1,199 @@
+# services/bookmark_codec.py
+
+import struct
+from collections.abc import Mapping, Sequence
+from typing import Iterator
+
+# -------------------------------------------------------------------------
+# [성능 개선] 북마크 바이너리 형식 (.tdbk)
+# JSON은 사람이 읽기 좋지만, 한글 Key("기사 제목" 등)를 기사마다 반복해서 쓰고
+# 읽을 때도 모든 글자를 해석해야 합니다.
+# 이 형식은 '길이 + 내용' 순서로 필드를 이어 붙인 단순한 구조라서,
+# 필요한 필드만 골라서 해석(lazy decoding)할 수 있습니다.
+#
+# [파일 구조] (모든 정수는 little-endian)
+#   헤더     : MAGIC(4바이트 'TDBK') | 버전(u16) | 폴더 수(u32)
+#   폴더     : 이름 길이(u16) | 이름(utf-8) | 기사 수(u32) | 레코드 영역 길이(u64) | 기사 레코드...
+#   기사     : 필드 길이(u32) x 4 | 필드(utf-8) x 4
+#              필드 순서 = 제목, 부제목, 링크, 사이트
+# 폴더마다 레코드 영역 길이를 적어 두었으므로, 폴더 목록/기사 수는 레코드를 읽지 않고 알 수 있고
+# 폴더 안의 레코드 위치도 그 폴더를 처음 열 때 계산합니다.
+# -------------------------------------------------------------------------
+
+MAGIC = b"TDBK"
+VERSION = 1
+
+FIELDS = ("기사 제목", "부제목", "출처(링크)", "사이트")
+_FIELD_INDEX = {name: i for i, name in enumerate(FIELDS)}
+
+_HEADER = struct.Struct("<4sHI")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+_LENGTHS = struct.Struct("<4I")
+_DEFAULTS = ("제목 없음", "", "", "Unknown")
+
+
+class BookmarkFormatError(ValueError):
+    """바이너리 파일이 깨졌거나 지원하지 않는 버전일 때 발생합니다."""
+
+
+class LazyRecord(Mapping):
+    """
+    [지연 해석] 기사 레코드 하나를 '바이트 그대로' 들고 있다가,
+    record["기사 제목"]처럼 실제로 꺼낼 때 그 필드만 utf-8로 해석합니다.
+    (폴더의 제목 목록만 볼 때 부제목은 해석하지 않음)
+    dict와 같은 방식(.get, [], in, 반복)으로 쓸 수 있습니다.
+    """
+
+    __slots__ = ("_buffer", "_start", "_end", "_decoded")
+
+    def __init__(self, buffer: memoryview, start: int, end: int):
+        self._buffer = buffer      # 파일 전체 바이트 (복사하지 않고 공유)
+        self._start = start        # 레코드가 시작되는 위치 (필드 길이 4개부터)
+        self._end = end            # 레코드가 끝나는 위치
+        self._decoded: dict[int, str] = {}
+
+    def _field(self, index: int) -> str:
+        value = self._decoded.get(index)
+        if value is None:
+            lengths = _LENGTHS.unpack_from(self._buffer, self._start)
+            offset = self._start + _LENGTHS.size + sum(lengths[:index])
+            value = str(self._buffer[offset:offset + lengths[index]], "utf-8")
+            self._decoded[index] = value
+        return value
+
+    def raw(self) -> bytes:
+        """레코드 원본 바이트 (다시 저장할 때 해석/재인코딩 없이 그대로 복사하기 위함)"""
+        return bytes(self._buffer[self._start:self._end])
+
+    def __getitem__(self, key: str) -> str:
+        return self._field(_FIELD_INDEX[key])
+
+    def get(self, key: str, default=None):
+        # Mapping.get은 KeyError를 거쳐서 느리므로 직접 구현 (Article 복원 때 가장 많이 불림)
+        index = _FIELD_INDEX.get(key)
+        return default if index is None else self._field(index)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"LazyRecord({self['기사 제목']!r})"
+
+
+class LazyFolder(Sequence):
+    """
+    폴더 하나의 레코드 목록입니다.
+    기사 수(len)는 바로 알 수 있고, 레코드 위치는 처음 꺼낼 때 한 번만 계산합니다.
+    """
+
+    __slots__ = ("_buffer", "_start", "_count", "_records")
+
+    def __init__(self, buffer: memoryview, start: int, count: int):
+        self._buffer = buffer
+        self._start = start
+        self._count = count
+        self._records: list[LazyRecord] | None = None
+
+    def _ensure_records(self) -> list[LazyRecord]:
+        if self._records is None:
+            buffer, offset, records = self._buffer, self._start, []
+            unpack = _LENGTHS.unpack_from
+            for _ in range(self._count):
+                end = offset + _LENGTHS.size + sum(unpack(buffer, offset))
+                records.append(LazyRecord(buffer, offset, end))
+                offset = end
+            self._records = records
+        return self._records
+
+    def to_dicts(self) -> list[dict]:
+        """
+        폴더의 모든 레코드를 한 번에 일반 dict로 해석합니다.
+        (Article로 전부 복원할 때는 필드마다 LazyRecord를 거치는 것보다 훨씬 빠름)
+        """
+        buffer, offset, items = self._buffer, self._start, []
+        unpack, header = _LENGTHS.unpack_from, _LENGTHS.size
+        for _ in range(self._count):
+            a, b, c, d = unpack(buffer, offset)
+            offset += header
+            title = str(buffer[offset:offset + a], "utf-8")
+            offset += a
+            subtitle = str(buffer[offset:offset + b], "utf-8")
+            offset += b
+            url = str(buffer[offset:offset + c], "utf-8")
+            offset += c
+            site = str(buffer[offset:offset + d], "utf-8")
+            offset += d
+            items.append({"기사 제목": title, "부제목": subtitle, "출처(링크)": url, "사이트": site})
+        return items
+
+    def __getitem__(self, index):
+        return self._ensure_records()[index]
+
+    def __iter__(self) -> Iterator[LazyRecord]:
+        return iter(self._ensure_records())
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def _encode_record(item: Mapping) -> bytes:
+    if isinstance(item, LazyRecord):
+        return item.raw()
+    fields = [str(item.get(name, default) or "").encode("utf-8") for name, default in zip(FIELDS, _DEFAULTS)]
+    return _LENGTHS.pack(*map(len, fields)) + b"".join(fields)
+
+
+def encode(all_data: Mapping[str, list[Mapping]]) -> bytes:
+    """{폴더명: [레코드, ...]}를 바이너리로 바꿉니다."""
+    chunks = [_HEADER.pack(MAGIC, VERSION, len(all_data))]
+    for folder, items in all_data.items():
+        name = folder.encode("utf-8")
+        chunks.append(_U16.pack(len(name)))
+        chunks.append(name)
+        records = b"".join(_encode_record(item) for item in items)
+        chunks.append(_U32.pack(len(items)))
+        chunks.append(_U64.pack(len(records)))
+        chunks.append(records)
+    return b"".join(chunks)
+
+
+def decode(data: bytes) -> dict[str, LazyFolder]:
+    """
+    바이너리를 {폴더명: LazyFolder}로 바꿉니다.
+    폴더 이름과 기사 수만 읽고, 레코드 위치와 기사 내용(문자열)은 꺼낼 때 해석합니다.
+    """
+    if not data:
+        return {}
+    buffer = memoryview(data)
+    try:
+        magic, version, folder_count = _HEADER.unpack_from(buffer, 0)
+    except struct.error as e:
+        raise BookmarkFormatError("헤더가 손상되었습니다.") from e
+    if magic != MAGIC:
+        raise BookmarkFormatError("TiDIED 북마크 파일이 아닙니다.")
+    if version != VERSION:
+        raise BookmarkFormatError(f"지원하지 않는 파일 버전입니다: {version}")
+
+    offset = _HEADER.size
+    all_data: dict[str, LazyFolder] = {}
+    try:
+        for _ in range(folder_count):
+            name_length = _U16.unpack_from(buffer, offset)[0]
+            offset += _U16.size
+            folder = str(buffer[offset:offset + name_length], "utf-8")
+            offset += name_length
+            count = _U32.unpack_from(buffer, offset)[0]
+            size = _U64.unpack_from(buffer, offset + _U32.size)[0]
+            offset += _U32.size + _U64.size
+            if offset + size > len(buffer):
+                raise BookmarkFormatError(f"'{folder}' 폴더가 잘려 있습니다.")
+            all_data[folder] = LazyFolder(buffer, offset, count)
+            offset += size
+    except struct.error as e:
+        raise BookmarkFormatError("파일이 중간에 잘려 있습니다.") from e
+    return all_data
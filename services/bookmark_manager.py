@@ -1,67 +1,224 @@
 # services/bookmark_manager.py
 
-import json
-import os
+import atexit
+import threading
+import weakref
+from typing import NamedTuple
+
 from models.article import Article
+from services.bookmark_storage import BookmarkStorage, create_storage
+from services.search_index import BookmarkSearchIndex, SearchHit
+from services.url_index import UrlIndex
+from utils.metrics import get_metrics
+from utils.url_utils import canonical_url
+
+# 프로그램이 끝날 때 URL 색인을 저장할 매니저들
+# 매니저마다 atexit에 등록하면 종료할 때까지 매니저(저장소, 색인 포함)가 메모리에서 풀리지 않으므로,
+# 약한 참조로만 들고 있다가 종료 훅 하나에서 남아 있는 것만 저장합니다.
+_live_managers: "weakref.WeakSet[BookmarkManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_live_managers):
+        manager.flush_url_index()
+
+
+class FolderPage(NamedTuple):
+    """폴더 목록의 한 페이지 (기사들, 첫 기사의 폴더 안 번호, 페이지 번호, 페이지 크기, 폴더 전체 기사 수)"""
+    articles: list[Article]
+    offset: int
+    page: int
+    page_size: int
+    total: int
+
+    @property
+    def page_count(self) -> int:
+        return max(1, -(-self.total // self.page_size))
+
 
 class BookmarkManager:
     """
     [파일 입출력]
     수집한 기사(Article 객체)들을 JSON 파일로 영구 저장하고, 다시 불러오는 역할을 합니다.
     단순 텍스트 파일(txt) 대신 구조화된 데이터(JSON) 형식을 선택했습니다.
+
+    [저장소 교체 가능]
+    실제로 파일을 읽고 쓰는 일은 BookmarkStorage 객체가 담당합니다. (services/bookmark_storage.py)
+    filepath 확장자가 .sqlite3 등이면 SQLite 저장소를, 아니면 기존 JSON 저장소를 사용하며,
+    backend="journal"처럼 종류를 고르거나 storage 인자로 원하는 저장소를 직접 넘겨줄 수도 있습니다.
+
+    [메모리 캐시]
+    메뉴를 오갈 때마다 파일 전체를 다시 읽고 Article 객체를 새로 만들던 문제를 해결하기 위해,
+    한 번 복원한 Article들을 메모리에 들고 있습니다.
+    - 저장소의 signature(파일 수정 시각/크기 등)가 바뀌면 → 다른 곳에서 고친 것이므로 버리고 다시 읽음
+    - 이 매니저가 직접 저장/삭제/이동하면 → 다시 읽지 않고 캐시를 그 자리에서 고침
+    폴더 단위로 필요한 것만 채워 넣기 때문에, 폴더 하나만 열면 그 폴더만 복원합니다.
     """
 
-    def __init__(self, filepath: str = "data/bookmarks.json"):
+    def __init__(self, filepath: str = "data/bookmarks.json", storage: BookmarkStorage | None = None,
+                 backend: str | None = None):
         self.filepath = filepath
-        # 파일이 저장될 폴더가 없으면 에러가 나므로, os 모듈로 미리 생성해줍니다.
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        self.storage = storage if storage is not None else create_storage(filepath, backend)
+
+        self._lock = threading.RLock()
+        self._folders: dict[str, list[Article]] = {}   # 복원해 둔 폴더들
+        self._counts: dict[str, int] | None = None     # 전체 폴더 목록과 기사 수 (순서 유지)
+        self._complete = False                         # 모든 폴더가 _folders에 들어있는지
+        self._signature = None
+        self._signature_known = False
+        self._index: BookmarkSearchIndex | None = None  # 전문 검색 색인 (처음 검색할 때 만듦)
+        self._url_index: UrlIndex | None = None          # 중복 저장 방지용 URL 색인
+        self._url_index_signature = None                 # URL 색인이 반영하고 있는 저장소 파일 상태
+        self.metrics = get_metrics()                     # [계측] 저장소 읽기/쓰기 시간 기록
+
+        # 프로그램이 끝날 때 바뀐 URL 색인을 디스크에 남겨 두면, 다음 실행 때 다시 만들 필요가 없음
+        _live_managers.add(self)
+
+    # ------------------------------------------------------------------
+    # 캐시 관리 (내부 함수)
+    # ------------------------------------------------------------------
+    def _validate_cache(self) -> None:
+        """저장소가 밖에서 바뀌었으면 캐시를 비웁니다."""
+        signature = self.storage.signature()
+        if signature is None or not self._signature_known or signature != self._signature:
+            self._folders = {}
+            self._counts = None
+            self._complete = False
+            self._index = None
+            self._url_index = None
+            self._signature = signature
+            self._signature_known = signature is not None
+
+    def _remember_own_write(self) -> None:
+        """직접 고친 내용은 캐시에 이미 반영했으므로, 새 signature만 기억해 둡니다."""
+        self._signature = self.storage.signature()
+        self._signature_known = self._signature is not None
+        if self._url_index is not None:
+            self._url_index_signature = self.storage.file_signature()
 
-    def _load_json_data(self) -> dict:
+    def _ensure_url_index(self) -> UrlIndex:
         """
-        [내부 함수] 파일을 안전하게 열어서 데이터를 읽어오는 공통 로직입니다.
+        URL 색인을 준비합니다.
+        디스크에 저장된 색인이 현재 저장소 파일과 같은 상태면 그대로 읽고, 아니면 새로 만듭니다.
         """
-        if not os.path.exists(self.filepath):
-            return {}
-        try:
-            # [파일 읽기] 'r' 모드 사용, 인코딩은 utf-8 필수
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, Exception):
-            # 파일이 깨져있거나 비어있을 경우 빈 딕셔너리로 초기화 (프로그램 뻗음 방지)
-            return {}
+        if self._url_index is None:
+            path = self.storage.sidecar_path(".urlindex.json")
+            signature = self.storage.file_signature()
+            index = UrlIndex.load(path, signature) if (path and signature is not None) else None
+            if index is None:
+                with self._io("load_all"):
+                    index = UrlIndex.build(self.storage.load_all())
+            self._url_index = index
+            self._url_index_signature = signature
+            self.flush_url_index()
+        return self._url_index
+
+    def flush_url_index(self) -> None:
+        """바뀐 URL 색인을 디스크(*.urlindex.json)에 저장합니다."""
+        with self._lock:
+            index = self._url_index
+            path = self.storage.sidecar_path(".urlindex.json")
+            if index is None or not index.dirty or not path or self._url_index_signature is None:
+                return
+            try:
+                with self._io("url_index_save"):
+                    index.save(path, self._url_index_signature)
+            except OSError:
+                pass   # 색인은 언제든 다시 만들 수 있으므로 저장 실패는 무시
+
+    def find_url_folders(self, url: str) -> list[str]:
+        """
+        이 기사(같은 기사의 PC/모바일 주소 포함)가 이미 저장된 폴더 목록을 반환합니다.
+        """
+        with self._lock:
+            self._validate_cache()
+            return self._ensure_url_index().folders_for(url)
+
+    def _io(self, op: str):
+        """[계측] 저장소 작업 하나가 걸린 시간을 bookmark_io_seconds{op=...}로 기록합니다."""
+        return self.metrics.timer("bookmark_io_seconds", op=op)
+
+    def invalidate_cache(self) -> None:
+        """캐시를 강제로 비웁니다. (다음 조회 때 저장소에서 다시 읽음)"""
+        with self._lock:
+            self._signature_known = False
+            self._validate_cache()
 
+    @staticmethod
+    def _to_article(item: dict) -> Article:
+        # 딕셔너리의 한글 Key 값을 이용해 Article 객체 재조립
+        article = Article(
+            title=item.get("기사 제목", "제목 없음"),
+            url=item.get("출처(링크)", ""),
+            source=item.get("사이트", "Unknown")
+        )
+        article.content = item.get("부제목", "")
+        return article
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
     def save_bookmarks(self, articles: list[Article], folder_name: str = "기본 폴더") -> None:
         """
-        [시행착오 기록 - 인코딩 문제]
-        처음엔 json.dump()를 그냥 썼더니 한글이 유니코드 문자로 깨져서 저장되었습니다.
-        구글링 결과 ensure_ascii=False 옵션을 줘야 한글이 그대로 저장된다는 것을 알게 되어 수정했습니다.
+        선택한 기사들을 folder_name 폴더의 끝에 추가로 저장합니다.
         """
         if not articles:
             return
 
         try:
-            all_data = self._load_json_data()
+            with self._lock:
+                self._validate_cache()
+
+                # [중복 방지] 이미 이 폴더에 있는 기사(같은 기사의 다른 주소 포함)와
+                # 이번에 함께 넘어온 중복 기사는 건너뜁니다. (같은 검색을 두 번 저장해도 안전)
+                url_index = self._ensure_url_index()
+                unique_articles = []
+                batch_urls = set()
+                for article in articles:
+                    key = canonical_url(article.url)
+                    if key in batch_urls or url_index.contains(article.url, folder_name):
+                        continue
+                    batch_urls.add(key)
+                    unique_articles.append(article)
+
+                skipped = len(articles) - len(unique_articles)
+                if skipped:
+                    print(f"\n⚠️ '{folder_name}' 폴더에 이미 있는 기사 {skipped}개는 건너뜁니다.")
+                if not unique_articles:
+                    return
 
-            # [딕셔너리 자료구조] 폴더명을 Key, 기사 리스트를 Value로 관리
-            if folder_name not in all_data:
-                all_data[folder_name] = []
+                # 객체(Article)는 JSON으로 바로 저장이 안 되므로, 딕셔너리로 변환(직렬화)해야 함
+                new_data = [article.to_dict() for article in unique_articles]
 
-            # 객체(Article)는 JSON으로 바로 저장이 안 되므로, 딕셔너리로 변환(직렬화)해야 함
-            new_data = [article.to_dict() for article in articles]
-            
-            # 기존 데이터에 추가 (extend)
-            all_data[folder_name].extend(new_data)
+                # 기존 데이터에 추가 (extend)
+                with self._io("append"):
+                    self.storage.append(folder_name, new_data)
+                for article in unique_articles:
+                    url_index.add(article.url, folder_name)
 
-            # [파일 쓰기] 'w' 모드로 덮어쓰기
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(all_data, f, ensure_ascii=False, indent=4)
-            
-            print(f"\n💾 [저장 완료] '{folder_name}' 폴더에 {len(articles)}개의 기사를 저장했습니다.")
+                # [캐시 갱신] 파일을 다시 읽지 않고 캐시에 바로 추가
+                # (호출한 쪽의 Article이 나중에 바뀌어도 영향이 없도록 저장된 값으로 새로 만듦)
+                saved = [self._to_article(item) for item in new_data]
+                if folder_name in self._folders or (self._complete and folder_name not in self._counts):
+                    self._folders.setdefault(folder_name, []).extend(saved)
+                if self._index is not None:
+                    for article in saved:
+                        self._index.add(folder_name, article)
+                if self._counts is not None:
+                    self._counts[folder_name] = self._counts.get(folder_name, 0) + len(new_data)
+                self._remember_own_write()
+
+            print(f"\n💾 [저장 완료] '{folder_name}' 폴더에 {len(unique_articles)}개의 기사를 저장했습니다.")
 
         except Exception as e:
             # [예외 처리] 파일 권한 문제 등으로 저장 실패 시 에러 메시지 출력
             print(f"❌ [Error] 파일 저장 중 오류 발생: {e}")
+            self.invalidate_cache()
 
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
     # [수정됨] 한글 키를 인식해서 Article 객체로 복원하는 로직
     def load_bookmarks(self):
         """
@@ -70,57 +227,152 @@ class BookmarkManager:
         이걸 그대로 쓰면 article.title 처럼 점(.)으로 접근할 수 없는 문제가 있었습니다.
         그래서 읽어온 딕셔너리를 다시 Article 객체로 변환(역직렬화)하는 과정을 추가했습니다.
         """
-        all_data = self._load_json_data()
-        if not all_data:
-            return {} # 데이터가 없으면 빈 딕셔너리 반환
-
-        restored_data = {}
-        
-        for folder, items in all_data.items():
-            restored_data[folder] = []
-            for item in items:
-                # 딕셔너리의 한글 Key 값을 이용해 Article 객체 재조립
-                article = Article(
-                    title=item.get("기사 제목", "제목 없음"),
-                    url=item.get("출처(링크)", ""),
-                    source=item.get("사이트", "Unknown")
-                )
-                article.content = item.get("부제목", "")
-                restored_data[folder].append(article)
-                
-        return restored_data
-    
+        with self._lock:
+            self._validate_cache()
+
+            if not self._complete:
+                with self._io("load_all"):
+                    all_data = self.storage.load_all()
+                restored_data = {}
+                for folder, items in all_data.items():
+                    # 이미 복원해 둔 폴더는 재사용
+                    cached = self._folders.get(folder)
+                    restored_data[folder] = cached if cached is not None else [self._to_article(item) for item in items]
+                self._folders = restored_data
+                self._counts = {folder: len(items) for folder, items in restored_data.items()}
+                self._complete = True
+
+            if not self._folders:
+                return {} # 데이터가 없으면 빈 딕셔너리 반환
 
+            # 바깥에서 리스트를 고쳐도 캐시가 망가지지 않도록 리스트는 복사해서 전달
+            return {folder: list(items) for folder, items in self._folders.items()}
+
+    def folder_counts(self) -> dict[str, int]:
+        """
+        {폴더명: 기사 수}를 반환합니다. (폴더 목록 메뉴처럼 기사 내용이 필요 없을 때 사용)
+        """
+        with self._lock:
+            self._validate_cache()
+            if self._counts is None:
+                with self._io("folder_counts"):
+                    self._counts = self.storage.folder_counts()
+            return dict(self._counts)
+
+    def load_folder(self, folder_name: str) -> list[Article] | None:
+        """
+        폴더 하나의 기사만 복원해서 반환합니다. 폴더가 없으면 None.
+        """
+        with self._lock:
+            self._validate_cache()
+            if folder_name not in self._folders:
+                if self._complete:
+                    return None
+                try:
+                    with self._io("load_folder"):
+                        items = self.storage.load_folder(folder_name)
+                except KeyError:
+                    return None
+                self._folders[folder_name] = [self._to_article(item) for item in items]
+            return list(self._folders[folder_name])
+
+    def load_folder_page(self, folder_name: str, page: int = 0, page_size: int = 20) -> FolderPage | None:
+        """
+        폴더의 page번째(0부터) 페이지만 복원해서 반환합니다. 폴더가 없으면 None.
+        범위를 벗어난 page는 첫/마지막 페이지로 맞춥니다.
+        저장소가 그 범위만 읽을 수 있으면(바이너리/SQLite) 그 범위만 읽고 캐시에 넣지 않습니다.
+        아니면(JSON/저널 등 어차피 폴더 전체를 읽는 저장소) load_folder처럼 폴더를 한 번 캐시에 넣고 거기서 자릅니다.
+        """
+        page_size = max(1, page_size)
+        with self._lock:
+            self._validate_cache()
+            cached = self._folders.get(folder_name)
+            if cached is None and not self.storage.windowed_slices:
+                cached = self.load_folder(folder_name)
+                if cached is None:
+                    return None
+
+            total = len(cached) if cached is not None else self.folder_counts().get(folder_name)
+            if total is None:
+                return None
+            page = min(max(0, page), max(0, (total - 1) // page_size))
+            offset = page * page_size
+
+            if cached is not None:
+                articles = cached[offset:offset + page_size]
+            else:
+                try:
+                    with self._io("load_folder_slice"):
+                        items = self.storage.load_folder_slice(folder_name, offset, page_size)
+                except KeyError:
+                    return None
+                articles = [self._to_article(item) for item in items]
+            return FolderPage(articles, offset, page, page_size, total)
+
+    def folder_titles(self, folder_name: str) -> list[str] | None:
+        """
+        폴더 하나의 기사 제목만 반환합니다. 폴더가 없으면 None.
+        (바이너리 저장소는 제목 필드만 해석하므로 부제목까지 복원하지 않아도 됨)
+        """
+        with self._lock:
+            self._validate_cache()
+            cached = self._folders.get(folder_name)
+            if cached is not None:
+                return [article.title for article in cached]
+            if self._complete:
+                return None
+            try:
+                with self._io("load_titles"):
+                    return self.storage.load_titles(folder_name)
+            except KeyError:
+                return None
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """
+        [전문 검색] 저장된 모든 기사의 제목/부제목에서 query를 찾아 관련도 순으로 반환합니다.
+        색인은 처음 검색할 때 한 번 만들고, 이후 저장/삭제/이동 때마다 조금씩 고칩니다.
+        """
+        with self._lock:
+            self._validate_cache()
+            if self._index is None:
+                self.load_bookmarks()   # 모든 폴더를 캐시에 올린 뒤 그 Article들로 색인
+                self._index = BookmarkSearchIndex.build(self._folders)
+            return self._index.search(query, limit)
+
+    # ------------------------------------------------------------------
+    # 삭제 / 이동
+    # ------------------------------------------------------------------
     def delete_article(self, folder_name: str, index: int) -> bool:
         """
         특정 폴더의 index 번째 기사를 삭제합니다.
-        [리스트] pop() 메서드를 활용합니다.
+        (폴더가 비어도 폴더 자체는 유지하기로 결정했습니당)
         """
         try:
-            # 1. 원본 데이터(딕셔너리) 불러오기
-            all_data = self._load_json_data()
-
-            # 2. 유효성 검사
-            if folder_name not in all_data:
-                return False
-            if index < 0 or index >= len(all_data[folder_name]):
-                return False
-
-            # 3. 삭제 (pop)
-            deleted_item = all_data[folder_name].pop(index)
-            
-            # 4. 폴더가 비었으면 폴더 자체를 삭제할 수도 있지만 
-            # (여기선 0개 파일의 폴더도 유지하기로 결정했습니당)
-            
-            # 5. 변경된 데이터 저장
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(all_data, f, ensure_ascii=False, indent=4)
-            
+            with self._lock:
+                self._validate_cache()
+                with self._io("delete"):
+                    deleted_item = self.storage.delete(folder_name, index)
+
+                # [캐시 갱신]
+                if folder_name in self._folders:
+                    self._folders[folder_name].pop(index)
+                if self._index is not None:
+                    self._index.remove_at(folder_name, index)
+                if self._url_index is not None:
+                    self._url_index.remove(deleted_item.get("출처(링크)", ""), folder_name)
+                if self._counts is not None and folder_name in self._counts:
+                    self._counts[folder_name] -= 1
+                self._remember_own_write()
+
             print(f"\n🗑️ [삭제 완료] '{deleted_item.get('기사 제목')}' 기사를 삭제했습니다.")
             return True
 
+        except (KeyError, IndexError):
+            # 유효성 검사 실패 (없는 폴더 / 없는 번호)
+            return False
         except Exception as e:
             print(f"❌ [Error] 삭제 중 오류 발생: {e}")
+            self.invalidate_cache()
             return False
 
     def move_article(self, src_folder: str, index: int, dest_folder: str) -> bool:
@@ -129,33 +381,36 @@ class BookmarkManager:
         삭제(pop) 후 추가(append)하는 로직을 조합했습니다.
         """
         try:
-            all_data = self._load_json_data()
-
-            # 1. 유효성 CHECK!!
-            if src_folder not in all_data:
-                print("❌ 원본 폴더가 없습니다.")
-                return False
-            if index < 0 or index >= len(all_data[src_folder]):
-                print("❌ 잘못된 번호입니다.")
-                return False
-
-            # 2. 데이터 꺼내기 (pop)
-            item_to_move = all_data[src_folder].pop(index)
-
-            # 3. 목적지 폴더 확인 및 생성
-            if dest_folder not in all_data:
-                all_data[dest_folder] = [] 
-
-            # 4. 목적지에 추가
-            all_data[dest_folder].append(item_to_move)
-
-            
-            with open(self.filepath, "w", encoding="utf-8") as f:
-                json.dump(all_data, f, ensure_ascii=False, indent=4)
-            
+            with self._lock:
+                self._validate_cache()
+                with self._io("move"):
+                    moved_item = self.storage.move(src_folder, index, dest_folder)
+
+                # [캐시 갱신] 원본 폴더에서 빼고 목적지 폴더 끝에 붙임
+                article = self._folders[src_folder].pop(index) if src_folder in self._folders else None
+                if dest_folder in self._folders or (self._complete and dest_folder not in self._counts):
+                    self._folders.setdefault(dest_folder, []).append(
+                        article if article is not None else self._to_article(moved_item)
+                    )
+                if self._index is not None:
+                    self._index.move(src_folder, index, dest_folder)
+                if self._url_index is not None:
+                    self._url_index.move(moved_item.get("출처(링크)", ""), src_folder, dest_folder)
+                if self._counts is not None:
+                    self._counts[src_folder] -= 1
+                    self._counts[dest_folder] = self._counts.get(dest_folder, 0) + 1
+                self._remember_own_write()
+
             print(f"\n🚚 [이동 완료] '{src_folder}' -> '{dest_folder}' 로 이동했습니다.")
             return True
 
+        except KeyError:
+            print("❌ 원본 폴더가 없습니다.")
+            return False
+        except IndexError:
+            print("❌ 잘못된 번호입니다.")
+            return False
         except Exception as e:
             print(f"❌ [Error] 이동 중 오류 발생: {e}")
-            return False
\ No newline at end of file
+            self.invalidate_cache()
+            return False
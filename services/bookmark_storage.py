@@ -0,0 +1,912 @@
+# services/bookmark_storage.py
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+
+from services import bookmark_codec
+
+# -------------------------------------------------------------------------
+# [WEEK05 상속과 추상화] 북마크 저장소(Storage) 계층
+# BookmarkManager는 '무엇을' 저장할지만 알고, '어떻게' 저장할지는 이 저장소 객체에 맡깁니다.
+# 저장소는 기사 하나를 Article.to_dict()와 같은 한글 Key 딕셔너리(레코드)로 다룹니다.
+#
+# 잘못된 요청은 예외로 알립니다.
+#   - 없는 폴더: KeyError
+#   - 없는 번호(index): IndexError
+# -------------------------------------------------------------------------
+
+class BookmarkStorage(ABC):
+    """
+    북마크 저장소가 반드시 지켜야 할 공통 규칙(설계도)입니다.
+    """
+
+    # load_folder_slice가 '그 범위만' 읽는지 여부
+    # False면 기본 구현처럼 폴더 전체를 읽은 뒤 자르므로, BookmarkManager는 폴더 전체를 캐시에 넣고 거기서 자릅니다.
+    windowed_slices = False
+
+    @abstractmethod
+    def load_all(self) -> dict[str, list[dict]]:
+        """{폴더명: [레코드, ...]} 형태로 전체 데이터를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def append(self, folder: str, items: list[dict]) -> None:
+        """folder 끝에 레코드들을 추가합니다. (폴더가 없으면 새로 만듦)"""
+        pass
+
+    @abstractmethod
+    def delete(self, folder: str, index: int) -> dict:
+        """folder의 index번째 레코드를 삭제하고, 삭제된 레코드를 반환합니다."""
+        pass
+
+    @abstractmethod
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        """src_folder의 index번째 레코드를 dest_folder 끝으로 옮기고, 옮긴 레코드를 반환합니다."""
+        pass
+
+    # ---------------- 기본 구현 (필요하면 자식 클래스에서 더 빠르게 재정의) ----------------
+    def folder_counts(self) -> dict[str, int]:
+        """{폴더명: 기사 수}를 반환합니다."""
+        return {folder: len(items) for folder, items in self.load_all().items()}
+
+    def load_folder(self, folder: str) -> list[dict]:
+        """폴더 하나의 레코드만 반환합니다. 폴더가 없으면 KeyError."""
+        return self.load_all()[folder]
+
+    def load_titles(self, folder: str) -> list[str]:
+        """폴더 하나의 기사 제목만 반환합니다. 폴더가 없으면 KeyError."""
+        return [item.get("기사 제목", "제목 없음") for item in self.load_folder(folder)]
+
+    def load_folder_slice(self, folder: str, offset: int, limit: int) -> list[dict]:
+        """폴더의 offset번째부터 최대 limit개 레코드만 반환합니다. (목록 화면의 한 페이지) 폴더가 없으면 KeyError."""
+        return self.load_folder(folder)[offset:offset + limit]
+
+    def signature(self):
+        """
+        저장소 내용이 바뀌었는지 알아보기 위한 값(예: 파일 수정 시각과 크기)입니다.
+        BookmarkManager는 이 값이 그대로면 메모리에 들고 있는 데이터를 재사용합니다.
+        None을 반환하면 '알 수 없음'으로 보고 매번 다시 읽습니다.
+        """
+        return None
+
+    def file_signature(self):
+        """
+        다른 프로세스에서도 비교할 수 있는 '파일 기준' signature입니다.
+        (디스크에 따로 저장해 두는 보조 색인이 아직 유효한지 판단할 때 사용)
+        None이면 보조 색인을 디스크에 저장하지 않습니다.
+        """
+        return None
+
+    def sidecar_path(self, suffix: str) -> str | None:
+        """보조 파일(색인 등)을 저장할 경로입니다. 예: data/bookmarks.urlindex.json"""
+        path = getattr(self, "filepath", None)
+        return None if path is None else os.path.splitext(path)[0] + suffix
+
+    @staticmethod
+    def _stat_signature(*paths: str):
+        """파일들의 (수정 시각, 크기) 묶음입니다. 없는 파일은 None."""
+        sig = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                sig.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                sig.append(None)
+        return tuple(sig)
+
+
+class JsonBookmarkStorage(BookmarkStorage):
+    """
+    [기본 저장소] 모든 폴더를 JSON 파일 하나(data/bookmarks.json)에 저장합니다.
+    사람이 직접 열어봐도 읽을 수 있지만, 저장할 때마다 파일 전체를 다시 씁니다.
+    """
+
+    def __init__(self, filepath: str = "data/bookmarks.json"):
+        self.filepath = filepath
+        # 파일이 저장될 폴더가 없으면 에러가 나므로, os 모듈로 미리 생성해줍니다.
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def load_all(self) -> dict[str, list[dict]]:
+        """
+        [내부 함수] 파일을 안전하게 열어서 데이터를 읽어오는 공통 로직입니다.
+        """
+        if not os.path.exists(self.filepath):
+            return {}
+        try:
+            # [파일 읽기] 'r' 모드 사용, 인코딩은 utf-8 필수
+            with open(self.filepath, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (json.JSONDecodeError, Exception):
+            # 파일이 깨져있거나 비어있을 경우 빈 딕셔너리로 초기화 (프로그램 뻗음 방지)
+            return {}
+
+    def signature(self):
+        return self._stat_signature(self.filepath)
+
+    def file_signature(self):
+        return self.signature()
+
+    def _write_all(self, all_data: dict) -> None:
+        """
+        [시행착오 기록 - 인코딩 문제]
+        처음엔 json.dump()를 그냥 썼더니 한글이 유니코드 문자로 깨져서 저장되었습니다.
+        구글링 결과 ensure_ascii=False 옵션을 줘야 한글이 그대로 저장된다는 것을 알게 되어 수정했습니다.
+        """
+        # [파일 쓰기] 'w' 모드로 덮어쓰기
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(all_data, f, ensure_ascii=False, indent=4)
+
+    def append(self, folder: str, items: list[dict]) -> None:
+        all_data = self.load_all()
+        # [딕셔너리 자료구조] 폴더명을 Key, 기사 리스트를 Value로 관리
+        all_data.setdefault(folder, []).extend(items)
+        self._write_all(all_data)
+
+    def delete(self, folder: str, index: int) -> dict:
+        all_data = self.load_all()
+        items = all_data[folder]
+        if index < 0 or index >= len(items):
+            raise IndexError(index)
+        # 폴더가 비어도 폴더 자체는 유지합니다.
+        deleted = items.pop(index)
+        self._write_all(all_data)
+        return deleted
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        all_data = self.load_all()
+        items = all_data[src_folder]
+        if index < 0 or index >= len(items):
+            raise IndexError(index)
+        item = items.pop(index)
+        all_data.setdefault(dest_folder, []).append(item)
+        self._write_all(all_data)
+        return item
+
+
+class JournalBookmarkStorage(JsonBookmarkStorage):
+    """
+    [성능 개선] 추가 전용(Append-only) 저널 저장소
+    사람이 읽을 수 있는 bookmarks.json(스냅샷)은 그대로 두고,
+    저장/삭제/이동 '작업 기록'만 bookmarks.journal.jsonl 끝에 한 줄씩 덧붙입니다.
+    → 기사가 아무리 많아도 쓰기 비용은 항상 한 줄(O(1))입니다.
+
+    - 불러올 때: 스냅샷을 읽은 뒤 저널을 순서대로 다시 실행(replay)
+    - 저널이 compact_threshold(바이트)를 넘으면 백그라운드 스레드가 스냅샷으로 합치고 저널을 비움(compaction)
+    - 한 줄 쓸 때마다 flush + fsync 하므로 프로그램이 죽어도 기록이 남습니다.
+    """
+
+    def __init__(self, filepath: str = "data/bookmarks.json", compact_threshold: int = 1024 * 1024):
+        super().__init__(filepath)
+        self.journal_path = os.path.splitext(filepath)[0] + ".journal.jsonl"
+        # 합치는 중인 저널 (스냅샷을 바꿔치기하기 전에 저널을 이 이름으로 옮겨 둠)
+        self.compacting_path = self.journal_path + ".compacting"
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._state: dict[str, list[dict]] | None = None
+        self._state_signature = None
+        self._journal_file = None
+        self._compactor: threading.Thread | None = None
+
+    # ---------------- 불러오기 (스냅샷 + 저널 재실행) ----------------
+    def signature(self):
+        """다른 프로세스가 파일을 바꿨는지 알아보기 위해 스냅샷과 저널(합치는 중인 것 포함)을 함께 봅니다."""
+        return self._stat_signature(self.filepath, self.journal_path, self.compacting_path)
+
+    @staticmethod
+    def _apply(state: dict, op: dict) -> None:
+        """저널 한 줄(작업 기록)을 메모리 상태에 반영합니다."""
+        kind = op.get("op")
+        if kind == "save":
+            state.setdefault(op["folder"], []).extend(op["items"])
+        elif kind == "delete":
+            state[op["folder"]].pop(op["index"])
+        elif kind == "move":
+            item = state[op["src"]].pop(op["index"])
+            state.setdefault(op["dest"], []).append(item)
+        # "compact"(합치기 표시 줄)는 상태를 바꾸지 않음
+
+    @staticmethod
+    def _read_ops(path: str) -> list[dict]:
+        """저널 파일의 작업 기록들을 읽습니다. (파일이 없으면 빈 리스트)"""
+        ops = []
+        if not os.path.exists(path):
+            return ops
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    ops.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # 기록 도중 프로그램이 죽어 잘린 마지막 줄 등은 건너뜀
+                    continue
+        return ops
+
+    def _replay(self, state: dict, ops: list[dict]) -> None:
+        for op in ops:
+            try:
+                self._apply(state, op)
+            except (KeyError, IndexError):
+                continue
+
+    def _snapshot_digest(self) -> str:
+        """스냅샷 파일 내용의 해시입니다. (파일이 없으면 빈 문자열)"""
+        try:
+            with open(self.filepath, "rb") as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except FileNotFoundError:
+            return ""
+
+    def _pending_compaction_ops(self) -> list[dict]:
+        """
+        합치다 멈춘 저널(.compacting) 중 아직 스냅샷에 들어가지 않은 작업을 반환합니다.
+        이 저널 끝에는 '합치기 전 스냅샷의 해시'가 적혀 있어서,
+        지금 스냅샷이 그 해시와 같으면 바꿔치기 전에 멈춘 것(다시 실행해야 함)이고,
+        다르면 이미 새 스냅샷으로 바뀐 뒤(다시 실행하면 같은 작업이 두 번 들어감)입니다.
+        """
+        ops = self._read_ops(self.compacting_path)
+        markers = [op for op in ops if op.get("op") == "compact"]
+        if not markers or markers[-1].get("base") != self._snapshot_digest():
+            return []
+        return ops
+
+    def _ensure_state(self) -> dict:
+        signature = self.signature()
+        if self._state is not None and signature == self._state_signature:
+            return self._state
+
+        state = super().load_all()
+        if os.path.exists(self.compacting_path):
+            self._replay(state, self._pending_compaction_ops())
+        self._replay(state, self._read_ops(self.journal_path))
+        self._state = state
+        self._state_signature = signature
+        return state
+
+    def load_all(self) -> dict[str, list[dict]]:
+        with self._lock:
+            state = self._ensure_state()
+            # 호출한 쪽이 리스트를 고쳐도 내부 상태가 망가지지 않도록 복사본을 반환
+            return {folder: list(items) for folder, items in state.items()}
+
+    def load_folder(self, folder: str) -> list[dict]:
+        with self._lock:
+            return list(self._ensure_state()[folder])
+
+    def folder_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {folder: len(items) for folder, items in self._ensure_state().items()}
+
+    # ---------------- 쓰기 (저널에 한 줄 추가) ----------------
+    def _write_op(self, op: dict) -> None:
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, "a", encoding="utf-8")
+        self._journal_file.write(json.dumps(op, ensure_ascii=False) + "\n")
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def _log(self, op: dict) -> None:
+        self._write_op(op)
+        self._state_signature = self.signature()
+
+        if self._journal_file.tell() >= self.compact_threshold:
+            self._start_background_compaction()
+
+    def append(self, folder: str, items: list[dict]) -> None:
+        with self._lock:
+            state = self._ensure_state()
+            op = {"op": "save", "folder": folder, "items": items}
+            self._log(op)
+            self._apply(state, op)
+
+    def delete(self, folder: str, index: int) -> dict:
+        with self._lock:
+            items = self._ensure_state()[folder]
+            if index < 0 or index >= len(items):
+                raise IndexError(index)
+            self._log({"op": "delete", "folder": folder, "index": index})
+            return items.pop(index)
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        with self._lock:
+            state = self._ensure_state()
+            items = state[src_folder]
+            if index < 0 or index >= len(items):
+                raise IndexError(index)
+            self._log({"op": "move", "src": src_folder, "index": index, "dest": dest_folder})
+            item = items.pop(index)
+            state.setdefault(dest_folder, []).append(item)
+            return item
+
+    # ---------------- 합치기 (Compaction) ----------------
+    def _start_background_compaction(self) -> None:
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self.compact, name="bookmark-compactor", daemon=True)
+        self._compactor.start()
+
+    def compact(self) -> None:
+        """
+        저널 내용을 스냅샷(bookmarks.json)에 합치고 저널을 비웁니다.
+        어느 단계에서 프로그램이 죽어도 다시 불러왔을 때 같은 결과가 나오도록 아래 순서를 지킵니다.
+          1. 저널 끝에 '합치기 전 스냅샷의 해시'를 적고, 저널을 .compacting으로 이름 변경
+          2. 임시 파일에 새 스냅샷을 쓴 뒤 os.replace로 바꿔치기
+          3. .compacting 삭제
+        2를 끝내기 전에 죽으면 해시가 같으므로 .compacting을 다시 실행하고,
+        2를 끝낸 뒤에 죽으면 해시가 달라서 .compacting을 건너뜁니다.
+        """
+        with self._lock:
+            state = self._ensure_state()
+            self._begin_compaction()
+            self._write_snapshot(state)
+            self._finish_compaction()
+
+    def _begin_compaction(self) -> None:
+        """(Lock 안에서 호출) 1단계: 저널에 표시 줄을 남기고 .compacting으로 옮깁니다."""
+        # 전에 합치다 멈춘 저널이 남아 있으면 그것부터 스냅샷에 넣고 지움 (같은 이름을 덮어쓰지 않도록)
+        if os.path.exists(self.compacting_path):
+            pending = self._pending_compaction_ops()
+            if pending:
+                snapshot = super().load_all()
+                self._replay(snapshot, pending)
+                self._write_snapshot(snapshot)
+            os.remove(self.compacting_path)
+
+        self._write_op({"op": "compact", "base": self._snapshot_digest()})
+        self._journal_file.close()
+        self._journal_file = None
+        os.replace(self.journal_path, self.compacting_path)
+
+    def _write_snapshot(self, state: dict) -> None:
+        """(Lock 안에서 호출) 2단계: 임시 파일에 먼저 쓰고 바꿔치기하므로 중간에 죽어도 스냅샷이 깨지지 않습니다."""
+        temp_path = self.filepath + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.filepath)
+
+    def _finish_compaction(self) -> None:
+        """(Lock 안에서 호출) 3단계: 스냅샷이 안전하게 바뀐 '뒤에' 합친 저널을 지웁니다."""
+        os.remove(self.compacting_path)
+        self._state_signature = self.signature()
+
+
+class BinaryBookmarkStorage(JsonBookmarkStorage):
+    """
+    [성능 개선] 바이너리 저장소 (data/bookmarks.tdbk)
+    JSON 대신 '길이 + 내용' 형식(services/bookmark_codec.py)으로 저장합니다.
+    - 읽을 때: 레코드 위치만 훑고, 실제 글자는 필드를 꺼낼 때 해석 (LazyRecord)
+    - 쓸 때: 이미 읽어 둔 레코드는 해석/재인코딩 없이 바이트를 그대로 복사
+    저장/삭제/이동 방식(파일 전체 다시 쓰기)은 JSON 저장소와 같습니다.
+    """
+
+    windowed_slices = True   # 보이는 범위의 레코드만 해석
+
+    def __init__(self, filepath: str = "data/bookmarks.tdbk"):
+        super().__init__(filepath)
+        self._lock = threading.RLock()
+        self._state: dict[str, list] | None = None
+        self._state_signature = None
+
+    def _ensure_state(self) -> dict:
+        signature = self.signature()
+        if self._state is not None and signature == self._state_signature:
+            return self._state
+        try:
+            with open(self.filepath, "rb") as f:
+                state = bookmark_codec.decode(f.read())
+        except FileNotFoundError:
+            state = {}
+        except bookmark_codec.BookmarkFormatError as e:
+            # JSON 저장소처럼 깨진 파일 때문에 프로그램이 멈추지 않도록 빈 데이터로 시작
+            print(f"⚠️ [Warning] 북마크 파일을 읽을 수 없습니다: {e}")
+            state = {}
+        self._state = state
+        self._state_signature = signature
+        return state
+
+    def load_all(self) -> dict[str, list[dict]]:
+        # 전체를 복원할 때는 모든 필드가 필요하므로 폴더 단위로 한 번에 해석
+        with self._lock:
+            return {folder: items.to_dicts() for folder, items in self._ensure_state().items()}
+
+    def load_folder(self, folder: str) -> list[dict]:
+        with self._lock:
+            return self._ensure_state()[folder].to_dicts()
+
+    def load_titles(self, folder: str) -> list[str]:
+        # 제목 필드만 해석하고 부제목/링크는 바이트 상태 그대로 둠
+        with self._lock:
+            return [item["기사 제목"] for item in self._ensure_state()[folder]]
+
+    def load_folder_slice(self, folder: str, offset: int, limit: int) -> list[dict]:
+        # 보이는 범위의 레코드만 해석 (나머지는 바이트 상태 그대로)
+        with self._lock:
+            items = self._ensure_state()[folder]
+            return [dict(record) for record in items[offset:offset + limit]]
+
+    def folder_counts(self) -> dict[str, int]:
+        # 폴더 머리말에 적힌 기사 수만 읽음 (레코드는 건드리지 않음)
+        with self._lock:
+            return {folder: len(items) for folder, items in self._ensure_state().items()}
+
+    def _write_all(self, all_data: dict) -> None:
+        # 임시 파일에 먼저 쓴 뒤 바꿔치기 (쓰는 도중 죽어도 기존 파일은 그대로)
+        data = bookmark_codec.encode(all_data)
+        temp_path = self.filepath + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, self.filepath)
+        # 방금 쓴 바이트로 상태를 다시 만들어 두면 다음 조회 때 파일을 읽지 않아도 됨
+        self._state = bookmark_codec.decode(data)
+        self._state_signature = self.signature()
+
+    def _editable_state(self) -> dict[str, list]:
+        # 쓰기 작업은 LazyRecord 목록을 고친 뒤 다시 인코딩 (기존 기사는 바이트 그대로 복사됨)
+        return {folder: list(items) for folder, items in self._ensure_state().items()}
+
+    def append(self, folder: str, items: list[dict]) -> None:
+        with self._lock:
+            all_data = self._editable_state()
+            all_data.setdefault(folder, []).extend(items)
+            self._write_all(all_data)
+
+    def delete(self, folder: str, index: int) -> dict:
+        with self._lock:
+            all_data = self._editable_state()
+            items = all_data[folder]
+            if index < 0 or index >= len(items):
+                raise IndexError(index)
+            deleted = dict(items.pop(index))
+            self._write_all(all_data)
+            return deleted
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        with self._lock:
+            all_data = self._editable_state()
+            items = all_data[src_folder]
+            if index < 0 or index >= len(items):
+                raise IndexError(index)
+            item = items.pop(index)
+            all_data.setdefault(dest_folder, []).append(item)
+            moved = dict(item)
+            self._write_all(all_data)
+            return moved
+
+
+class ShardedBookmarkStorage(BookmarkStorage):
+    """
+    [성능 개선] 폴더별 분할(Shard) 저장소 (data/bookmarks.d/)
+    폴더 하나를 열거나 고칠 때 다른 폴더 파일까지 읽고 다시 쓰지 않도록,
+    폴더마다 JSON 파일을 따로 두고 작은 목록 파일(manifest.json)에 폴더 이름/순서/기사 수를 적어 둡니다.
+
+        data/bookmarks.d/
+        ├─ manifest.json          ← {"folders": [{"name": ..., "file": ..., "count": ...}, ...]}
+        ├─ 3f2a9c0d1e7b4a55.json  ← 폴더 하나의 기사 목록 (파일 이름은 폴더명의 해시값)
+        └─ ...
+
+    - 폴더 목록 메뉴: manifest.json만 읽음
+    - 폴더 열기/저장/삭제: 그 폴더 파일 + manifest.json만 읽고 씀
+    - 이동: 두 폴더 파일 + manifest.json만 다시 씀
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, filepath: str = "data/bookmarks.d"):
+        self.filepath = filepath
+        os.makedirs(filepath, exist_ok=True)
+        self.manifest_path = os.path.join(filepath, self.MANIFEST)
+        self._lock = threading.RLock()
+        self._manifest: list[dict] | None = None
+        self._manifest_signature = None
+
+    # ---------------- 내부 도우미 ----------------
+    @staticmethod
+    def _shard_name(folder: str) -> str:
+        # 폴더 이름에는 / 같은 문자가 들어갈 수 있으므로 해시값을 파일 이름으로 사용
+        return hashlib.sha1(folder.encode("utf-8")).hexdigest()[:16] + ".json"
+
+    @staticmethod
+    def _write_json(path: str, data) -> None:
+        # 임시 파일에 먼저 쓴 뒤 바꿔치기 (쓰는 도중 죽어도 기존 파일은 그대로)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        os.replace(temp_path, path)
+
+    def _ensure_manifest(self) -> list[dict]:
+        signature = self.signature()
+        if self._manifest is not None and signature == self._manifest_signature:
+            return self._manifest
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f).get("folders", [])
+        except (OSError, json.JSONDecodeError, AttributeError):
+            manifest = []
+        self._manifest = manifest
+        self._manifest_signature = signature
+        return manifest
+
+    def _entry(self, folder: str) -> dict:
+        for entry in self._ensure_manifest():
+            if entry["name"] == folder:
+                return entry
+        raise KeyError(folder)
+
+    def _read_shard(self, entry: dict) -> list[dict]:
+        try:
+            with open(os.path.join(self.filepath, entry["file"]), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return []
+
+    def _write_shard(self, entry: dict, items: list[dict]) -> None:
+        self._write_json(os.path.join(self.filepath, entry["file"]), items)
+        entry["count"] = len(items)
+
+    def _write_manifest(self) -> None:
+        # 폴더 파일을 먼저 다 쓴 '뒤에' 목록을 바꿔야, 목록에 있는 폴더 파일이 항상 존재함
+        self._write_json(self.manifest_path, {"folders": self._manifest})
+        self._manifest_signature = self.signature()
+
+    def _get_or_create_entry(self, folder: str) -> dict:
+        try:
+            return self._entry(folder)
+        except KeyError:
+            entry = {"name": folder, "file": self._shard_name(folder), "count": 0}
+            self._manifest.append(entry)
+            return entry
+
+    def import_all(self, all_data: dict[str, list[dict]]) -> int:
+        """
+        '비어 있는' 저장소에 {폴더명: [레코드, ...]} 전체를 넣고, 넣은 기사 수를 반환합니다.
+        이미 폴더가 있으면 ValueError (변환을 두 번 돌려서 기사가 두 배가 되는 것을 막음)
+        폴더 파일을 모두 쓴 뒤 목록 파일을 한 번만 쓰므로, 도중에 죽으면 빈 저장소 그대로입니다.
+        """
+        with self._lock:
+            if self._ensure_manifest():
+                raise ValueError(f"이미 북마크가 들어 있는 저장소입니다: {self.filepath}")
+            entries = []
+            for folder, items in all_data.items():
+                entry = {"name": folder, "file": self._shard_name(folder), "count": 0}
+                self._write_shard(entry, items)
+                entries.append(entry)
+            self._manifest = entries
+            self._write_manifest()
+            return sum(entry["count"] for entry in entries)
+
+    # ---------------- 규칙 구현 ----------------
+    def load_all(self) -> dict[str, list[dict]]:
+        with self._lock:
+            return {entry["name"]: self._read_shard(entry) for entry in self._ensure_manifest()}
+
+    def folder_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {entry["name"]: entry["count"] for entry in self._ensure_manifest()}
+
+    def load_folder(self, folder: str) -> list[dict]:
+        with self._lock:
+            return self._read_shard(self._entry(folder))
+
+    def append(self, folder: str, items: list[dict]) -> None:
+        with self._lock:
+            self._ensure_manifest()
+            entry = self._get_or_create_entry(folder)
+            self._write_shard(entry, self._read_shard(entry) + list(items))
+            self._write_manifest()
+
+    def delete(self, folder: str, index: int) -> dict:
+        with self._lock:
+            entry = self._entry(folder)
+            items = self._read_shard(entry)
+            if index < 0 or index >= len(items):
+                raise IndexError(index)
+            deleted = items.pop(index)
+            self._write_shard(entry, items)
+            self._write_manifest()
+            return deleted
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        with self._lock:
+            src_entry = self._entry(src_folder)
+            src_items = self._read_shard(src_entry)
+            if index < 0 or index >= len(src_items):
+                raise IndexError(index)
+            item = src_items.pop(index)
+            if dest_folder == src_folder:
+                src_items.append(item)
+                self._write_shard(src_entry, src_items)
+            else:
+                dest_entry = self._get_or_create_entry(dest_folder)
+                self._write_shard(dest_entry, self._read_shard(dest_entry) + [item])
+                self._write_shard(src_entry, src_items)
+            self._write_manifest()
+            return item
+
+    def signature(self):
+        # 모든 쓰기는 마지막에 manifest.json을 다시 쓰므로, 목록 파일 상태만 보면 됨
+        return self._stat_signature(self.manifest_path)
+
+    def file_signature(self):
+        return self.signature()
+
+
+class SqliteBookmarkStorage(BookmarkStorage):
+    """
+    [성능 개선] SQLite 저장소
+    폴더/URL 컬럼에 인덱스를 걸어 두어서, 저장/삭제/이동이 파일 전체가 아니라
+    '해당 행'만 건드리는 트랜잭션 한 번으로 끝납니다.
+
+    - folders 테이블: 폴더 이름과 생성 순서 (빈 폴더도 유지하기 위해 따로 관리)
+    - bookmarks 테이블: 기사 한 건 = 한 행, seq 값으로 폴더 안의 순서를 유지
+    """
+
+    windowed_slices = True   # LIMIT/OFFSET으로 그 범위의 행만 읽음
+
+    def __init__(self, filepath: str = "data/bookmarks.sqlite3"):
+        self.filepath = filepath
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Streamlit은 여러 스레드에서 스크립트를 실행하므로 연결 하나를 Lock으로 보호해서 공유
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filepath, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS folders (
+                name     TEXT PRIMARY KEY,
+                position INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS bookmarks (
+                id       INTEGER PRIMARY KEY AUTOINCREMENT,
+                folder   TEXT NOT NULL REFERENCES folders(name),
+                seq      INTEGER NOT NULL,
+                title    TEXT NOT NULL,
+                subtitle TEXT NOT NULL,
+                url      TEXT NOT NULL,
+                site     TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_bookmarks_folder_seq ON bookmarks(folder, seq);
+            CREATE INDEX IF NOT EXISTS idx_bookmarks_url ON bookmarks(url);
+        """)
+        self._conn.commit()
+
+    # ---------------- 내부 도우미 ----------------
+    @staticmethod
+    def _to_row(item: dict) -> tuple:
+        return (
+            item.get("기사 제목", "제목 없음"),
+            item.get("부제목", ""),
+            item.get("출처(링크)", ""),
+            item.get("사이트", "Unknown"),
+        )
+
+    @staticmethod
+    def _to_item(row) -> dict:
+        title, subtitle, url, site = row
+        return {"기사 제목": title, "부제목": subtitle, "출처(링크)": url, "사이트": site}
+
+    def _ensure_folder(self, folder: str) -> None:
+        self._conn.execute(
+            "INSERT OR IGNORE INTO folders (name, position) "
+            "VALUES (?, (SELECT COALESCE(MAX(position), 0) + 1 FROM folders))",
+            (folder,)
+        )
+
+    def _folder_exists(self, folder: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM folders WHERE name = ?", (folder,)).fetchone() is not None
+
+    def _next_seq(self) -> int:
+        return self._conn.execute("SELECT COALESCE(MAX(seq), 0) + 1 FROM bookmarks").fetchone()[0]
+
+    def _row_at(self, folder: str, index: int):
+        """폴더 안 index번째 행의 (id, 레코드 컬럼들)을 찾습니다."""
+        if not self._folder_exists(folder):
+            raise KeyError(folder)
+        if index < 0:
+            raise IndexError(index)
+        row = self._conn.execute(
+            "SELECT id, title, subtitle, url, site FROM bookmarks "
+            "WHERE folder = ? ORDER BY seq LIMIT 1 OFFSET ?",
+            (folder, index)
+        ).fetchone()
+        if row is None:
+            raise IndexError(index)
+        return row
+
+    # ---------------- 규칙 구현 ----------------
+    def load_all(self) -> dict[str, list[dict]]:
+        with self._lock:
+            all_data = {
+                name: [] for (name,) in
+                self._conn.execute("SELECT name FROM folders ORDER BY position")
+            }
+            for folder, *row in self._conn.execute(
+                "SELECT folder, title, subtitle, url, site FROM bookmarks ORDER BY seq"
+            ):
+                all_data.setdefault(folder, []).append(self._to_item(row))
+        return all_data
+
+    def folder_counts(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                name: count for name, count in self._conn.execute(
+                    "SELECT f.name, COUNT(b.id) FROM folders f "
+                    "LEFT JOIN bookmarks b ON b.folder = f.name "
+                    "GROUP BY f.name ORDER BY f.position"
+                )
+            }
+
+    def load_folder(self, folder: str) -> list[dict]:
+        with self._lock:
+            if not self._folder_exists(folder):
+                raise KeyError(folder)
+            return [
+                self._to_item(row) for row in self._conn.execute(
+                    "SELECT title, subtitle, url, site FROM bookmarks WHERE folder = ? ORDER BY seq",
+                    (folder,)
+                )
+            ]
+
+    def load_folder_slice(self, folder: str, offset: int, limit: int) -> list[dict]:
+        # (folder, seq) 인덱스를 따라 필요한 행만 읽음
+        with self._lock:
+            if not self._folder_exists(folder):
+                raise KeyError(folder)
+            return [
+                self._to_item(row) for row in self._conn.execute(
+                    "SELECT title, subtitle, url, site FROM bookmarks WHERE folder = ? "
+                    "ORDER BY seq LIMIT ? OFFSET ?",
+                    (folder, limit, offset)
+                )
+            ]
+
+    def append(self, folder: str, items: list[dict]) -> None:
+        with self._lock, self._conn:   # with conn: 성공하면 commit, 예외가 나면 rollback
+            self._ensure_folder(folder)
+            seq = self._next_seq()
+            self._conn.executemany(
+                "INSERT INTO bookmarks (folder, seq, title, subtitle, url, site) VALUES (?, ?, ?, ?, ?, ?)",
+                [(folder, seq + i, *self._to_row(item)) for i, item in enumerate(items)]
+            )
+
+    def import_all(self, all_data: dict[str, list[dict]]) -> int:
+        """
+        '비어 있는' DB에 {폴더명: [레코드, ...]} 전체를 트랜잭션 한 번으로 넣고, 넣은 기사 수를 반환합니다.
+        이미 폴더가 있으면 ValueError (마이그레이션을 두 번 돌려서 기사가 두 배가 되는 것을 막음)
+        도중에 실패하면 전부 rollback되므로 반쯤 옮겨진 DB가 남지 않습니다.
+        """
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM folders LIMIT 1").fetchone():
+                raise ValueError(f"이미 북마크가 들어 있는 DB입니다: {self.filepath}")
+            seq = 1
+            for position, (folder, items) in enumerate(all_data.items(), start=1):
+                self._conn.execute("INSERT INTO folders (name, position) VALUES (?, ?)", (folder, position))
+                self._conn.executemany(
+                    "INSERT INTO bookmarks (folder, seq, title, subtitle, url, site) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(folder, seq + i, *self._to_row(item)) for i, item in enumerate(items)]
+                )
+                seq += len(items)
+        return seq - 1
+
+    def delete(self, folder: str, index: int) -> dict:
+        with self._lock, self._conn:
+            row_id, *row = self._row_at(folder, index)
+            self._conn.execute("DELETE FROM bookmarks WHERE id = ?", (row_id,))
+        return self._to_item(row)
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> dict:
+        with self._lock, self._conn:
+            row_id, *row = self._row_at(src_folder, index)
+            self._ensure_folder(dest_folder)
+            # seq를 가장 큰 값으로 바꾸면 목적지 폴더의 '맨 뒤'에 붙는 효과
+            self._conn.execute(
+                "UPDATE bookmarks SET folder = ?, seq = ? WHERE id = ?",
+                (dest_folder, self._next_seq(), row_id)
+            )
+        return self._to_item(row)
+
+    def file_signature(self):
+        # data_version은 연결마다 따로 세는 값이라, 프로세스끼리 비교할 때는 파일 상태를 봅니다.
+        return self._stat_signature(self.filepath, self.filepath + "-wal")
+
+    def signature(self):
+        # data_version은 '다른 연결'이 커밋할 때마다 바뀌는 값입니다. (자기 자신의 커밋은 제외)
+        with self._lock:
+            return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_storage(filepath: str, backend: str | None = None) -> BookmarkStorage:
+    """
+    [팩토리 함수] 알맞은 저장소를 만들어 줍니다.
+    backend를 지정하지 않으면 파일 확장자를 보고 고릅니다.
+    (.db / .sqlite / .sqlite3 -> SQLite, .tdbk -> 바이너리, .d 또는 폴더 -> 분할, 그 외 -> JSON)
+    backend: "json" | "journal" | "sqlite" | "binary" | "sharded"
+    """
+    if backend is None:
+        if filepath.endswith((".db", ".sqlite", ".sqlite3")):
+            backend = "sqlite"
+        elif filepath.endswith(".tdbk"):
+            backend = "binary"
+        elif filepath.endswith(".d") or os.path.isdir(filepath):
+            backend = "sharded"
+        else:
+            backend = "json"
+
+    if backend == "sharded":
+        return ShardedBookmarkStorage(filepath)
+    if backend == "sqlite":
+        return SqliteBookmarkStorage(filepath)
+    if backend == "binary":
+        return BinaryBookmarkStorage(filepath)
+    if backend == "journal":
+        return JournalBookmarkStorage(filepath)
+    if backend == "json":
+        return JsonBookmarkStorage(filepath)
+    raise ValueError(f"알 수 없는 저장소 종류입니다: {backend}")
+
+
+def migrate_json_to_sqlite(json_path: str = "data/bookmarks.json",
+                           db_path: str = "data/bookmarks.sqlite3") -> int:
+    """
+    [1회용 마이그레이션] 기존 JSON 북마크를 SQLite 저장소로 옮기고, 옮긴 기사 수를 반환합니다.
+    폴더 순서와 폴더 안의 기사 순서는 그대로 유지됩니다. (빈 폴더 포함)
+    트랜잭션 한 번으로 옮기며, DB에 이미 북마크가 있으면 ValueError를 냅니다. (두 번 실행해도 중복 없음)
+    """
+    source = JsonBookmarkStorage(json_path)
+    target = SqliteBookmarkStorage(db_path)
+    try:
+        moved = target.import_all(source.load_all())
+    finally:
+        target.close()
+    print(f"✅ [마이그레이션 완료] {json_path} -> {db_path} ({moved}개 기사)")
+    return moved
+
+
+def json_to_binary(json_path: str = "data/bookmarks.json",
+                   binary_path: str = "data/bookmarks.tdbk") -> int:
+    """JSON 북마크를 바이너리 형식으로 변환하고, 변환한 기사 수를 반환합니다."""
+    all_data = JsonBookmarkStorage(json_path).load_all()
+    BinaryBookmarkStorage(binary_path)._write_all(all_data)
+    count = sum(len(items) for items in all_data.values())
+    print(f"✅ [변환 완료] {json_path} -> {binary_path} ({count}개 기사)")
+    return count
+
+
+def binary_to_json(binary_path: str = "data/bookmarks.tdbk",
+                   json_path: str = "data/bookmarks.json") -> int:
+    """바이너리 북마크를 사람이 읽을 수 있는 JSON으로 되돌리고, 변환한 기사 수를 반환합니다."""
+    all_data = BinaryBookmarkStorage(binary_path).load_all()
+    plain = {folder: [dict(item) for item in items] for folder, items in all_data.items()}
+    JsonBookmarkStorage(json_path)._write_all(plain)
+    count = sum(len(items) for items in plain.values())
+    print(f"✅ [변환 완료] {binary_path} -> {json_path} ({count}개 기사)")
+    return count
+
+
+def json_to_sharded(json_path: str = "data/bookmarks.json",
+                    sharded_path: str = "data/bookmarks.d") -> int:
+    """
+    JSON 북마크를 폴더별 분할 저장소로 옮기고, 옮긴 기사 수를 반환합니다. (빈 폴더 포함)
+    대상 저장소에 이미 북마크가 있으면 ValueError를 냅니다. (두 번 실행해도 중복 없음)
+    """
+    count = ShardedBookmarkStorage(sharded_path).import_all(JsonBookmarkStorage(json_path).load_all())
+    print(f"✅ [변환 완료] {json_path} -> {sharded_path} ({count}개 기사)")
+    return count
+
+
+if __name__ == "__main__":
+    try:
+        migrate_json_to_sqlite()
+    except ValueError as e:
+        print(f"❌ [마이그레이션 취소] {e} (다시 옮기려면 DB 파일을 먼저 지우세요)")
@@ -0,0 +1,170 @@
+# services/crawl_jobs.py
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from crawlers.base_crawler import NewsCrawler
+from crawlers.http_session import get_shared_session
+from models.article import Article
+
+# -------------------------------------------------------------------------
+# [백그라운드 수집] 웹 화면(app.py)용 수집 작업 관리자
+# 지금까지는 '뉴스 수집 시작'을 누르면 모든 페이지와 부제목을 받을 때까지 화면 스크립트가 멈춰 있었고,
+# 브라우저 탭마다 크롤러를 따로 만들어서 사용자가 늘어나는 만큼 네이버로 나가는 요청도 늘어났습니다.
+#
+#   - 수집은 백그라운드 스레드에서 돌고, 화면은 주기적으로 작업 상태를 읽어서 그려 줍니다.
+#   - 같은 (검색어, 페이지 수) 요청이 동시에 들어오면 작업 하나를 같이 봅니다. (요청은 한 번만)
+#   - 취소는 '보고 있는 사람이 아무도 없을 때'만 실제로 멈춥니다. (다른 탭의 수집을 끊지 않도록)
+# -------------------------------------------------------------------------
+
+class CrawlJob:
+    """
+    수집 작업 하나의 상태입니다. 백그라운드 스레드가 갱신하고 화면은 읽기만 합니다.
+    articles는 찾는 즉시 뒤에 추가되므로, 화면은 지금까지 쌓인 만큼을 바로 그릴 수 있습니다.
+    """
+
+    RUNNING = "running"
+    DONE = "done"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    def __init__(self, keyword: str, pages: int):
+        self.id = uuid.uuid4().hex[:12]
+        self.keyword = keyword
+        self.pages = pages
+        self.status = self.RUNNING
+        self.phase = "search"          # search(기사 목록) -> content(부제목)
+        self.articles: list[Article] = []
+        self.content_done = 0
+        self.error: str | None = None
+        self.started_at = time.time()
+        self.finished_at: float | None = None
+        self.watchers = 0
+        self.cancel_event = threading.Event()
+
+    @property
+    def key(self) -> tuple[str, int]:
+        return self.keyword, self.pages
+
+    @property
+    def is_running(self) -> bool:
+        return self.status == self.RUNNING
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def progress(self) -> float:
+        """0.0 ~ 1.0 (기사 목록 단계는 0, 부제목 단계는 받은 비율)"""
+        if not self.is_running:
+            return 1.0
+        if self.phase == "search" or not self.articles:
+            return 0.0
+        return self.content_done / len(self.articles)
+
+
+class CrawlJobManager:
+    """
+    사용 예)
+        jobs = CrawlJobManager(NaverCrawler())
+        job = jobs.submit("삼성전자", pages=2)      # 같은 요청이 이미 돌고 있으면 그 작업을 돌려줌
+        while job.is_running:
+            draw(job.articles); time.sleep(0.5)
+        jobs.release(job)                           # 다 봤으면 알려줌 (보는 사람이 없으면 취소)
+    """
+
+    def __init__(self, crawler: NewsCrawler, max_jobs: int = 4, content_workers: int = 8,
+                 keep_seconds: float = 60):
+        self.crawler = crawler
+        self.content_workers = content_workers
+        # 끝난 작업을 잠시 남겨 두어, 방금 같은 검색을 한 다른 사람은 결과를 바로 받아 감
+        self.keep_seconds = keep_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="crawl-job")
+        self._jobs: dict[str, CrawlJob] = {}
+        self._by_key: dict[tuple[str, int], CrawlJob] = {}
+        self._lock = threading.Lock()
+        # 작업마다 부제목 스레드가 따로 돌므로 최대 max_jobs × content_workers개 요청이 동시에 나감
+        # 공용 커넥션 풀이 그보다 작으면 남는 연결을 버리고 다시 맺게 되므로 미리 키워 둠
+        get_shared_session(pool_size=max_jobs * content_workers)
+
+    def submit(self, keyword: str, pages: int) -> CrawlJob:
+        keyword = keyword.strip()
+        with self._lock:
+            self._forget_old()
+            job = self._by_key.get((keyword, pages))
+            # 취소됐거나(멈추는 중 포함) 실패한 작업은 다시 쓰지 않고 새로 시작
+            if job is None or job.is_cancelled or job.status == CrawlJob.FAILED:
+                job = CrawlJob(keyword, pages)
+                self._jobs[job.id] = job
+                self._by_key[job.key] = job
+                self._executor.submit(self._run, job)
+            job.watchers += 1
+            return job
+
+    def get(self, job_id: str) -> CrawlJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def release(self, job: CrawlJob) -> None:
+        """이 작업을 더 이상 보지 않음. 아무도 보지 않는데 아직 돌고 있으면 취소합니다."""
+        with self._lock:
+            job.watchers = max(0, job.watchers - 1)
+            if job.watchers == 0 and job.is_running:
+                job.cancel_event.set()
+
+    # 화면의 '중지' 버튼은 자기 몫만 내려놓는 것이므로 release와 같습니다.
+    cancel = release
+
+    def stats(self) -> dict:
+        with self._lock:
+            jobs = list(self._jobs.values())
+        return {
+            "running": sum(1 for j in jobs if j.is_running),
+            "jobs": [
+                {"keyword": j.keyword, "pages": j.pages, "status": j.status,
+                 "articles": len(j.articles), "watchers": j.watchers}
+                for j in jobs
+            ],
+        }
+
+    def _forget_old(self) -> None:
+        """(Lock 안에서 호출) keep_seconds보다 오래전에 끝난 작업을 지웁니다."""
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and now - job.finished_at > self.keep_seconds:
+                del self._jobs[job_id]
+                if self._by_key.get(job.key) is job:
+                    del self._by_key[job.key]
+
+    def _run(self, job: CrawlJob) -> None:
+        try:
+            # 1. 기사 목록 (찾는 즉시 job.articles에 추가)
+            for article in self.crawler.iter_search(job.keyword, pages=job.pages):
+                if job.is_cancelled:
+                    break
+                job.articles.append(article)
+
+            # 2. 부제목 (취소되면 아직 시작하지 않은 요청은 건너뜀)
+            job.phase = "content"
+
+            def fetch(article: Article) -> None:
+                if job.is_cancelled:
+                    return
+                content = self.crawler.get_content(article.url)
+                article.content = content if content else ""
+                with self._lock:
+                    job.content_done += 1
+
+            if not job.is_cancelled and job.articles:
+                with ThreadPoolExecutor(max_workers=self.content_workers) as pool:
+                    list(pool.map(fetch, list(job.articles)))
+
+            job.status = CrawlJob.CANCELLED if job.is_cancelled else CrawlJob.DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = CrawlJob.FAILED
+            print(f"❌ [Error] '{job.keyword}' 수집 작업 실패: {e}")
+        finally:
+            job.finished_at = time.time()
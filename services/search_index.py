@@ -0,0 +1,173 @@
+# services/search_index.py
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import NamedTuple
+
+from models.article import Article
+
+# -------------------------------------------------------------------------
+# [북마크 전문 검색] 역색인(Inverted Index)
+# 저장한 기사를 찾으려면 폴더를 하나씩 열어보는 수밖에 없었습니다.
+# 기사 제목과 부제목을 '글자 n-gram' 단위로 잘라 색인해 두면,
+# 전체를 훑지 않고도 검색어가 포함된 기사만 바로 찾을 수 있습니다.
+#
+# [왜 글자 n-gram인가?]
+# 한국어는 조사가 붙어서('삼성전자가', '삼성전자의') 띄어쓰기 단위로 자르면 검색이 잘 안 됩니다.
+# 두 글자씩 자르면('삼성','성전','전자') 형태소 분석기 없이도 부분 일치 검색이 됩니다.
+# 한 글자 검색어('반')도 찾을 수 있도록, 색인할 때는 글자 하나짜리 토큰('반','도','체')도 함께 넣습니다.
+# -------------------------------------------------------------------------
+
+NGRAM_SIZE = 2
+TITLE_WEIGHT = 2      # 제목에 나온 단어는 부제목보다 2배 중요하게 취급
+
+# BM25 순위 계산 상수
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str | None, n: int = NGRAM_SIZE) -> list[str]:
+    """
+    문장을 소문자로 바꾸고 단어(문자/숫자 묶음)별로 글자 n-gram을 만듭니다.
+    n보다 짧은 단어는 그대로 하나의 토큰이 됩니다. (예: '삼성전자 AI' -> 삼성, 성전, 전자, ai)
+    """
+    if not text:
+        return []
+    tokens = []
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if len(word) <= n:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + n] for i in range(len(word) - n + 1))
+    return tokens
+
+
+def index_tokens(text: str | None, n: int = NGRAM_SIZE) -> list[str]:
+    """
+    색인용 토큰: tokenize()의 n-gram에 '글자 하나' 토큰을 더합니다.
+    한 글자 검색어는 그대로 한 글자 토큰이 되므로, 이게 없으면 '반'으로 '반도체'를 찾지 못합니다.
+    (검색어는 tokenize()로 자르므로, 두 글자 이상 검색어의 점수는 전과 같은 n-gram으로 계산됨)
+    """
+    if not text:
+        return []
+    tokens = tokenize(text, n)
+    for word in _WORD_PATTERN.findall(text.lower()):
+        if len(word) > 1:            # 한 글자 단어는 tokenize()가 이미 그대로 넣음
+            tokens.extend(word)
+    return tokens
+
+
+class SearchHit(NamedTuple):
+    """검색 결과 한 건 (폴더명, 폴더 안에서의 번호, 기사, 점수)"""
+    folder: str
+    index: int
+    article: Article
+    score: float
+
+
+class BookmarkSearchIndex:
+    """
+    BookmarkManager가 관리하는 기사들에 대한 역색인입니다.
+    저장/삭제/이동이 일어나면 전체를 다시 만들지 않고 해당 기사만 고칩니다.
+    """
+
+    def __init__(self):
+        self._postings: dict[str, dict[int, int]] = defaultdict(dict)  # 토큰 -> {문서ID: 등장 횟수}
+        self._docs: dict[int, tuple[str, Article, int]] = {}          # 문서ID -> (폴더, 기사, 문서 길이)
+        self._folders: dict[str, list[int]] = {}                      # 폴더 -> 문서ID 목록 (폴더 안 순서 그대로)
+        self._next_id = 0
+        self._total_length = 0
+
+    @classmethod
+    def build(cls, folders: dict[str, list[Article]]) -> "BookmarkSearchIndex":
+        """{폴더명: [Article, ...]} 전체로 색인을 새로 만듭니다."""
+        index = cls()
+        for folder, articles in folders.items():
+            index._folders.setdefault(folder, [])
+            for article in articles:
+                index.add(folder, article)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    # ------------------------------------------------------------------
+    # 색인 갱신
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _term_counts(article: Article) -> Counter:
+        counts = Counter()
+        for token in index_tokens(article.title):
+            counts[token] += TITLE_WEIGHT
+        counts.update(index_tokens(article.content))
+        return counts
+
+    def add(self, folder: str, article: Article) -> None:
+        """folder 끝에 기사 하나를 색인합니다."""
+        doc_id = self._next_id
+        self._next_id += 1
+
+        counts = self._term_counts(article)
+        for token, count in counts.items():
+            self._postings[token][doc_id] = count
+        length = sum(counts.values())
+
+        self._docs[doc_id] = (folder, article, length)
+        self._folders.setdefault(folder, []).append(doc_id)
+        self._total_length += length
+
+    def remove_at(self, folder: str, index: int) -> None:
+        """folder의 index번째 기사를 색인에서 뺍니다."""
+        doc_id = self._folders[folder].pop(index)
+        _, article, length = self._docs.pop(doc_id)
+        for token in self._term_counts(article):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+        self._total_length -= length
+
+    def move(self, src_folder: str, index: int, dest_folder: str) -> None:
+        """기사를 다른 폴더 끝으로 옮깁니다. (내용이 같으므로 토큰은 다시 만들지 않음)"""
+        doc_id = self._folders[src_folder].pop(index)
+        _, article, length = self._docs[doc_id]
+        self._docs[doc_id] = (dest_folder, article, length)
+        self._folders.setdefault(dest_folder, []).append(doc_id)
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """
+        검색어와 관련 있는 기사를 점수(BM25) 높은 순으로 최대 limit개 반환합니다.
+        검색어의 토큰이 나오는 문서만 살펴보므로 전체 기사 수와 거의 무관하게 빠릅니다.
+        """
+        query_tokens = set(tokenize(query))
+        if not query_tokens or not self._docs:
+            return []
+
+        total_docs = len(self._docs)
+        avg_length = (self._total_length / total_docs) or 1.0
+        scores: dict[int, float] = defaultdict(float)
+
+        for token in query_tokens:
+            postings = self._postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (total_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                length = self._docs[doc_id][2]
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+
+        hits = []
+        for doc_id, score in ranked:
+            folder, article, _ = self._docs[doc_id]
+            hits.append(SearchHit(folder, self._folders[folder].index(doc_id), article, score))
+        return hits
@@ -0,0 +1,97 @@
+# services/url_index.py
+
+import json
+import os
+
+from utils.url_utils import canonical_url
+
+# -------------------------------------------------------------------------
+# [중복 저장 방지] URL -> 폴더 색인
+# 같은 검색 결과를 두 번 저장하면 모든 기사가 두 번씩 들어가는 문제가 있었습니다.
+# 중복인지 확인하려면 모든 폴더를 뒤져야 했기 때문에,
+# '정규 URL -> {폴더: 개수}' 색인을 만들어 O(1)로 확인합니다.
+#
+# 색인은 저장소 파일 옆에 *.urlindex.json 으로 저장해 두고,
+# 다음 실행 때 저장소 파일이 그대로면(file_signature 비교) 다시 만들지 않고 읽어서 씁니다.
+# -------------------------------------------------------------------------
+
+class UrlIndex:
+    """
+    정규 URL(canonical_url)별로 어떤 폴더에 몇 개 저장되어 있는지 기억하는 색인입니다.
+    """
+
+    def __init__(self):
+        self._locations: dict[str, dict[str, int]] = {}
+        self.dirty = False     # 디스크에 저장된 내용과 다른지
+
+    @classmethod
+    def build(cls, all_data: dict[str, list[dict]]) -> "UrlIndex":
+        """저장소의 레코드({폴더: [레코드, ...]})로 색인을 새로 만듭니다."""
+        index = cls()
+        for folder, items in all_data.items():
+            for item in items:
+                index.add(item.get("출처(링크)", ""), folder)
+        index.dirty = True
+        return index
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def folders_for(self, url: str) -> list[str]:
+        """이 URL(또는 같은 기사의 다른 주소)이 저장된 폴더 목록을 반환합니다."""
+        return list(self._locations.get(canonical_url(url), {}))
+
+    def contains(self, url: str, folder: str) -> bool:
+        return folder in self._locations.get(canonical_url(url), {})
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    def add(self, url: str, folder: str) -> None:
+        folders = self._locations.setdefault(canonical_url(url), {})
+        folders[folder] = folders.get(folder, 0) + 1
+        self.dirty = True
+
+    def remove(self, url: str, folder: str) -> None:
+        key = canonical_url(url)
+        folders = self._locations.get(key)
+        if not folders or folder not in folders:
+            return
+        folders[folder] -= 1
+        if folders[folder] <= 0:
+            del folders[folder]
+        if not folders:
+            del self._locations[key]
+        self.dirty = True
+
+    def move(self, url: str, src_folder: str, dest_folder: str) -> None:
+        self.remove(url, src_folder)
+        self.add(url, dest_folder)
+
+    # ------------------------------------------------------------------
+    # 디스크 저장 / 불러오기
+    # ------------------------------------------------------------------
+    def save(self, path: str, signature) -> None:
+        """색인을 만든 시점의 저장소 signature와 함께 저장합니다."""
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"signature": signature, "locations": self._locations}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str, signature) -> "UrlIndex | None":
+        """저장된 색인이 현재 저장소와 같은 상태(signature 일치)일 때만 불러옵니다."""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        # 튜플은 JSON을 거치면 리스트가 되므로, 같은 방식으로 변환해서 비교
+        if data.get("signature") != json.loads(json.dumps(signature)):
+            return None
+
+        index = cls()
+        index._locations = data.get("locations", {})
+        return index
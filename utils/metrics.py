@@ -0,0 +1,224 @@
+# utils/metrics.py
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# -------------------------------------------------------------------------
+# [계측(Instrumentation)] 수집 과정 단계별 시간/횟수 기록
+# 지금까지 크롤링 결과를 알 수 있는 방법은 print 한 줄과 진행 점(.)뿐이라,
+# 어느 단계(다운로드/파싱/부제목 추출/북마크 저장)가 느린지 알 수 없었습니다.
+# 모든 단계가 이 레지스트리에 숫자를 남기고, 필요한 곳에서 JSON/Prometheus 형식으로 꺼내 봅니다.
+#
+#   - 카운터(counter): 횟수 누적 (예: 필터에서 버려진 기사 수)
+#   - 요약(summary) : 관측값의 개수/합계/최솟값/최댓값 (예: 요청 지연 시간, 다운로드 바이트)
+#   - 훅(hook)      : 값이 기록될 때마다 불리는 함수 (실시간 화면 갱신, 로그 등)
+# -------------------------------------------------------------------------
+
+PREFIX = "tidied"
+
+# 지표 설명 (Prometheus의 # HELP 줄과 진단 화면에 사용)
+METRIC_HELP = {
+    "fetch_seconds": "HTTP 요청 응답 시간(초), 호스트별",
+    "fetch_bytes": "다운로드한 본문 크기(바이트), 종류별(search/article)",
+    "http_responses_total": "HTTP 응답 수, 호스트/상태 코드별 (error = 연결 실패)",
+    "parse_seconds": "HTML 파싱 시간(초), 단계별(search/article)",
+    "extraction_total": "부제목 추출 경로별 횟수 (plan_a = 클래스, plan_b = 본문 굵은 글씨, none = 실패)",
+    "filter_dropped_total": "검색 결과 필터에서 버려진 기사 수, 이유별",
+    "articles_collected_total": "필터를 통과해 수집된 기사 수",
+    "article_cache_total": "기사 캐시 조회 결과별 횟수 (hit/revalidated/miss)",
+    "bookmark_io_seconds": "북마크 저장소 읽기/쓰기 시간(초), 작업별",
+    "selector_cache_total": "제목 클래스 캐시 결과별 횟수 (hits/misses/detections/detection_failures)",
+}
+
+# hook(종류, 이름, 값, 라벨) - 종류는 "counter" 또는 "summary"
+MetricHook = Callable[[str, str, float, dict], None]
+_LabelKey = tuple[tuple[str, str], ...]
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    이름 + 라벨(예: host="n.news.naver.com")별로 카운터와 요약값을 모아 두는 저장소입니다.
+    여러 스레드(부제목 병렬 수집 등)에서 동시에 기록해도 안전합니다.
+    """
+
+    def __init__(self, prefix: str = PREFIX):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, _LabelKey], float] = {}
+        self._summaries: dict[tuple[str, _LabelKey], list[float]] = {}   # [개수, 합계, 최솟값, 최댓값]
+        self._hooks: list[MetricHook] = []
+        self.started_at = time.time()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple[str, _LabelKey]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def inc(self, name: str, amount: float = 1, **labels) -> None:
+        """카운터를 amount만큼 올립니다."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+        self._notify("counter", name, amount, labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """요약값에 관측값 하나를 더합니다."""
+        key = self._key(name, labels)
+        with self._lock:
+            stat = self._summaries.get(key)
+            if stat is None:
+                self._summaries[key] = [1, value, value, value]
+            else:
+                stat[0] += 1
+                stat[1] += value
+                stat[2] = min(stat[2], value)
+                stat[3] = max(stat[3], value)
+        self._notify("summary", name, value, labels)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """with 블록이 걸린 시간(초)을 요약값으로 기록합니다. (예외가 나도 기록)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    # ------------------------------------------------------------------
+    # 훅
+    # ------------------------------------------------------------------
+    def add_hook(self, hook: MetricHook) -> None:
+        with self._lock:
+            self._hooks.append(hook)
+
+    def remove_hook(self, hook: MetricHook) -> None:
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    def _notify(self, kind: str, name: str, value: float, labels: dict) -> None:
+        with self._lock:
+            hooks = list(self._hooks)
+        for hook in hooks:
+            try:
+                hook(kind, name, value, labels)
+            except Exception:
+                # 화면 갱신 같은 부가 기능 때문에 크롤링이 멈추면 안 되므로 무시
+                pass
+
+    # ------------------------------------------------------------------
+    # 조회 / 내보내기
+    # ------------------------------------------------------------------
+    def counter(self, name: str, **labels) -> float:
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def snapshot(self) -> dict:
+        """지금까지 기록된 모든 값을 JSON으로 바꿀 수 있는 딕셔너리로 반환합니다."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            summaries = [
+                {"name": name, "labels": dict(labels), "count": int(count), "sum": total,
+                 "min": low, "max": high, "avg": total / count}
+                for (name, labels), (count, total, low, high) in sorted(self._summaries.items())
+            ]
+        return {"started_at": self.started_at, "counters": counters, "summaries": summaries}
+
+    def to_json(self, indent: int | None = 2) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식(text/plain; version=0.0.4)으로 내보냅니다."""
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        declared: set[str] = set()
+
+        def header(name: str, kind: str) -> None:
+            full = f"{self.prefix}_{name}"
+            if full in declared:
+                return
+            declared.add(full)
+            if name in METRIC_HELP:
+                lines.append(f"# HELP {full} {METRIC_HELP[name]}")
+            lines.append(f"# TYPE {full} {kind}")
+
+        def labels_text(labels: dict) -> str:
+            if not labels:
+                return ""
+            return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items()) + "}"
+
+        for item in snapshot["counters"]:
+            header(item["name"], "counter")
+            lines.append(f"{self.prefix}_{item['name']}{labels_text(item['labels'])} {item['value']:g}")
+        for item in snapshot["summaries"]:
+            header(item["name"], "summary")
+            name, labels = f"{self.prefix}_{item['name']}", labels_text(item["labels"])
+            lines.append(f"{name}_count{labels} {item['count']}")
+            lines.append(f"{name}_sum{labels} {item['sum']:.6g}")
+        return "\n".join(lines) + "\n"
+
+    def merge(self, snapshot: dict) -> None:
+        """
+        다른 레지스트리의 snapshot()을 더합니다. (파싱 프로세스 풀처럼 다른 프로세스에서 기록한 값을 모을 때)
+        훅은 호출하지 않습니다.
+        """
+        with self._lock:
+            for item in snapshot.get("counters", []):
+                key = self._key(item["name"], item["labels"])
+                self._counters[key] = self._counters.get(key, 0) + item["value"]
+            for item in snapshot.get("summaries", []):
+                key = self._key(item["name"], item["labels"])
+                stat = self._summaries.get(key)
+                if stat is None:
+                    self._summaries[key] = [item["count"], item["sum"], item["min"], item["max"]]
+                else:
+                    stat[0] += item["count"]
+                    stat[1] += item["sum"]
+                    stat[2] = min(stat[2], item["min"])
+                    stat[3] = max(stat[3], item["max"])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._summaries.clear()
+            self.started_at = time.time()
+
+
+_shared_metrics: MetricsRegistry | None = None
+_shared_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """
+    [싱글톤] 크롤러/파서/북마크 매니저가 모두 같은 레지스트리에 기록해야
+    한 화면에서 전체 과정을 볼 수 있습니다.
+    """
+    global _shared_metrics
+    if _shared_metrics is None:
+        with _shared_lock:
+            if _shared_metrics is None:
+                _shared_metrics = MetricsRegistry()
+    return _shared_metrics
+
+
+def swap_metrics(registry: MetricsRegistry) -> MetricsRegistry | None:
+    """
+    공용 레지스트리를 registry로 바꾸고 이전 것을 반환합니다.
+    파싱 워커 프로세스처럼 '작업 하나에서 기록된 값만' 따로 모아야 할 때 사용합니다.
+    """
+    global _shared_metrics
+    with _shared_lock:
+        previous, _shared_metrics = _shared_metrics, registry
+    return previous
@@ -6,7 +6,51 @@ import requests
 from bs4 import BeautifulSoup
 from collections import Counter
 
-def find_naver_class(keyword="삼성전자"):
+def detect_title_class(page, keyword: str, min_count: int = 1) -> tuple[str, int] | None:
+    """
+    [탐지 알고리즘만 분리] 이미 받아 둔 검색 결과 페이지에서 '기사 제목 클래스'를 찾습니다.
+    page는 HTML 문자열 또는 이미 만든 BeautifulSoup 객체입니다. (크롤러가 파싱한 soup를 그대로 재사용)
+    네트워크 요청도, 출력도 하지 않으며 (클래스 이름, 발견 횟수) 또는 None을 반환합니다.
+    """
+    soup = page if isinstance(page, BeautifulSoup) else BeautifulSoup(page, "html.parser")
+    class_candidates = []
+
+    for link in soup.find_all("a"):
+        classes = link.get("class")
+        # [탐지 알고리즘] 제목일 가능성이 높은 태그의 특징을 정의
+        # 1. 반드시 class 속성을 가지고 있어야 함
+        # 2. 검색 키워드가 포함되어 있어야 함
+        # 3. 제목이라기엔 너무 짧은 텍스트는 제외
+        if not classes:
+            continue
+        text = link.get_text().strip()
+        if keyword in text and len(text) > 10:
+            class_candidates.append(classes[0])
+
+    if not class_candidates:
+        return None
+
+    # [데이터 분석] 수집된 후보 중 '가장 많이 등장한' 클래스가 정답일 확률이 높음 (Counter 활용)
+    best_class, count = Counter(class_candidates).most_common(1)[0]
+    if count < min_count:
+        return None
+    return best_class, count
+
+
+def _default_session():
+    """
+    크롤러의 공용 세션을 씁니다. 필요할 때만 가져오는 이유는
+    이 파일을 `python utils/naver_class_finder.py`로 직접 실행하면 crawlers 패키지를 찾을 수 없기 때문입니다.
+    (그때는 예전처럼 requests로 바로 요청)
+    """
+    try:
+        from crawlers.http_session import get_shared_session
+    except ImportError:
+        return requests
+    return get_shared_session()
+
+
+def find_naver_class(keyword="삼성전자", session=None):
 
     """
     [문제 해결을 위한 커스텀 도구]
@@ -15,6 +59,7 @@ def find_naver_class(keyword="삼성전자"):
     
     매번 개발자 도구(F12)를 켜서 수동으로 찾는 번거로움을 없애기 위해,
     알고리즘을 통해 '기사 제목 클래스'를 자동으로 탐지해주는 진단 도구를 개발했습니다.
+    (지금은 크롤러가 검색할 때마다 detect_title_class로 자동 복구하므로, 이 함수는 수동 점검용입니다)
     """
     
     print(f"\n🕵️‍♂️ [진단 도구] 네이버 뉴스 클래스 이름 탐색 시작 (키워드: {keyword})...")
@@ -27,31 +72,15 @@ def find_naver_class(keyword="삼성전자"):
 
     try:
         # [WEEK03 라이브러리 활용] requests로 HTML 요청
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, "html.parser")
-        
-        links = soup.find_all("a")
-        class_candidates = []
+        # 크롤러와 같은 커넥션 풀(세션)을 쓰면 연결을 새로 맺지 않아도 됩니다.
+        http = session if session is not None else _default_session()
+        response = http.get(url, headers=headers, timeout=10)
 
-        for link in links:
-            text = link.get_text().strip()
-            classes = link.get("class")
-            
-            # [탐지 알고리즘] 제목일 가능성이 높은 태그의 특징을 정의
-            # 1. 검색 키워드가 포함되어 있어야 함
-            # 2. 제목이라기엔 너무 짧은 텍스트는 제외
-            # 3. 반드시 class 속성을 가지고 있어야 함
-            if keyword in text and len(text) > 10 and classes:
-                class_candidates.append(classes[0])
-
-        if not class_candidates:
+        result = detect_title_class(response.text, keyword)
+        if result is None:
             print("❌ 클래스 후보를 찾지 못했습니다. 차단되었거나 구조가 완전히 바뀌었을 수 있습니다.")
             return None
-
-        # [데이터 분석] 수집된 후보 중 '가장 많이 등장한' 클래스가 정답일 확률이 높음 (Counter 활용)
-        most_common = Counter(class_candidates).most_common(1)
-        best_class = most_common[0][0]
-        count = most_common[0][1]
+        best_class, count = result
 
         print("-" * 50)
         print(f"✅ 분석 완료! 가장 유력한 클래스 이름: '{best_class}' (발견 횟수: {count}회)")
@@ -0,0 +1,115 @@
+# utils/selector_cache.py
+
+import json
+import os
+import threading
+import time
+
+from utils.metrics import get_metrics
+
+# -------------------------------------------------------------------------
+# [자동 복구] 선택자(클래스 이름) 캐시
+# 네이버가 기사 제목 클래스(NEWS_TITLE_CLASS)를 바꾸면 모든 검색이 '결과 없음'이 되고,
+# 누군가 naver_class_finder를 직접 돌려서 상수를 고칠 때까지 수집이 통째로 멈췄습니다.
+#
+# 이제 크롤러는 검색 페이지에서 제목을 못 찾으면 '이미 받은 그 페이지'로 클래스를 다시 탐지하고,
+# 찾은 값을 여기에 저장해서 다음 요청부터 바로 씁니다. (추가 요청 없음)
+# 값은 파일(data/selector_cache.json)에 남아서 프로그램을 다시 켜도 유지되며,
+# ttl이 지난 값은 버리고 코드의 기본값부터 다시 확인합니다.
+#
+# 파일 형식: {"news_title": {"value": "fender-ui_228e3bd1", "source": "detected", "updated_at": 1700000000.0}}
+# -------------------------------------------------------------------------
+
+class SelectorCache:
+    def __init__(self, path: str = "data/selector_cache.json", ttl: float = 7 * 24 * 3600):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        self._stats = {"hits": 0, "misses": 0, "detections": 0, "detection_failures": 0}
+        self.metrics = get_metrics()
+        self._load()
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._entries = {k: v for k, v in data.items() if isinstance(v, dict) and "value" in v}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️ [Warning] 선택자 캐시를 읽지 못해 기본값을 사용합니다 ({self.path}): {e}")
+
+    def _save(self) -> None:
+        """(Lock 안에서 호출) 임시 파일에 쓰고 교체합니다."""
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def _count(self, result: str) -> None:
+        self._stats[result] += 1
+        self.metrics.inc("selector_cache_total", result=result)
+
+    def get(self, name: str) -> str | None:
+        """유효한(ttl 안의) 값이 있으면 반환합니다. 없거나 오래됐으면 None."""
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry and time.time() - entry.get("updated_at", 0) <= self.ttl:
+                self._count("hits")
+                return entry["value"]
+            self._count("misses")
+            return None
+
+    def put(self, name: str, value: str, source: str = "verified") -> None:
+        """
+        값을 저장합니다. source는 값의 출처입니다.
+        (verified: 기본값이 실제로 맞는 것을 확인 / detected: 페이지에서 새로 탐지)
+        """
+        with self._lock:
+            self._entries[name] = {"value": value, "source": source, "updated_at": time.time()}
+            try:
+                self._save()
+            except OSError as e:
+                # 파일에 못 써도 이번 실행 동안은 메모리 값으로 계속 동작
+                print(f"⚠️ [Warning] 선택자 캐시를 저장하지 못했습니다: {e}")
+
+    def record_detection(self, name: str, value: str | None) -> None:
+        """자동 탐지 결과를 기록합니다. 찾았으면 저장, 못 찾았으면 실패 횟수만 올림."""
+        if value is None:
+            with self._lock:
+                self._count("detection_failures")
+            return
+        with self._lock:
+            self._count("detections")
+        self.put(name, value, source="detected")
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "entries": {
+                    name: {**entry, "age_seconds": round(time.time() - entry.get("updated_at", 0))}
+                    for name, entry in self._entries.items()
+                },
+            }
+
+
+_shared_cache: SelectorCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_shared_selector_cache() -> SelectorCache:
+    """[싱글톤] 한 크롤러가 찾아낸 클래스를 다른 크롤러(웹/배치/비동기)도 바로 쓰도록 공유합니다."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = SelectorCache()
+    return _shared_cache
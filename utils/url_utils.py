@@ -0,0 +1,77 @@
+# utils/url_utils.py
+
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# -------------------------------------------------------------------------
+# [URL 정규화]
+# 같은 기사라도 쿼리 순서나 대소문자, #조각(fragment) 차이로 URL 문자열이 달라질 수 있습니다.
+# 캐시의 Key처럼 'URL이 같은지' 비교해야 하는 곳에서는 이 함수를 거친 값을 사용합니다.
+# -------------------------------------------------------------------------
+
+_DEFAULT_PORTS = {"http": "80", "https": "443"}
+
+
+def normalize_url(url: str) -> str:
+    """
+    - scheme/host는 소문자로, 기본 포트(:80, :443)는 제거
+    - #fragment 제거, 쿼리 파라미터는 이름순 정렬
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and str(parts.port) != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    path = parts.path or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+# -------------------------------------------------------------------------
+# [중복 저장 방지용] 정규(canonical) URL
+# 같은 기사라도 PC/모바일 주소, 추적용 파라미터(utm_*, fbclid 등) 때문에 주소가 여러 가지입니다.
+#   https://n.news.naver.com/mnews/article/417/0001119748?sid=105
+#   https://m.news.naver.com/article/417/0001119748
+#   https://news.naver.com/main/read.naver?oid=417&aid=0001119748
+# 위 주소들은 모두 https://n.news.naver.com/article/417/0001119748 한 가지로 맞춥니다.
+# -------------------------------------------------------------------------
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid", "ref", "referrer", "from"}
+_NAVER_SECTION_PARAMS = {"sid", "sid1", "sid2", "mode", "type", "ntype", "rc"}
+_MOBILE_PREFIXES = ("www.", "m.", "mobile.")
+_NAVER_ARTICLE_PATH = re.compile(r"^/(?:mnews/)?article/(\d+)/(\d+)")
+_NAVER_NEWS_HOSTS = {"n.news.naver.com", "m.news.naver.com", "news.naver.com"}
+
+
+def canonical_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 여러 주소를 하나의 대표 주소로 바꿉니다.
+    - 네이버 뉴스: https://n.news.naver.com/article/{언론사ID}/{기사ID}
+    - 그 외: www./m./mobile. 접두어와 추적용 파라미터를 제거하고 https로 통일
+    """
+    parts = urlsplit(normalize_url(url))
+    host = parts.hostname or ""
+    params = parse_qsl(parts.query, keep_blank_values=True)
+
+    if host in _NAVER_NEWS_HOSTS:
+        match = _NAVER_ARTICLE_PATH.match(parts.path)
+        query = dict(params)
+        if match:
+            return f"https://n.news.naver.com/article/{match.group(1)}/{match.group(2)}"
+        if "oid" in query and "aid" in query:
+            return f"https://n.news.naver.com/article/{query['oid']}/{query['aid']}"
+        params = [(k, v) for k, v in params if k not in _NAVER_SECTION_PARAMS]
+
+    for prefix in _MOBILE_PREFIXES:
+        if host.startswith(prefix) and host.count(".") >= 2:
+            host = host[len(prefix):]
+            break
+
+    params = [
+        (k, v) for k, v in params
+        if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS
+    ]
+    netloc = host if parts.port is None else f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", netloc, path, urlencode(params), ""))